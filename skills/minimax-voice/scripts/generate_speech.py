@@ -21,14 +21,117 @@ Options:
     --pitch     -12 to 12 semitones (default: 0)
     --volume    0.1-2.0 (default: 1.0)
     --model     hd (default) or turbo
+    --no-cache  Always call the API instead of reusing cached audio
+
+Audio is cached in ~/.cache/openclaw/tts, keyed by a hash of the model and
+every input parameter, so repeated narration is free. podcast-gen keeps its
+segments in the same directory under its own keys; the two never share entries.
 """
 
 import argparse
+import hashlib
+import json
 import os
+import shutil
 import sys
+import tempfile
+import threading
 import time
 from pathlib import Path
 
+# Same directory as podcast-gen/scripts/generate_podcast.py, so one size cap covers both.
+# TTSCache is a copy of the class there and must stay identical to it
+# (podcast-gen/scripts/test_generate_podcast.py compares the two).
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "openclaw" / "tts"
+DEFAULT_CACHE_MAX_MB = 512
+
+
+class TTSCache:
+    """Content-addressed audio cache in the directory podcast-gen and minimax-voice share.
+
+    Entries are named by the SHA-256 of the Replicate model and prediction input,
+    so repeated requests from one script hit the same file. The two scripts send
+    different models and inputs, so they never hit each other's entries, but they
+    do evict them: both carry a copy of this class, and the copies must keep the
+    same on-disk layout (<key>.<ext> files, dot-prefixed temporaries).
+
+    Reads refresh an entry's mtime. The directory is scanned on the first write
+    and its size is then tracked as entries are written; it is only scanned
+    again, evicting least recently used entries, once it grows past max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.size = None  # bytes on disk as of the last scan, plus writes since
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(model_id, input_params):
+        blob = json.dumps({"model": model_id, "input": input_params}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def path(self, key, ext):
+        return self.directory / f"{key}.{ext}"
+
+    def get(self, key, ext):
+        """Return the cached file's path (marking it recently used), or None."""
+        path = self.path(key, ext)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key, ext, data):
+        """Store data atomically, evicting old entries if the directory outgrows max_bytes."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=self.directory)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        path = self.path(key, ext)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        os.replace(tmp_path, path)
+        with self.lock:
+            if self.size is None:
+                self.size = self._scan()[1]
+            else:
+                self.size += len(data) - replaced
+            if self.size > self.max_bytes:
+                self.evict()
+        return path
+
+    def _scan(self):
+        """List (mtime_ns, size, path) for every entry, with their total size."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue  # evicted by a concurrent writer
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+            total += st.st_size
+        return entries, total
+
+    def evict(self):
+        """Delete least recently used entries until the directory fits in max_bytes."""
+        entries, total = self._scan()
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # evicted by a concurrent writer
+            total -= size
+        self.size = total
+
 
 def get_api_token(provided_token: str | None) -> str | None:
     """Get API token from argument first, then environment."""
@@ -37,6 +140,34 @@ def get_api_token(provided_token: str | None) -> str | None:
     return os.environ.get("REPLICATE_API_TOKEN")
 
 
+def read_cache_meta(cache: TTSCache, key: str) -> dict | None:
+    """Load the sidecar stored with a cached request, or None if it has none."""
+    path = cache.get(key, "meta.json")
+    if path is None:
+        return None
+    try:
+        meta = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def report_saved(args, output_path: Path, duration="") -> None:
+    """Print the saved-file summary and the MEDIA line."""
+    full_path = output_path.resolve()
+    file_size = output_path.stat().st_size / 1024
+
+    print(f"\nAudio saved: {full_path}")
+    print(f"  Size: {file_size:.1f} KB")
+    if duration:
+        print(f"  Duration: ~{duration}s")
+    print(f"  Format: {args.audio_format}")
+    print(f"  Voice: {args.voice}")
+    # OpenClaw parses MEDIA tokens and will attach the file on supported providers.
+    # Use the original filename (preserves ./ relative paths for chat delivery).
+    print(f"MEDIA: {args.filename}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate speech using MiniMax Speech 2.6 HD (Replicate)"
@@ -116,6 +247,22 @@ def main():
         default=120,
         help="Max wait time in seconds (default: 120)"
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Audio cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_CACHE_MAX_MB,
+        help=f"Evict least recently used cache entries beyond this size (default: {DEFAULT_CACHE_MAX_MB})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the API, bypassing the cache"
+    )
 
     args = parser.parse_args()
 
@@ -171,6 +318,26 @@ def main():
     print(f"  Characters: {char_count}")
     print(f"  Est. cost: ${est_cost:.4f}")
 
+    cache = None
+    if not args.no_cache:
+        cache = TTSCache(Path(args.cache_dir).expanduser(), args.cache_max_mb * 1024 * 1024)
+        cache_key = TTSCache.key(model_id, input_params)
+        cached_audio = cache.get(cache_key, args.audio_format)
+        # The sidecar records whether the API returned subtitles and the duration,
+        # so a request that got no subtitles still hits instead of paying again.
+        meta = read_cache_meta(cache, cache_key) if cached_audio else None
+        cached_subtitles = cache.get(cache_key, "titles.json") if cached_audio and args.subtitles else None
+        subtitles_ok = not args.subtitles or cached_subtitles or (meta is not None and not meta.get("subtitles"))
+        if cached_audio and subtitles_ok:
+            print(f"  Cache hit: {cached_audio}")
+            shutil.copyfile(cached_audio, output_path)
+            if cached_subtitles:
+                subtitle_path = output_path.with_suffix(".titles.json")
+                shutil.copyfile(cached_subtitles, subtitle_path)
+                print(f"  Subtitles saved: {subtitle_path.resolve()}")
+            report_saved(args, output_path, (meta or {}).get("duration", ""))
+            return
+
     try:
         # Create prediction
         prediction = client.predictions.create(
@@ -217,24 +384,25 @@ def main():
         urllib.request.urlretrieve(audio_url, str(output_path))
 
         # Download subtitles if available
+        subtitle_path = None
         if args.subtitles and isinstance(output, dict) and output.get("subtitles"):
             subtitle_path = output_path.with_suffix(".titles.json")
             urllib.request.urlretrieve(output["subtitles"], str(subtitle_path))
             print(f"  Subtitles saved: {subtitle_path.resolve()}")
 
-        full_path = output_path.resolve()
-        file_size = output_path.stat().st_size / 1024
         duration = output.get("duration", "") if isinstance(output, dict) else ""
 
-        print(f"\nAudio saved: {full_path}")
-        print(f"  Size: {file_size:.1f} KB")
-        if duration:
-            print(f"  Duration: ~{duration}s")
-        print(f"  Format: {args.audio_format}")
-        print(f"  Voice: {args.voice}")
-        # OpenClaw parses MEDIA tokens and will attach the file on supported providers.
-        # Use the original filename (preserves ./ relative paths for chat delivery).
-        print(f"MEDIA: {args.filename}")
+        if cache is not None:
+            try:
+                if subtitle_path:
+                    cache.put(cache_key, "titles.json", subtitle_path.read_bytes())
+                cache.put(cache_key, args.audio_format, output_path.read_bytes())
+                meta = {"subtitles": subtitle_path is not None, "duration": duration}
+                cache.put(cache_key, "meta.json", json.dumps(meta).encode("utf-8"))
+            except OSError as e:
+                print(f"  Warning: could not cache audio: {e}", file=sys.stderr)
+
+        report_saved(args, output_path, duration)
 
     except Exception as e:
         error_msg = str(e)
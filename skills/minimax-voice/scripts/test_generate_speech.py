@@ -0,0 +1,85 @@
+"""
+Checks for generate_speech.py's audio cache, run with `python -m pytest skills/minimax-voice/scripts`.
+
+Replicate is replaced by a stub module whose predictions succeed at once and
+point at local files, so no network or API token is needed.
+"""
+
+import sys
+import types
+
+import pytest
+
+import generate_speech
+
+
+class FakeReplicate:
+    """Stand-in for the replicate module that counts predictions."""
+
+    def __init__(self, tmp_path, subtitles):
+        self.calls = 0
+        self.audio = tmp_path / "remote.mp3"
+        self.audio.write_bytes(b"ID3 fake audio")
+        self.subtitles = None
+        if subtitles:
+            self.subtitles = tmp_path / "remote.titles.json"
+            self.subtitles.write_text('[{"text": "hi"}]', encoding="utf-8")
+
+    def module(self):
+        fake = self
+
+        class Predictions:
+            def create(self, model, input):
+                fake.calls += 1
+                output = {"audio": fake.audio.as_uri(), "duration": 1.5}
+                if fake.subtitles is not None and input["subtitle_enable"]:
+                    output["subtitles"] = fake.subtitles.as_uri()
+                return types.SimpleNamespace(status="succeeded", output=output, error=None)
+
+        class Client:
+            def __init__(self, api_token):
+                self.predictions = Predictions()
+
+        return types.SimpleNamespace(Client=Client)
+
+
+def run(monkeypatch, tmp_path, fake, *extra):
+    monkeypatch.setitem(sys.modules, "replicate", fake.module())
+    argv = [
+        "generate_speech.py", "--text", "Hello there", "--filename", str(tmp_path / "out" / "hello.mp3"),
+        "--api-token", "test", "--cache-dir", str(tmp_path / "cache"), *extra,
+    ]
+    monkeypatch.setattr(sys, "argv", argv)
+    generate_speech.main()
+
+
+@pytest.mark.parametrize("api_has_subtitles", [True, False])
+def test_subtitle_requests_hit_the_cache(monkeypatch, tmp_path, capsys, api_has_subtitles):
+    fake = FakeReplicate(tmp_path, subtitles=api_has_subtitles)
+    run(monkeypatch, tmp_path, fake, "--subtitles")
+    capsys.readouterr()
+    run(monkeypatch, tmp_path, fake, "--subtitles")
+    out = capsys.readouterr().out
+    assert fake.calls == 1
+    assert "Cache hit" in out
+    assert "Duration: ~1.5s" in out
+    assert (tmp_path / "out" / "hello.titles.json").exists() == api_has_subtitles
+
+
+def test_cache_key_covers_every_parameter(monkeypatch, tmp_path):
+    fake = FakeReplicate(tmp_path, subtitles=False)
+    run(monkeypatch, tmp_path, fake)
+    run(monkeypatch, tmp_path, fake, "--speed", "1.2")
+    run(monkeypatch, tmp_path, fake)
+    assert fake.calls == 2
+
+
+def test_entries_without_sidecar_still_hit_without_subtitles(monkeypatch, tmp_path, capsys):
+    fake = FakeReplicate(tmp_path, subtitles=False)
+    run(monkeypatch, tmp_path, fake)
+    for sidecar in (tmp_path / "cache").glob("*.meta.json"):
+        sidecar.unlink()
+    capsys.readouterr()
+    run(monkeypatch, tmp_path, fake)
+    assert fake.calls == 1
+    assert "Cache hit" in capsys.readouterr().out
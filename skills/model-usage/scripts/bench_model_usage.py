@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Benchmarks and synthetic payloads for model_usage.py.
+
+Generates codexbar-shaped cost payloads at configurable sizes and times each
+phase of the reporter (load, filter, aggregate, render) with throughput and
+peak RSS, so regressions show up before they reach the status bar.
+
+Usage:
+    python bench_model_usage.py generate out.json [--days 3650] [--models 4] [--providers 2]
+    python bench_model_usage.py run [--days 3650] [--models 4] [--providers 2] [--max PHASE=SECONDS]
+    python bench_model_usage.py micro [--rows 1000000] [--models 4]
+    python bench_model_usage.py startup [--import-budget-ms 60]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import model_usage
+
+MODEL_FAMILIES = [
+    "claude-opus-4-1-20250805",
+    "claude-sonnet-4-5-20250929",
+    "claude-3-5-haiku-20241022",
+    "gpt-5-codex-2025-09-15",
+    "gpt-5-mini-2025-08-07",
+    "o3-deep-research-2025-06-26",
+    "gpt-4.1-2025-04-14",
+]
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PIPELINES = ("buffered", "stream")
+
+# Modules the everyday current/all + text/json path must not pull in.
+FAST_PATH_EXCLUDED = (
+    "argparse",
+    "calendar",
+    "concurrent.futures",
+    "dataclasses",
+    "hashlib",
+    "http.server",
+    "sqlite3",
+    "subprocess",
+    "threading",
+    "typing",
+)
+
+# Import budget for model_usage on the everyday path, shared with
+# test_model_usage_startup.py; roughly twice the ~27ms it takes today.
+IMPORT_BUDGET_MS = 60.0
+
+# Invocations fast_parse_args must answer exactly like argparse.
+FAST_PATH_ARGVS = [
+    [],
+    ["--mode", "all"],
+    ["--provider", "claude", "--format", "json", "--pretty"],
+    ["--provider", "all", "--mode", "current"],
+    ["--input", "-", "--days", "7"],
+    ["--model", "gpt-5", "--stream", "--refresh"],
+]
+
+STARTUP_PROBE = """
+import os, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {scripts!r})
+import model_usage
+imported = time.perf_counter()
+stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+code = model_usage.main({argv!r})
+sys.stdout = stdout
+done = time.perf_counter()
+print(model_usage.json.dumps({{
+    "code": code,
+    "importMs": (imported - start) * 1000,
+    "runMs": (done - imported) * 1000,
+    "modules": sorted(sys.modules),
+}}))
+"""
+PHASES = ("load", "filter", "aggregate", "render")
+
+
+def model_names(count: int) -> List[str]:
+    return [f"{MODEL_FAMILIES[i % len(MODEL_FAMILIES)]}-v{i}" for i in range(count)]
+
+
+def provider_names(count: int) -> List[str]:
+    names = list(model_usage.PROVIDERS)
+    return names[:count] + [f"provider-{i}" for i in range(len(names), count)]
+
+
+def synthetic_daily(days: int, models: int, seed: int = 0, end: Optional[date] = None) -> List[Dict[str, Any]]:
+    """Daily rows shaped like codexbar output, `models` breakdowns per day."""
+    rng = random.Random(seed)
+    names = model_names(models)
+    end = end or date.today()
+    start = end - timedelta(days=days - 1)
+    daily: List[Dict[str, Any]] = []
+    for offset in range(days):
+        day = (start + timedelta(days=offset)).isoformat()
+        breakdowns = [{"modelName": name, "cost": round(rng.random() * 4, 4)} for name in names]
+        tokens = [rng.randint(1_000, 5_000_000) for _ in range(4)]
+        daily.append(
+            {
+                "date": day,
+                "inputTokens": tokens[0],
+                "outputTokens": tokens[1],
+                "cacheReadTokens": tokens[2],
+                "cacheCreationTokens": tokens[3],
+                "totalTokens": sum(tokens),
+                "totalCost": sum(item["cost"] for item in breakdowns),
+                "modelsUsed": names,
+                "modelBreakdowns": breakdowns,
+            }
+        )
+    return daily
+
+
+def synthetic_payload(days: int, models: int, providers: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """A full `codexbar cost --format json` array: one entry per provider."""
+    payload: List[Dict[str, Any]] = []
+    for offset, provider in enumerate(provider_names(providers)):
+        daily = synthetic_daily(days, models, seed=seed + offset)
+        payload.append(
+            {
+                "provider": provider,
+                "source": "local",
+                "updatedAt": datetime.now().isoformat(timespec="seconds"),
+                "daily": daily,
+                "totals": {"totalCost": sum(entry["totalCost"] for entry in daily)},
+            }
+        )
+    return payload
+
+
+def write_payload(path: str, days: int, models: int, providers: int, seed: int = 0) -> int:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(synthetic_payload(days, models, providers, seed), handle)
+    return os.path.getsize(path)
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def time_phase(timings: Dict[str, float], phase: str, func: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = func()
+    timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+    return result
+
+
+def render_reports(provider: str, index: model_usage.UsageIndex) -> None:
+    summary = model_usage.summarize_current(index, None)
+    if summary is not None:
+        json.dumps(model_usage.build_json_current(provider=provider, **summary))
+        model_usage.render_text_current(provider=provider, **summary)
+    json.dumps(model_usage.build_json_all(provider=provider, totals=index.totals))
+    model_usage.render_text_all(provider=provider, totals=index.totals)
+
+
+def run_pipeline(pipeline: str, path: str, provider: str, days: Optional[int]) -> Dict[str, Any]:
+    """Run one pipeline end to end in this process and report per-phase timings."""
+    timings: Dict[str, float] = {}
+    if pipeline == "stream":
+        # Load, filter and aggregate are fused into one streaming fold.
+        def fold() -> model_usage.UsageIndex:
+            with open(path, "r", encoding="utf-8") as handle:
+                entries = model_usage.stream_daily_entries(handle, provider)
+                return model_usage.UsageIndex.build(model_usage.iter_by_days(entries, days))
+
+        index = time_phase(timings, "load", fold)
+    else:
+        def load() -> List[Dict[str, Any]]:
+            return model_usage.parse_daily_entries(model_usage.load_payload(path, provider))
+
+        entries = time_phase(timings, "load", load)
+        filtered = time_phase(timings, "filter", lambda: list(model_usage.iter_by_days(entries, days)))
+        index = time_phase(timings, "aggregate", lambda: model_usage.UsageIndex.build(filtered))
+    time_phase(timings, "render", lambda: render_reports(provider, index))
+    return {
+        "pipeline": pipeline,
+        "timings": timings,
+        "rows": index.entry_count,
+        "peakRssBytes": peak_rss_bytes(),
+    }
+
+
+def run_isolated(pipeline: str, path: str, provider: str, days: Optional[int]) -> Dict[str, Any]:
+    """Run a pipeline in a fresh interpreter so its peak RSS is its own."""
+    cmd = [sys.executable, os.path.abspath(__file__), "_pipeline", pipeline, path, "--provider", provider]
+    if days:
+        cmd += ["--window", str(days)]
+    output = subprocess.check_output(cmd, text=True)
+    return json.loads(output)
+
+
+def parse_limits(values: List[str]) -> Dict[Tuple[str, str], float]:
+    """`PHASE=SECONDS` or `PIPELINE.PHASE=SECONDS`; a bare phase applies to every pipeline."""
+    limits: Dict[Tuple[str, str], float] = {}
+    for value in values:
+        key, _, seconds = value.partition("=")
+        pipeline, _, phase = key.rpartition(".")
+        if phase not in (*PHASES, "total") or (pipeline and pipeline not in PIPELINES) or not seconds:
+            raise SystemExit(f"Invalid --max value: {value}")
+        for name in [pipeline] if pipeline else PIPELINES:
+            limits[(name, phase)] = float(seconds)
+    return limits
+
+
+def format_table(results: List[Dict[str, Any]], size: int, rows: int) -> str:
+    header = f"{'pipeline':<10}" + "".join(f"{phase:>11}" for phase in (*PHASES, "total")) + f"{'rows/s':>13}{'MB/s':>9}{'peak RSS':>11}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        timings = result["timings"]
+        total = sum(timings.values())
+        cells = "".join(f"{timings[phase]:>10.3f}s" if phase in timings else f"{'-':>11}" for phase in PHASES)
+        lines.append(
+            f"{result['pipeline']:<10}{cells}{total:>10.3f}s"
+            f"{rows / total:>13,.0f}{size / total / 1e6:>9.1f}{result['peakRssBytes'] / 1e6:>9.1f}MB"
+        )
+    return "\n".join(lines)
+
+
+def command_generate(args: argparse.Namespace) -> int:
+    size = write_payload(args.output, args.days, args.models, args.providers, args.seed)
+    print(f"Wrote {args.output} ({size / 1e6:.1f} MB, {args.providers} providers x {args.days} days x {args.models} models)")
+    return 0
+
+
+def command_run(args: argparse.Namespace) -> int:
+    limits = parse_limits(args.max or [])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.input
+        if not path:
+            path = os.path.join(tmp, "cost.json")
+            # Generate out of process: Linux children inherit the parent's peak RSS.
+            cmd = [sys.executable, os.path.abspath(__file__), "generate", path]
+            for flag in ("days", "models", "providers", "seed"):
+                cmd += [f"--{flag}", str(getattr(args, flag))]
+            subprocess.check_call(cmd, stdout=subprocess.DEVNULL)
+        size = os.path.getsize(path)
+        print(f"Payload: {path} ({size / 1e6:.1f} MB)\n")
+        results = [run_isolated(pipeline, path, args.provider, args.window) for pipeline in PIPELINES]
+
+    rows = results[0]["rows"]
+    print(format_table(results, size, rows))
+
+    failures: List[str] = []
+    for result in results:
+        timings = dict(result["timings"], total=sum(result["timings"].values()))
+        for (pipeline, phase), limit in limits.items():
+            if pipeline == result["pipeline"] and phase in timings and timings[phase] > limit:
+                failures.append(f"{pipeline}.{phase} took {timings[phase]:.3f}s (limit {limit:.3f}s)")
+    for failure in failures:
+        print(f"[ERROR] {failure}")
+    return 1 if failures else 0
+
+
+def legacy_parse_date(value: str) -> Optional[date]:
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except Exception:
+        return None
+
+
+def legacy_report(entries: List[Dict[str, Any]], days: int) -> Tuple[Any, ...]:
+    """The pre-index pipeline: strptime per row, three scans, two sorts."""
+    cutoff = date.today() - timedelta(days=days - 1)
+    filtered = []
+    for entry in entries:
+        parsed = legacy_parse_date(entry["date"])
+        if parsed and parsed >= cutoff:
+            filtered.append(entry)
+    model, _ = model_usage.pick_current_model(filtered)
+    totals = model_usage.aggregate_costs(filtered)
+    latest = model_usage.latest_day_cost(filtered, model)
+    return model, totals.get(model), latest
+
+
+def indexed_report(entries: List[Dict[str, Any]], days: int) -> Tuple[Any, ...]:
+    index = model_usage.UsageIndex.build(model_usage.iter_by_days(entries, days))
+    model, _ = index.current_model()
+    return model, index.totals.get(model), index.latest_day_cost(model)
+
+
+def best_of(repeat: int, func: Callable[[], Any]) -> Tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def command_micro(args: argparse.Namespace) -> int:
+    days = max(1, args.rows // args.models)
+    print(f"Generating {days} days x {args.models} models = {days * args.models:,} rows...")
+    entries = synthetic_daily(days, args.models)
+    window = days  # keep every row so both pipelines do the full amount of work
+
+    dates = [entry["date"] for entry in entries] * 4
+    model_usage.parse_date.cache_clear()
+    legacy_dates, _ = best_of(args.repeat, lambda: [legacy_parse_date(value) for value in dates])
+    fast_dates, _ = best_of(args.repeat, lambda: [model_usage.parse_date(value) for value in dates])
+    print(f"parse {len(dates):,} dates:   strptime {legacy_dates:.3f}s   memoized {fast_dates:.3f}s   ({legacy_dates / fast_dates:.1f}x)")
+
+    legacy_time, legacy = best_of(args.repeat, lambda: legacy_report(entries, window))
+    indexed_time, indexed = best_of(args.repeat, lambda: indexed_report(entries, window))
+    if legacy != indexed:
+        print(f"[ERROR] Results differ: legacy={legacy} indexed={indexed}")
+        return 1
+    print(f"current-mode report:   legacy {legacy_time:.3f}s   indexed {indexed_time:.3f}s   ({legacy_time / indexed_time:.1f}x)")
+    return 0
+
+
+def probe_startup(argv: List[str]) -> Dict[str, Any]:
+    """Import and run model_usage in a fresh interpreter; report timings and loaded modules."""
+    code = STARTUP_PROBE.format(scripts=SCRIPTS_DIR, argv=argv)
+    return json.loads(subprocess.check_output([sys.executable, "-c", code], text=True))
+
+
+def fast_parse_mismatches() -> List[str]:
+    """Invocations from FAST_PATH_ARGVS where fast_parse_args disagrees with argparse."""
+    failures = []
+    for argv in FAST_PATH_ARGVS:
+        fast = model_usage.fast_parse_args(argv)
+        full = model_usage.build_parser().parse_args(argv)
+        if fast is None or vars(fast) != vars(full):
+            failures.append(f"fast_parse_args({argv}) does not match argparse")
+    return failures
+
+
+def check_startup(import_budget_ms: float, repeat: int) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]:
+    """
+    Probe the everyday path in fresh interpreters, keeping the fastest import of each case.
+
+    Returns:
+        (probes, failures) where probes pairs a case label with its best probe and
+        failures lists exits, budget overruns and heavy modules on the fast path
+    """
+    failures: List[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cost.json")
+        write_payload(path, days=30, models=4, providers=2)
+        probes = []
+        for argv in (["--input", path, "--format", "json"], ["--input", path, "--mode", "all"]):
+            runs = [probe_startup(argv) for _ in range(repeat)]
+            best = min(runs, key=lambda run: run["importMs"])
+            label = " ".join(arg if not arg.endswith("cost.json") else "<payload>" for arg in argv)
+            probes.append((label, best))
+
+    for label, probe in probes:
+        if probe["code"] != 0:
+            failures.append(f"{label} exited {probe['code']}")
+        if probe["importMs"] > import_budget_ms:
+            failures.append(f"{label} import took {probe['importMs']:.1f}ms (budget {import_budget_ms:g}ms)")
+        loaded = set(probe["modules"])
+        for module in FAST_PATH_EXCLUDED:
+            if module in loaded:
+                failures.append(f"{label} imported {module}")
+    return probes, failures
+
+
+def command_startup(args: argparse.Namespace) -> int:
+    probes, failures = check_startup(args.import_budget_ms, args.repeat)
+    failures = fast_parse_mismatches() + failures
+    for label, probe in probes:
+        print(f"{label:<40} import {probe['importMs']:6.1f}ms   run {probe['runMs']:6.1f}ms")
+
+    for failure in failures:
+        print(f"[ERROR] {failure}")
+    return 1 if failures else 0
+
+
+def command_pipeline(args: argparse.Namespace) -> int:
+    print(json.dumps(run_pipeline(args.pipeline, args.path, args.provider, args.window)))
+    return 0
+
+
+def add_size_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--days", type=int, default=3650, help="Daily rows per provider (default: 3650).")
+    parser.add_argument("--models", type=int, default=4, help="Model breakdowns per day (default: 4).")
+    parser.add_argument("--providers", type=int, default=2, help="Provider entries in the payload (default: 2).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for costs and token counts.")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark model_usage.py on synthetic codexbar cost payloads.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Write a synthetic payload to a file.")
+    generate.add_argument("output", help="Path for the generated JSON payload.")
+    add_size_arguments(generate)
+    generate.set_defaults(func=command_generate)
+
+    run = commands.add_parser("run", help="Time each phase of the buffered and streaming pipelines.")
+    add_size_arguments(run)
+    run.add_argument("--input", help="Benchmark an existing payload instead of generating one.")
+    run.add_argument("--provider", default="codex", help="Provider to report on (default: codex).")
+    run.add_argument("--window", type=int, help="Apply a --days filter of this many days.")
+    run.add_argument(
+        "--max",
+        action="append",
+        metavar="[PIPELINE.]PHASE=SECONDS",
+        help="Fail if a phase (load, filter, aggregate, render, total) exceeds this time. Repeatable.",
+    )
+    run.set_defaults(func=command_run)
+
+    micro = commands.add_parser("micro", help="Compare legacy per-row helpers with the indexed pipeline.")
+    micro.add_argument("--rows", type=int, default=1_000_000, help="Total model breakdown rows (days x models).")
+    micro.add_argument("--models", type=int, default=4, help="Distinct model names per day.")
+    micro.add_argument("--repeat", type=int, default=3, help="Runs per case; the best is reported.")
+    micro.set_defaults(func=command_micro)
+
+    startup = commands.add_parser("startup", help="Check import time and lazy imports of the everyday fast path.")
+    startup.add_argument(
+        "--import-budget-ms",
+        type=float,
+        default=IMPORT_BUDGET_MS,
+        help=f"Fail if importing model_usage takes longer (default: {IMPORT_BUDGET_MS:g}).",
+    )
+    startup.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per case; the best is reported.")
+    startup.set_defaults(func=command_startup)
+
+    pipeline = commands.add_parser("_pipeline")
+    pipeline.add_argument("pipeline", choices=PIPELINES)
+    pipeline.add_argument("path")
+    pipeline.add_argument("--provider", default="codex")
+    pipeline.add_argument("--window", type=int)
+    pipeline.set_defaults(func=command_pipeline)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
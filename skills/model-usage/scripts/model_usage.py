@@ -7,14 +7,48 @@ Defaults to current model (most recent daily entry), or list all models.
 
 from __future__ import annotations
 
-import argparse
+import bisect
 import json
 import os
-import subprocess
+import re
 import sys
-from dataclasses import dataclass
+from array import array
+from collections import namedtuple
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from types import SimpleNamespace
+
+# Startup matters: the menu bar runs this script constantly. Modules only some
+# modes need (argparse, sqlite3, subprocess, http.server, ...) are imported
+# where they are used, and typing is only loaded for type checkers since
+# annotations are never evaluated at runtime. `from typing import TYPE_CHECKING`
+# would add ~4.5ms (median of 15 fresh interpreters, on top of the imports
+# above) to a ~27ms import, so the constant is spelled out; type checkers
+# treat it the same way.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    import threading
+    from typing import IO, Any, Dict, Generator, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+PROVIDERS = ("codex", "claude")
+
+STREAM_CHUNK_SIZE = 1 << 16
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "openclaw",
+    "model-usage.sqlite",
+)
+
+# Local JSONL logs codexbar reads cost data from (see references/codexbar-cli.md).
+CODEXBAR_LOG_ROOTS = {
+    "codex": ["~/.codex/sessions"],
+    "claude": ["~/.config/claude/projects", "~/.claude/projects"],
+}
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 def eprint(msg: str) -> None:
@@ -22,6 +56,8 @@ def eprint(msg: str) -> None:
 
 
 def run_codexbar_cost(provider: str) -> List[Dict[str, Any]]:
+    import subprocess
+
     cmd = ["codexbar", "cost", "--format", "json", "--provider", provider]
     try:
         output = subprocess.check_output(cmd, text=True)
@@ -38,18 +74,26 @@ def run_codexbar_cost(provider: str) -> List[Dict[str, Any]]:
     return payload
 
 
-def load_payload(input_path: Optional[str], provider: str) -> Dict[str, Any]:
-    if input_path:
-        if input_path == "-":
-            raw = sys.stdin.read()
-        else:
-            with open(input_path, "r", encoding="utf-8") as handle:
-                raw = handle.read()
-        data = json.loads(raw)
+def read_input(input_path: str) -> Any:
+    if input_path == "-":
+        raw = sys.stdin.read()
     else:
-        data = run_codexbar_cost(provider)
+        with open(input_path, "r", encoding="utf-8") as handle:
+            raw = handle.read()
+    return json.loads(raw)
+
+
+def select_provider(data: Any, provider: str, require_match: bool = False) -> Dict[str, Any]:
+    """
+    Pick the provider's entry from a codexbar payload.
 
+    A single-object payload is taken as is, unless `require_match` is set (as
+    with `--provider all`), in which case it only belongs to the provider its
+    `provider` field names.
+    """
     if isinstance(data, dict):
+        if require_match and data.get("provider") != provider:
+            raise RuntimeError(f"Provider '{provider}' not found in codexbar payload.")
         return data
 
     if isinstance(data, list):
@@ -61,10 +105,229 @@ def load_payload(input_path: Optional[str], provider: str) -> Dict[str, Any]:
     raise RuntimeError("Unsupported JSON input format.")
 
 
-@dataclass
-class ModelCost:
-    model: str
-    cost: float
+def load_payload(input_path: Optional[str], provider: str) -> Dict[str, Any]:
+    if input_path:
+        data = read_input(input_path)
+    else:
+        data = run_codexbar_cost(provider)
+    return select_provider(data, provider)
+
+
+class JsonStream:
+    """
+    Incremental reader over a JSON text stream.
+
+    Containers are walked by hand so the caller decides which parts to keep;
+    leaf values are decoded with `json.JSONDecoder.raw_decode` over a bounded
+    buffer, and skipped subtrees are dropped element by element.
+    """
+
+    def __init__(self, handle: IO[str], chunk_size: int = STREAM_CHUNK_SIZE) -> None:
+        self._handle = handle
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._handle.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _truncated(self) -> RuntimeError:
+        return RuntimeError("Failed to parse codexbar JSON output: unexpected end of input")
+
+    def peek(self) -> str:
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            if not found:
+                raise self._truncated()
+            raise RuntimeError(f"Failed to parse codexbar JSON output: expected '{char}', got '{found}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        if not self.peek():
+            raise self._truncated()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if self._fill():
+                    continue
+                raise RuntimeError(f"Failed to parse codexbar JSON output: {exc}")
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip(self) -> None:
+        # Drop containers one element at a time: decoding small elements in C
+        # is far faster than scanning brackets in Python, and memory stays
+        # bounded by the largest element rather than the whole subtree.
+        head = self.peek()
+        if head == "[":
+            for _ in self.iter_array():
+                self.value()
+        elif head == "{":
+            for _ in self.iter_object():
+                self.skip()
+        else:
+            self.value()
+
+    def iter_array(self) -> Iterator[None]:
+        """Yield once per array element; the caller must consume each element."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            found = self.peek()
+            if found == "]":
+                self._pos += 1
+                return
+            self.expect(",")
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield each key of an object; the caller must consume each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise RuntimeError("Failed to parse codexbar JSON output: object key is not a string")
+            self.expect(":")
+            yield key
+            found = self.peek()
+            if found == "}":
+                self._pos += 1
+                return
+            self.expect(",")
+
+
+def _stream_daily(stream: JsonStream) -> Iterator[Dict[str, Any]]:
+    if stream.peek() != "[":
+        stream.skip()
+        return
+    for _ in stream.iter_array():
+        entry = stream.value()
+        if isinstance(entry, dict):
+            yield entry
+
+
+def _stream_provider_entry(
+    stream: JsonStream, provider: str, require_match: bool
+) -> Generator[Dict[str, Any], None, bool]:
+    """
+    Yield daily rows of one provider object, or nothing if it does not match.
+
+    codexbar writes `provider` before `daily`; if a payload does not, the rows
+    of that object are held until its provider is known. Returns whether the
+    object matched, which a matching object without daily rows still does.
+    """
+    entry_provider: Optional[str] = None
+    pending: Optional[List[Dict[str, Any]]] = None
+    for key in stream.iter_object():
+        if key == "provider":
+            value = stream.value()
+            entry_provider = value if isinstance(value, str) else None
+        elif key == "daily":
+            if not require_match or entry_provider == provider:
+                yield from _stream_daily(stream)
+            elif entry_provider is None:
+                pending = list(_stream_daily(stream))
+            else:
+                stream.skip()
+        else:
+            stream.skip()
+    if pending and entry_provider == provider:
+        yield from pending
+    return not require_match or entry_provider == provider
+
+
+def stream_daily_entries(
+    handle: IO[str], provider: str, require_match: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the provider's daily rows one at a time from a codexbar cost payload.
+
+    Mirrors `load_payload` + `parse_daily_entries` while keeping memory bounded
+    by a single daily row: non-matching providers are dropped as they are read.
+    `require_match` applies to single-object payloads as in `select_provider`.
+    """
+    stream = JsonStream(handle)
+    head = stream.peek()
+    if head == "{":
+        matched = yield from _stream_provider_entry(stream, provider, require_match=require_match)
+        if not matched:
+            raise RuntimeError(f"Provider '{provider}' not found in codexbar payload.")
+        return
+    if head != "[":
+        raise RuntimeError("Unsupported JSON input format.")
+    for _ in stream.iter_array():
+        if stream.peek() != "{":
+            stream.skip()
+            continue
+        if (yield from _stream_provider_entry(stream, provider, require_match=True)):
+            return
+    raise RuntimeError(f"Provider '{provider}' not found in codexbar payload.")
+
+
+@contextmanager
+def open_payload_stream(input_path: Optional[str], provider: str) -> Iterator[IO[str]]:
+    import subprocess
+
+    if input_path == "-":
+        yield sys.stdin
+        return
+    if input_path:
+        with open(input_path, "r", encoding="utf-8") as handle:
+            yield handle
+        return
+
+    cmd = ["codexbar", "cost", "--format", "json", "--provider", provider]
+    try:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    except FileNotFoundError:
+        raise RuntimeError("codexbar not found on PATH. Install CodexBar CLI first.")
+    completed = False
+    try:
+        yield proc.stdout
+        completed = True
+    finally:
+        if completed:
+            # Drain the rest so codexbar is not killed by SIGPIPE before exiting.
+            while proc.stdout.read(STREAM_CHUNK_SIZE):
+                pass
+            proc.stdout.close()
+            returncode = proc.wait()
+        else:
+            proc.kill()
+            proc.stdout.close()
+            proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"codexbar cost failed (exit {returncode}).")
+
+
+ModelCost = namedtuple("ModelCost", ["model", "cost"])
 
 
 def parse_daily_entries(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -76,26 +339,48 @@ def parse_daily_entries(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [entry for entry in daily if isinstance(entry, dict)]
 
 
+@lru_cache(maxsize=1 << 16)
 def parse_date(value: str) -> Optional[date]:
+    # Memoized: a history repeats each date across filters, indexes and columns.
+    # Canonical ISO dates take the C fast path; strptime still handles the
+    # non-padded forms it has always accepted.
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
     try:
         return datetime.strptime(value, "%Y-%m-%d").date()
     except Exception:
         return None
 
 
-def filter_by_days(entries: List[Dict[str, Any]], days: Optional[int]) -> List[Dict[str, Any]]:
+def days_cutoff(days: Optional[int]) -> Optional[date]:
     if not days:
+        return None
+    return date.today() - timedelta(days=days - 1)
+
+
+def entry_on_or_after(entry: Dict[str, Any], cutoff: date) -> bool:
+    day = entry.get("date")
+    if not isinstance(day, str):
+        return False
+    parsed = parse_date(day)
+    return bool(parsed and parsed >= cutoff)
+
+
+def filter_by_days(entries: List[Dict[str, Any]], days: Optional[int]) -> List[Dict[str, Any]]:
+    cutoff = days_cutoff(days)
+    if cutoff is None:
         return entries
-    cutoff = date.today() - timedelta(days=days - 1)
-    filtered: List[Dict[str, Any]] = []
+    return [entry for entry in entries if entry_on_or_after(entry, cutoff)]
+
+
+def iter_by_days(entries: Iterable[Dict[str, Any]], days: Optional[int]) -> Iterator[Dict[str, Any]]:
+    cutoff = days_cutoff(days)
     for entry in entries:
-        day = entry.get("date")
-        if not isinstance(day, str):
-            continue
-        parsed = parse_date(day)
-        if parsed and parsed >= cutoff:
-            filtered.append(entry)
-    return filtered
+        if cutoff is None or entry_on_or_after(entry, cutoff):
+            yield entry
 
 
 def aggregate_costs(entries: Iterable[Dict[str, Any]]) -> Dict[str, float]:
@@ -148,6 +433,564 @@ def pick_current_model(entries: List[Dict[str, Any]]) -> Tuple[Optional[str], Op
     return None, None
 
 
+class UsageIndex:
+    """
+    Single-pass, date-indexed view over daily rows.
+
+    One `add` per row maintains per-model totals, the latest row per model,
+    the latest model overall and (with `track_daily`) per-day per-model costs,
+    so `main` never sorts or rescans the history. Answers match `aggregate_costs`,
+    `pick_current_model` and `latest_day_cost`: ties on date resolve to the row
+    that came later, like the stable sort those helpers use.
+
+    Model names are interned to integer ids on first sight; everything after
+    that lookup is list indexing, so long names are hashed once per item.
+    """
+
+    def __init__(self, track_daily: bool = False) -> None:
+        self.models: List[str] = []
+        self.track_daily = track_daily
+        self.daily_costs_by_id: Dict[str, Dict[int, float]] = {}
+        self.entry_count = 0
+        self._model_ids: Dict[str, int] = {}
+        self._totals: List[Optional[float]] = []
+        self._totals_order: List[int] = []
+        self._latest: List[Tuple[Optional[str], Optional[float]]] = []
+        self._latest_key: List[str] = []
+        self._last_seen: List[int] = []
+        self._current: Optional[Tuple[str, str, Optional[str]]] = None
+        self._totals_view: Optional[Dict[str, float]] = None
+
+    @classmethod
+    def build(cls, entries: Iterable[Dict[str, Any]], track_daily: bool = False) -> "UsageIndex":
+        index = cls(track_daily)
+        for entry in entries:
+            index.add(entry)
+        return index
+
+    def model_id(self, model: str) -> int:
+        model_id = self._model_ids.get(model)
+        if model_id is None:
+            model_id = len(self.models)
+            self._model_ids[model] = model_id
+            self.models.append(sys.intern(model))
+            self._totals.append(None)
+            self._latest.append((None, None))
+            self._latest_key.append("")
+            self._last_seen.append(0)
+        return model_id
+
+    @property
+    def totals(self) -> Dict[str, float]:
+        """Per-model totals, in the order each model first had a numeric cost."""
+        if self._totals_view is None:
+            self._totals_view = {self.models[model_id]: self._totals[model_id] for model_id in self._totals_order}
+        return self._totals_view
+
+    @property
+    def daily_costs(self) -> Dict[str, Dict[str, float]]:
+        return {
+            day: {self.models[model_id]: cost for model_id, cost in costs.items()}
+            for day, costs in self.daily_costs_by_id.items()
+        }
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.entry_count += 1
+        self._totals_view = None
+        stamp = self.entry_count
+        raw_day = entry.get("date")
+        day = raw_day if isinstance(raw_day, str) else None
+        sort_key = day or ""
+
+        candidate = -1
+        best_cost = 0.0
+        breakdowns = entry.get("modelBreakdowns")
+        if isinstance(breakdowns, list):
+            day_costs = self.daily_costs_by_id.setdefault(day, {}) if day and self.track_daily else None
+            model_ids = self._model_ids
+            totals = self._totals
+            last_seen = self._last_seen
+            latest_key = self._latest_key
+            for item in breakdowns:
+                if not isinstance(item, dict):
+                    continue
+                model = item.get("modelName")
+                if not isinstance(model, str):
+                    continue
+                model_id = model_ids.get(model)
+                if model_id is None:
+                    model_id = self.model_id(model)
+                cost = item.get("cost")
+                numeric = isinstance(cost, (int, float))
+                if last_seen[model_id] != stamp:
+                    last_seen[model_id] = stamp
+                    if sort_key >= latest_key[model_id]:
+                        latest_key[model_id] = sort_key
+                        self._latest[model_id] = (day, float(cost) if numeric else None)
+                if not numeric:
+                    continue
+                value = float(cost)
+                total = totals[model_id]
+                if total is None:
+                    self._totals_order.append(model_id)
+                    totals[model_id] = value
+                else:
+                    totals[model_id] = total + value
+                if day_costs is not None:
+                    day_costs[model_id] = day_costs.get(model_id, 0.0) + value
+                if candidate < 0 or value > best_cost:
+                    candidate, best_cost = model_id, value
+        current: Optional[str] = self.models[candidate] if candidate >= 0 else None
+        if current is None:
+            models_used = entry.get("modelsUsed")
+            if isinstance(models_used, list) and models_used and isinstance(models_used[-1], str):
+                current = models_used[-1]
+        if current is not None and (self._current is None or sort_key >= self._current[0]):
+            self._current = (sort_key, current, day)
+
+    def current_model(self) -> Tuple[Optional[str], Optional[str]]:
+        if self._current is None:
+            return None, None
+        return self._current[1], self._current[2]
+
+    def latest_day_cost(self, model: str) -> Tuple[Optional[str], Optional[float]]:
+        model_id = self._model_ids.get(model)
+        if model_id is None:
+            return None, None
+        return self._latest[model_id]
+
+
+def _as_date(value: Union[date, str, None]) -> Optional[date]:
+    if value is None or isinstance(value, date):
+        return value
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValueError(f"Invalid date '{value}' (expected YYYY-MM-DD).")
+    return parsed
+
+
+class CostTimeline:
+    """
+    Daily rows sorted by date, for range and model queries.
+
+    Rows without a parseable date are dropped. Rows sharing a date are all
+    kept, in input order, so their costs add up exactly as in an unfiltered
+    report. Range selection is a pair of bisects over the sorted ISO dates,
+    so repeated queries never rescan or reparse the history.
+    """
+
+    def __init__(self, entries: Iterable[Dict[str, Any]]) -> None:
+        dated: List[Tuple[str, Dict[str, Any]]] = []
+        for entry in entries:
+            day = entry.get("date")
+            parsed = parse_date(day) if isinstance(day, str) else None
+            if parsed is not None:
+                dated.append((parsed.isoformat(), _compact_entry(entry)))
+        dated.sort(key=lambda item: item[0])  # stable: same-day rows keep input order
+        self.dates: List[str] = [day for day, _ in dated]
+        self.rows: List[Dict[str, Any]] = [row for _, row in dated]
+
+    def select(
+        self, since: Union[date, str, None] = None, until: Union[date, str, None] = None
+    ) -> List[Dict[str, Any]]:
+        """Rows dated within [since, until]; either bound may be omitted."""
+        since_date, until_date = _as_date(since), _as_date(until)
+        lo = bisect.bisect_left(self.dates, since_date.isoformat()) if since_date else 0
+        hi = bisect.bisect_right(self.dates, until_date.isoformat()) if until_date else len(self.dates)
+        return self.rows[lo:hi]
+
+    def query(
+        self,
+        since: Union[date, str, None] = None,
+        until: Union[date, str, None] = None,
+        models: Optional[Iterable[str]] = None,
+        track_daily: bool = False,
+    ) -> UsageIndex:
+        rows: Iterable[Dict[str, Any]] = self.select(since, until)
+        if models:
+            rows = (restrict_models(row, set(models)) for row in rows)
+        return UsageIndex.build(rows, track_daily)
+
+
+def restrict_models(entry: Dict[str, Any], models: Set[str]) -> Dict[str, Any]:
+    """Copy of a daily row that only mentions the given models."""
+    restricted = dict(entry)
+    breakdowns = entry.get("modelBreakdowns")
+    if isinstance(breakdowns, list):
+        restricted["modelBreakdowns"] = [
+            item for item in breakdowns if isinstance(item, dict) and item.get("modelName") in models
+        ]
+    models_used = entry.get("modelsUsed")
+    if isinstance(models_used, list):
+        restricted["modelsUsed"] = [model for model in models_used if model in models]
+    return restricted
+
+
+def query_costs(
+    provider: str = "codex",
+    since: Union[date, str, None] = None,
+    until: Union[date, str, None] = None,
+    models: Optional[Iterable[str]] = None,
+    input_path: Optional[str] = None,
+    cache_path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Per-model costs for a date range and optional model subset.
+
+    Importable counterpart of `--since/--until/--models`: reads from
+    `input_path`, the on-disk cache at `cache_path`, or codexbar.
+    """
+    entries = iter_source_entries(provider, input_path, stream=True, cache_path=cache_path)
+    index = CostTimeline(entries).query(since, until, models)
+    since_date, until_date = _as_date(since), _as_date(until)
+    payload = build_json_all(provider=provider, totals=index.totals)
+    payload.update(
+        {
+            "mode": "range",
+            "since": since_date.isoformat() if since_date else None,
+            "until": until_date.isoformat() if until_date else None,
+            "totalCostUSD": sum(index.totals.values()),
+            "dailyRowCount": index.entry_count,
+        }
+    )
+    return payload
+
+
+TREND_WINDOWS = (7, 30)
+
+
+class DailyTotals:
+    """
+    Zero-filled per-day cost totals from ordinal `first` on, with prefix sums.
+
+    One table covers every window a trends report asks about, so rolling
+    sums, month-to-date spend and the forecast fit all read from it instead of
+    each rebuilding their own dense slice of the columns.
+    """
+
+    def __init__(self, first: int, totals: array) -> None:
+        self.first = first
+        self.totals = totals
+        self.prefix = array("d", [0.0])
+        running = 0.0
+        for cost in totals:
+            running += cost
+            self.prefix.append(running)
+
+    def total(self, first: int, last: int) -> float:
+        """Sum of the days from ordinal `first` to `last` inclusive."""
+        return self.prefix[last - self.first + 1] - self.prefix[first - self.first]
+
+    def values(self, first: int, last: int) -> array:
+        return self.totals[first - self.first : last - self.first + 1]
+
+
+class CostColumns:
+    """
+    Columnar daily cost table: parallel arrays of date ordinal, model id and cost.
+
+    Built from an index with `track_daily` set, reusing its model ids, so
+    each date string is parsed once and no model name is hashed again. Rows
+    are sorted by ordinal, so a date window is a pair of bisects and only the
+    rows inside it are visited. Time-series questions work on a dense
+    `DailyTotals` table, which makes every rolling window O(1) per day.
+    """
+
+    def __init__(self) -> None:
+        self.ordinals = array("l")
+        self.model_ids = array("l")
+        self.costs = array("d")
+        self.models: List[str] = []
+        self._model_ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_index(cls, index: UsageIndex) -> "CostColumns":
+        columns = cls()
+        columns.models = list(index.models)
+        columns._model_ids = {model: model_id for model_id, model in enumerate(columns.models)}
+        rows: List[Tuple[int, int, float]] = []
+        for day, costs in index.daily_costs_by_id.items():
+            parsed = parse_date(day)
+            if parsed is None:
+                continue
+            ordinal = parsed.toordinal()
+            rows.extend((ordinal, model_id, cost) for model_id, cost in costs.items())
+        rows.sort(key=lambda row: row[0])
+        for ordinal, model_id, cost in rows:
+            columns.ordinals.append(ordinal)
+            columns.model_ids.append(model_id)
+            columns.costs.append(cost)
+        return columns
+
+    def _rows(self, first: int, last: int) -> Iterable[Tuple[int, int, float]]:
+        """(ordinal, model id, cost) for the rows dated `first` to `last` inclusive."""
+        lo = bisect.bisect_left(self.ordinals, first)
+        hi = bisect.bisect_right(self.ordinals, last, lo)
+        return zip(self.ordinals[lo:hi], self.model_ids[lo:hi], self.costs[lo:hi])
+
+    def dense_daily(self, first: int, last: int, model: Optional[str] = None) -> array:
+        """Per-day cost from ordinal `first` to `last` inclusive, zero-filled."""
+        totals = array("d", bytes(8 * max(0, last - first + 1)))
+        model_id = self._model_ids.get(model, -1) if model is not None else None
+        if model is not None and model_id < 0:
+            return totals
+        for ordinal, row_model, cost in self._rows(first, last):
+            if model_id is None or row_model == model_id:
+                totals[ordinal - first] += cost
+        return totals
+
+    def daily_totals(self, first: int, last: int) -> DailyTotals:
+        return DailyTotals(first, self.dense_daily(first, last))
+
+    def rolling_sums(
+        self, window: int, as_of: date, length: int, daily: Optional[DailyTotals] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Trailing `window`-day sums for the `length` days ending at `as_of`.
+
+        `daily` must cover the `length + window - 1` days ending at `as_of`;
+        without it a table of exactly that span is built.
+        """
+        last = as_of.toordinal()
+        first = last - length + 1
+        if daily is None:
+            daily = self.daily_totals(first - window + 1, last)
+        return [
+            (date.fromordinal(day).isoformat(), daily.total(day - window + 1, day))
+            for day in range(first, last + 1)
+        ]
+
+    def burn_rates(self, window: int, as_of: date) -> Dict[str, float]:
+        """Average daily cost per model over the trailing `window` days."""
+        last = as_of.toordinal()
+        sums = array("d", bytes(8 * len(self.models)))
+        for _, model_id, cost in self._rows(last - window + 1, last):
+            sums[model_id] += cost
+        return {model: sums[model_id] / window for model_id, model in enumerate(self.models) if sums[model_id]}
+
+    def forecast_month_end(self, as_of: date, window: int = 30, daily: Optional[DailyTotals] = None) -> Dict[str, Any]:
+        """
+        Month-to-date spend plus a linear projection to month end.
+
+        Fits a least-squares line to the trailing `window` days of total cost
+        and sums its (non-negative) predictions over the remaining days.
+        `daily` must cover both the month so far and the fit window.
+        """
+        last = as_of.toordinal()
+        month_start = as_of.replace(day=1).toordinal()
+        import calendar
+
+        days_in_month = calendar.monthrange(as_of.year, as_of.month)[1]
+        remaining = days_in_month - as_of.day
+
+        if daily is None:
+            daily = self.daily_totals(min(month_start, last - window + 1), last)
+        month_to_date = daily.total(month_start, last)
+        values = daily.values(last - window + 1, last)
+        n = len(values)
+        mean_t = (n - 1) / 2
+        mean_y = sum(values) / n
+        var_t = sum((t - mean_t) ** 2 for t in range(n))
+        slope = sum((t - mean_t) * (y - mean_y) for t, y in enumerate(values)) / var_t if var_t else 0.0
+        intercept = mean_y - slope * mean_t
+        projected = sum(max(0.0, intercept + slope * (n - 1 + k)) for k in range(1, remaining + 1))
+        return {
+            "asOf": as_of.isoformat(),
+            "monthToDateUSD": month_to_date,
+            "projectedRemainderUSD": projected,
+            "projectedMonthEndUSD": month_to_date + projected,
+            "dailyTrendUSD": slope,
+        }
+
+
+FORECAST_WINDOW = 30
+
+
+def build_json_trends(provider: str, columns: CostColumns, as_of: date, length: int) -> Dict[str, Any]:
+    # One dense table spans the longest rolling window, the month so far and
+    # the forecast fit; every section below reads its days from it.
+    last = as_of.toordinal()
+    first = min(
+        last - length - max(TREND_WINDOWS) + 2,
+        as_of.replace(day=1).toordinal(),
+        last - FORECAST_WINDOW + 1,
+    )
+    daily = columns.daily_totals(first, last)
+    return {
+        "provider": provider,
+        "mode": "trends",
+        "rolling": {
+            str(window): [
+                {"date": day, "costUSD": total} for day, total in columns.rolling_sums(window, as_of, length, daily)
+            ]
+            for window in TREND_WINDOWS
+        },
+        "burnRatePerDayUSD": {
+            str(window): [
+                {"model": model, "costUSD": rate}
+                for model, rate in sorted(columns.burn_rates(window, as_of).items(), key=lambda item: item[1], reverse=True)
+            ]
+            for window in TREND_WINDOWS
+        },
+        "forecast": columns.forecast_month_end(as_of, FORECAST_WINDOW, daily),
+    }
+
+
+def render_text_trends(report: Dict[str, Any]) -> str:
+    lines = [f"Provider: {report['provider']}"]
+    for window, series in report["rolling"].items():
+        latest = series[-1]["costUSD"] if series else None
+        lines.append(f"Last {window} days: {usd(latest)}")
+    for window, rates in report["burnRatePerDayUSD"].items():
+        lines.append(f"Burn rate ({window}-day avg, per day):")
+        for item in rates:
+            lines.append(f"- {item['model']}: {usd(item['costUSD'])}")
+    forecast = report["forecast"]
+    lines.append(f"Month to date: {usd(forecast['monthToDateUSD'])}")
+    lines.append(f"Projected month end: {usd(forecast['projectedMonthEndUSD'])} (as of {forecast['asOf']})")
+    return "\n".join(lines)
+
+
+def log_signature(provider: str) -> Optional[str]:
+    """
+    Fingerprint the local logs codexbar reads for a provider.
+
+    Hashes path, size and mtime of every JSONL file, which only costs a stat
+    per file. Returns None when no log root exists, so callers always refresh.
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    found = False
+    for root in CODEXBAR_LOG_ROOTS.get(provider, []):
+        root = os.path.expanduser(root)
+        if not os.path.isdir(root):
+            continue
+        found = True
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if not name.endswith(".jsonl"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest() if found else None
+
+
+def _compact_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields `UsageIndex` reads from a daily row."""
+    return {key: entry[key] for key in ("date", "modelsUsed", "modelBreakdowns") if key in entry}
+
+
+class CostCache:
+    """
+    On-disk index of daily cost rows per provider, backed by SQLite.
+
+    Rows are stored by position in the codexbar `daily` array with a content
+    hash, so a sync only rewrites days that are new or changed. Each provider
+    also records the fingerprint of its rows and of the local logs, which lets
+    callers skip codexbar entirely while the logs are untouched.
+    """
+
+    def __init__(self, path: str) -> None:
+        import sqlite3
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS snapshots (
+                provider TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                log_signature TEXT,
+                row_count INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS rows (
+                provider TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                date TEXT,
+                row_hash TEXT NOT NULL,
+                entry TEXT NOT NULL,
+                PRIMARY KEY (provider, position)
+            );
+            """
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "CostCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def is_fresh(self, provider: str, signature: Optional[str]) -> bool:
+        if signature is None:
+            return False
+        row = self._conn.execute(
+            "SELECT log_signature FROM snapshots WHERE provider = ?", (provider,)
+        ).fetchone()
+        return row is not None and row[0] == signature
+
+    def sync(self, provider: str, entries: Iterable[Dict[str, Any]], signature: Optional[str]) -> int:
+        """Fold daily rows into the cache; returns how many rows were rewritten."""
+        import hashlib
+
+        stored = dict(
+            self._conn.execute("SELECT position, row_hash FROM rows WHERE provider = ?", (provider,))
+        )
+        fingerprint = hashlib.sha256()
+        changed = 0
+        count = 0
+        with self._conn:
+            for position, entry in enumerate(entries):
+                count += 1
+                text = json.dumps(_compact_entry(entry), sort_keys=True, separators=(",", ":"))
+                row_hash = hashlib.sha1(text.encode("utf-8")).hexdigest()
+                fingerprint.update(row_hash.encode("ascii"))
+                if stored.get(position) == row_hash:
+                    continue
+                day = entry.get("date")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rows (provider, position, date, row_hash, entry) VALUES (?, ?, ?, ?, ?)",
+                    (provider, position, day if isinstance(day, str) else None, row_hash, text),
+                )
+                changed += 1
+            self._conn.execute("DELETE FROM rows WHERE provider = ? AND position >= ?", (provider, count))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (provider, fingerprint, log_signature, row_count) VALUES (?, ?, ?, ?)",
+                (provider, fingerprint.hexdigest(), signature, count),
+            )
+        return changed
+
+    def entries(self, provider: str) -> Iterator[Dict[str, Any]]:
+        cursor = self._conn.execute(
+            "SELECT entry FROM rows WHERE provider = ? ORDER BY position", (provider,)
+        )
+        for (text,) in cursor:
+            yield json.loads(text)
+
+
+def load_cached_entries(cache_path: str, provider: str, refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Return the provider's daily rows from the cache, re-running codexbar only
+    when its local logs changed since the last sync (or `refresh` is set).
+    """
+    signature = log_signature(provider)
+    with CostCache(cache_path) as cache:
+        if refresh or not cache.is_fresh(provider, signature):
+            with open_payload_stream(None, provider) as handle:
+                cache.sync(provider, stream_daily_entries(handle, provider), signature)
+        return list(cache.entries(provider))
+
+
 def usd(value: Optional[float]) -> str:
     if value is None:
         return "—"
@@ -233,73 +1076,587 @@ def build_json_all(provider: str, totals: Dict[str, float]) -> Dict[str, Any]:
     }
 
 
-def main() -> int:
+def iter_source_entries(
+    provider: str,
+    input_path: Optional[str] = None,
+    *,
+    stream: bool = False,
+    cache_path: Optional[str] = None,
+    refresh: bool = False,
+    data: Any = None,
+    require_match: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one provider's daily rows from the cache, a stream, parsed `data` or a full load."""
+    if cache_path:
+        yield from load_cached_entries(cache_path, provider, refresh=refresh)
+    elif stream:
+        with open_payload_stream(input_path, provider) as handle:
+            yield from stream_daily_entries(handle, provider, require_match)
+    elif data is not None:
+        yield from parse_daily_entries(select_provider(data, provider, require_match))
+    else:
+        yield from parse_daily_entries(load_payload(input_path, provider))
+
+
+def build_index(
+    provider: str,
+    args: argparse.Namespace,
+    data: Any = None,
+    track_daily: bool = False,
+    require_match: bool = False,
+) -> UsageIndex:
+    """Load one provider's daily rows through the source and filters `args` selects."""
+    entries = iter_source_entries(
+        provider,
+        args.input,
+        stream=args.stream,
+        cache_path=args.cache,
+        refresh=args.refresh,
+        data=data,
+        require_match=require_match,
+    )
+    return index_entries(entries, args, args.days, track_daily)
+
+
+def index_entries(
+    entries: Iterable[Dict[str, Any]], args: argparse.Namespace, days: Optional[int], track_daily: bool = False
+) -> UsageIndex:
+    """Index daily rows within the last `days` days and the `--since/--until/--models` filters of `args`."""
+    entries = iter_by_days(entries, days)
+    if args.since or args.until or args.models:
+        return CostTimeline(entries).query(args.since, args.until, args.models, track_daily)
+    return UsageIndex.build(entries, track_daily)
+
+
+def summarize_current(index: UsageIndex, model: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Keyword arguments for `build_json_current`/`render_text_current`, or None without data."""
+    latest_date = None
+    if not model:
+        model, latest_date = index.current_model()
+    if not model:
+        return None
+    latest_cost_date, latest_cost = index.latest_day_cost(model)
+    return {
+        "model": model,
+        "latest_date": latest_date,
+        "total_cost": index.totals.get(model),
+        "latest_cost": latest_cost,
+        "latest_cost_date": latest_cost_date,
+        "entry_count": index.entry_count,
+    }
+
+
+def collect_providers(
+    providers: Iterable[str], args: argparse.Namespace
+) -> List[Tuple[str, Optional[UsageIndex], Optional[str]]]:
+    """
+    Build every provider's index concurrently.
+
+    Each worker mostly waits on its own codexbar subprocess (or file read), so
+    a thread pool is enough to overlap them. Failures are reported per
+    provider instead of aborting the whole report. A single-provider `--input`
+    payload is only credited to the provider it names.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    providers = list(providers)
+    data = None
+    if args.input and not args.stream:
+        data = read_input(args.input)
+
+    def collect(provider: str) -> Tuple[str, Optional[UsageIndex], Optional[str]]:
+        try:
+            return provider, build_index(provider, args, data, require_match=True), None
+        except Exception as exc:
+            return provider, None, str(exc)
+
+    with ThreadPoolExecutor(max_workers=len(providers)) as pool:
+        return list(pool.map(collect, providers))
+
+
+def build_json_multi(
+    mode: str,
+    results: List[Tuple[str, Optional[UsageIndex], Optional[str]]],
+    model: Optional[str],
+) -> Dict[str, Any]:
+    providers: List[Dict[str, Any]] = []
+    grand_total = 0.0
+    for provider, index, error in results:
+        if index is not None and mode == "current":
+            summary = summarize_current(index, model)
+            if summary is None:
+                error = "No model data found in codexbar cost payload."
+            else:
+                grand_total += summary["total_cost"] or 0.0
+                providers.append(build_json_current(provider=provider, **summary))
+                continue
+        elif index is not None:
+            if not index.totals:
+                error = "No model breakdowns found in codexbar cost payload."
+            else:
+                provider_total = sum(index.totals.values())
+                grand_total += provider_total
+                entry = build_json_all(provider=provider, totals=index.totals)
+                entry["totalCostUSD"] = provider_total
+                providers.append(entry)
+                continue
+        providers.append({"provider": provider, "mode": mode, "error": error})
+    return {"provider": "all", "mode": mode, "providers": providers, "totalCostUSD": grand_total}
+
+
+def render_text_multi(report: Dict[str, Any]) -> str:
+    blocks: List[str] = []
+    for entry in report["providers"]:
+        if "error" in entry:
+            blocks.append(f"Provider: {entry['provider']}\nError: {entry['error']}")
+        elif report["mode"] == "current":
+            blocks.append(
+                render_text_current(
+                    provider=entry["provider"],
+                    model=entry["model"],
+                    latest_date=entry["latestModelDate"],
+                    total_cost=entry["totalCostUSD"],
+                    latest_cost=entry["latestDayCostUSD"],
+                    latest_cost_date=entry["latestDayCostDate"],
+                    entry_count=entry["dailyRowCount"],
+                )
+            )
+        else:
+            totals = {item["model"]: item["totalCostUSD"] for item in entry["models"]}
+            blocks.append(
+                render_text_all(provider=entry["provider"], totals=totals)
+                + f"\nProvider total: {usd(entry['totalCostUSD'])}"
+            )
+    blocks.append(f"Grand total: {usd(report['totalCostUSD'])}")
+    return "\n\n".join(blocks)
+
+
+def source_signature(provider: str, args: argparse.Namespace) -> Optional[str]:
+    if args.input:
+        stat = os.stat(args.input)
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    return log_signature(provider)
+
+
+def load_entries(provider: str, args: argparse.Namespace) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Load one provider's daily rows, trimmed to the fields `UsageIndex` reads.
+
+    Returns (rows, mismatch). A single-provider `--input` payload that names
+    another provider is still loaded, as the CLI does for `--provider`, but
+    mismatch carries the not-found error so `provider=all` leaves it out
+    instead of crediting the same rows to every provider.
+    """
+    if args.cache:
+        return load_cached_entries(args.cache, provider), None
+    try:
+        with open_payload_stream(args.input, provider) as handle:
+            rows = [_compact_entry(entry) for entry in stream_daily_entries(handle, provider, require_match=True)]
+        return rows, None
+    except RuntimeError as exc:
+        if not args.input:
+            raise
+        mismatch = str(exc)
+    with open_payload_stream(args.input, provider) as handle:
+        return [_compact_entry(entry) for entry in stream_daily_entries(handle, provider)], mismatch
+
+
+class UsageService:
+    """
+    Resident cost state for `--serve`.
+
+    Keeps each provider's daily rows in memory and memoizes the JSON payloads
+    per query, so a request is a dictionary lookup. `refresh` reloads a
+    provider only when its source signature changed (or it has none).
+    `--since/--until/--models` apply to every response, and `--days` is the
+    default for requests without a `days` parameter.
+    """
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        import threading
+
+        self._args = args
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._errors: Dict[str, str] = {}
+        self._mismatches: Dict[str, str] = {}
+        self._signatures: Dict[str, Optional[str]] = {}
+        self._responses: Dict[Tuple[Any, ...], Tuple[int, bytes]] = {}
+
+    def refresh(self) -> bool:
+        """Reload stale providers; returns True if anything changed."""
+        changed = False
+        for provider in PROVIDERS:
+            try:
+                signature = source_signature(provider, self._args)
+            except OSError:
+                signature = None
+            known = provider in self._entries or provider in self._errors
+            if known and signature is not None and signature == self._signatures.get(provider):
+                continue
+            mismatch = None
+            try:
+                (entries, mismatch), error = load_entries(provider, self._args), None
+            except Exception as exc:
+                entries, error = None, str(exc)
+            with self._lock:
+                if entries is None:
+                    self._entries.pop(provider, None)
+                    self._errors[provider] = error or "unknown error"
+                else:
+                    self._entries[provider] = entries
+                    self._errors.pop(provider, None)
+                if mismatch is None:
+                    self._mismatches.pop(provider, None)
+                else:
+                    self._mismatches[provider] = mismatch
+                self._signatures[provider] = signature
+                self._responses.clear()
+            changed = True
+        return changed
+
+    def _result(
+        self, provider: str, days: Optional[int], require_match: bool = False
+    ) -> Tuple[str, Optional[UsageIndex], Optional[str]]:
+        if provider in self._errors:
+            return provider, None, self._errors[provider]
+        if require_match and provider in self._mismatches:
+            return provider, None, self._mismatches[provider]
+        return provider, index_entries(self._entries.get(provider, []), self._args, days), None
+
+    def _render(self, mode: str, provider: str, model: Optional[str], days: Optional[int]) -> Tuple[int, Dict[str, Any]]:
+        if provider == "all":
+            if mode == "trends":
+                return 400, {"error": "trends are reported per provider"}
+            results = [self._result(name, days, require_match=True) for name in PROVIDERS]
+            report = build_json_multi(mode, results, model)
+            return 200, report
+        _, index, error = self._result(provider, days)
+        if index is None:
+            return 503, {"error": error}
+        if mode == "trends":
+            # Windows reach back past `days`, which only sets the series length here.
+            index = index_entries(self._entries.get(provider, []), self._args, None, track_daily=True)
+            return 200, build_json_trends(provider, CostColumns.from_index(index), date.today(), days or 30)
+        if mode == "current":
+            summary = summarize_current(index, model)
+            if summary is None:
+                return 404, {"error": "No model data found in codexbar cost payload."}
+            return 200, build_json_current(provider=provider, **summary)
+        if not index.totals:
+            return 404, {"error": "No model breakdowns found in codexbar cost payload."}
+        return 200, build_json_all(provider=provider, totals=index.totals)
+
+    def query(self, mode: str, provider: str, model: Optional[str], days: Optional[int]) -> Tuple[int, bytes]:
+        if days is None:
+            days = self._args.days
+        # `days` is relative to today, so the date is part of the key.
+        key = (mode, provider, model, days, date.today() if days else None)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is None:
+                status, body = self._render(mode, provider, model, days)
+                cached = (status, json.dumps(body).encode("utf-8"))
+                self._responses[key] = cached
+        return cached
+
+    def watch(self, interval: float, stop: threading.Event) -> None:
+        while not stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception as exc:
+                eprint(f"refresh failed: {exc}")
+
+
+def make_request_handler(service: UsageService) -> type:
+    from http.server import BaseHTTPRequestHandler
+    from urllib.parse import parse_qs, urlsplit
+
+    class UsageRequestHandler(BaseHTTPRequestHandler):
+        """GET /current, /all or /trends with optional provider, model and days query parameters."""
+
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            mode = url.path.strip("/")
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            provider = params.get("provider", "codex")
+            if mode == "health":
+                self._send(200, b'{"ok": true}')
+                return
+            if mode not in ("current", "all", "trends") or provider not in (*PROVIDERS, "all"):
+                self._send(404, b'{"error": "unknown endpoint or provider"}')
+                return
+            try:
+                days = int(params["days"]) if params.get("days") else None
+            except ValueError:
+                self._send(400, b'{"error": "days must be an integer"}')
+                return
+            status, body = service.query(mode, provider, params.get("model") or None, days)
+            self._send(status, body)
+
+        def _send(self, status: int, body: bytes) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def address_string(self) -> str:
+            # Unix socket peers have no (host, port) address.
+            return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return UsageRequestHandler
+
+
+def serve(args: argparse.Namespace) -> int:
+    import socketserver
+    import threading
+    from http.server import ThreadingHTTPServer
+
+    class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    service = UsageService(args)
+    service.refresh()
+    handler = make_request_handler(service)
+
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        server: socketserver.BaseServer = UnixHTTPServer(args.socket, handler)
+        where = f"unix:{args.socket}"
+    else:
+        server = ThreadingHTTPServer((args.host, args.port), handler)
+        where = f"http://{args.host}:{server.server_address[1]}"
+
+    stop = threading.Event()
+    watcher = threading.Thread(target=service.watch, args=(args.refresh_interval, stop), daemon=True)
+    watcher.start()
+    eprint(f"Serving model usage on {where} (refresh every {args.refresh_interval:g}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+
+def parse_date_arg(value: str) -> date:
+    import argparse
+
+    parsed = parse_date(value)
+    if parsed is None:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}' (expected YYYY-MM-DD)")
+    return parsed
+
+
+_FAST_FLAGS = ("--pretty", "--stream", "--refresh")
+_FAST_CHOICES = {
+    "--provider": (*PROVIDERS, "all"),
+    "--mode": ("current", "all", "trends"),
+    "--format": ("text", "json"),
+}
+_FAST_VALUES = ("--model", "--input")
+
+
+def fast_parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse the everyday flags without importing or building argparse.
+
+    Returns None for anything else (help, abbreviations, errors, rarer
+    options) so `build_parser` handles it with its usual messages. The result
+    matches what `build_parser().parse_args(argv)` would return.
+    """
+    values: Dict[str, Any] = {
+        "provider": "codex",
+        "mode": "current",
+        "model": None,
+        "input": None,
+        "days": None,
+        "since": None,
+        "until": None,
+        "models": None,
+        "format": "text",
+        "pretty": False,
+        "stream": False,
+        "cache": None,
+        "refresh": False,
+        "serve": False,
+        "host": "127.0.0.1",
+        "port": 8765,
+        "socket": None,
+        "refresh_interval": 30.0,
+    }
+    position = 0
+    while position < len(argv):
+        flag = argv[position]
+        if flag in _FAST_FLAGS:
+            values[flag[2:]] = True
+            position += 1
+            continue
+        if position + 1 >= len(argv):
+            return None
+        value = argv[position + 1]
+        if value.startswith("-") and value != "-":
+            return None
+        if flag in _FAST_CHOICES:
+            if value not in _FAST_CHOICES[flag]:
+                return None
+        elif flag == "--days":
+            if not value.isdigit():
+                return None
+            value = int(value)
+        elif flag not in _FAST_VALUES:
+            return None
+        values[flag[2:]] = value
+        position += 2
+    return SimpleNamespace(**values)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(description="Summarize CodexBar model usage from local cost logs.")
-    parser.add_argument("--provider", choices=["codex", "claude"], default="codex")
-    parser.add_argument("--mode", choices=["current", "all"], default="current")
+    parser.add_argument(
+        "--provider",
+        choices=[*PROVIDERS, "all"],
+        default="codex",
+        help="Provider to report, or 'all' to collect every provider in parallel.",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["current", "all", "trends"],
+        default="current",
+        help="'trends' reports rolling 7/30-day spend, per-model burn rate and a month-end forecast.",
+    )
     parser.add_argument("--model", help="Explicit model name to report instead of auto-current.")
     parser.add_argument("--input", help="Path to codexbar cost JSON (or '-' for stdin).")
     parser.add_argument("--days", type=int, help="Limit to last N days (based on daily rows).")
+    parser.add_argument("--since", type=parse_date_arg, help="Only include rows on or after this date (YYYY-MM-DD).")
+    parser.add_argument("--until", type=parse_date_arg, help="Only include rows on or before this date (YYYY-MM-DD).")
+    parser.add_argument(
+        "--models",
+        type=lambda value: [model.strip() for model in value.split(",") if model.strip()],
+        help="Comma-separated model names to restrict the report to.",
+    )
     parser.add_argument("--format", choices=["text", "json"], default="text")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output.")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Parse the payload incrementally, keeping memory flat for very large cost histories.",
+    )
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=DEFAULT_CACHE_PATH,
+        metavar="PATH",
+        help=f"Answer from an on-disk cost index, re-running codexbar only when its logs change (default: {DEFAULT_CACHE_PATH}).",
+    )
+    parser.add_argument("--refresh", action="store_true", help="With --cache, re-run codexbar even if logs look unchanged.")
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Stay resident and answer /current and /all over HTTP (or --socket), refreshing when logs change.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="With --serve, address to bind (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8765, help="With --serve, TCP port to bind (default: 8765).")
+    parser.add_argument("--socket", help="With --serve, listen on this Unix socket path instead of TCP.")
+    parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=30.0,
+        help="With --serve, seconds between checks for changed cost logs (default: 30).",
+    )
+    return parser
+
+
+def usage_error(message: str) -> None:
+    build_parser().error(message)
 
-    args = parser.parse_args()
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    args = fast_parse_args(argv) or build_parser().parse_args(argv)
+    if args.cache and args.input:
+        usage_error("--cache reads from codexbar and cannot be combined with --input")
+    if args.provider == "all" and args.stream and args.input == "-":
+        usage_error("--provider all --stream needs a file path; stdin can only be read once")
+    if args.serve:
+        if args.input == "-":
+            usage_error("--serve needs a file path or codexbar; stdin can only be read once")
+        return serve(args)
+
+    indent = 2 if args.pretty else None
+
+    if args.mode == "trends":
+        if args.provider == "all":
+            usage_error("--mode trends reports one provider at a time")
+        try:
+            # Windows reach back past --days, which only sets the series length here.
+            index = build_index(
+                args.provider, type(args)(**{**vars(args), "days": None}), track_daily=True
+            )
+        except Exception as exc:
+            eprint(str(exc))
+            return 1
+        report = build_json_trends(args.provider, CostColumns.from_index(index), date.today(), args.days or 30)
+        if args.format == "json":
+            print(json.dumps(report, indent=indent, sort_keys=args.pretty))
+        else:
+            print(render_text_trends(report))
+        return 0
+
+    if args.provider == "all":
+        try:
+            results = collect_providers(PROVIDERS, args)
+        except Exception as exc:
+            eprint(str(exc))
+            return 1
+        report = build_json_multi(args.mode, results, args.model)
+        if all("error" in entry for entry in report["providers"]):
+            for entry in report["providers"]:
+                eprint(f"{entry['provider']}: {entry['error']}")
+            return 1 if any(error for _, _, error in results) else 2
+        if args.format == "json":
+            print(json.dumps(report, indent=indent, sort_keys=args.pretty))
+        else:
+            print(render_text_multi(report))
+        return 0
 
     try:
-        payload = load_payload(args.input, args.provider)
+        index = build_index(args.provider, args)
     except Exception as exc:
         eprint(str(exc))
         return 1
 
-    entries = parse_daily_entries(payload)
-    entries = filter_by_days(entries, args.days)
-
     if args.mode == "current":
-        model = args.model
-        latest_date = None
-        if not model:
-            model, latest_date = pick_current_model(entries)
-        if not model:
+        summary = summarize_current(index, args.model)
+        if summary is None:
             eprint("No model data found in codexbar cost payload.")
             return 2
-        totals = aggregate_costs(entries)
-        total_cost = totals.get(model)
-        latest_cost_date, latest_cost = latest_day_cost(entries, model)
 
         if args.format == "json":
-            payload_out = build_json_current(
-                provider=args.provider,
-                model=model,
-                latest_date=latest_date,
-                total_cost=total_cost,
-                latest_cost=latest_cost,
-                latest_cost_date=latest_cost_date,
-                entry_count=len(entries),
-            )
-            indent = 2 if args.pretty else None
+            payload_out = build_json_current(provider=args.provider, **summary)
             print(json.dumps(payload_out, indent=indent, sort_keys=args.pretty))
         else:
-            print(
-                render_text_current(
-                    provider=args.provider,
-                    model=model,
-                    latest_date=latest_date,
-                    total_cost=total_cost,
-                    latest_cost=latest_cost,
-                    latest_cost_date=latest_cost_date,
-                    entry_count=len(entries),
-                )
-            )
+            print(render_text_current(provider=args.provider, **summary))
         return 0
 
-    totals = aggregate_costs(entries)
+    totals = index.totals
     if not totals:
         eprint("No model breakdowns found in codexbar cost payload.")
         return 2
 
     if args.format == "json":
         payload_out = build_json_all(provider=args.provider, totals=totals)
-        indent = 2 if args.pretty else None
         print(json.dumps(payload_out, indent=indent, sort_keys=args.pretty))
     else:
         print(render_text_all(provider=args.provider, totals=totals))
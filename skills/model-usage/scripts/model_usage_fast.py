@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Fast-start entry point for model_usage.py.
+
+Python recompiles a script passed on the command line on every run, but
+caches the bytecode of imported modules in __pycache__. Importing
+model_usage from this stub skips that compile step; arguments and output
+are identical to running model_usage.py directly.
+"""
+
+from model_usage import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
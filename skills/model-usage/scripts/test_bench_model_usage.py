@@ -0,0 +1,59 @@
+"""
+Checks for bench_model_usage.py, run with `python -m pytest skills/model-usage/scripts`.
+
+Timings are not asserted; these only keep the generator and pipelines honest.
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+import model_usage
+from bench_model_usage import (
+    PIPELINES,
+    indexed_report,
+    legacy_report,
+    parse_limits,
+    run_pipeline,
+    synthetic_daily,
+    synthetic_payload,
+    write_payload,
+)
+
+
+def test_payload_is_deterministic_and_shaped_like_codexbar():
+    end = date(2026, 3, 1)
+    daily = synthetic_daily(5, 3, seed=7, end=end)
+    assert daily == synthetic_daily(5, 3, seed=7, end=end)
+    assert daily != synthetic_daily(5, 3, seed=8, end=end)
+    assert [entry["date"] for entry in daily] == [f"2026-02-{day}" for day in range(25, 29)] + ["2026-03-01"]
+    assert all(len(entry["modelBreakdowns"]) == 3 for entry in daily)
+
+    payload = synthetic_payload(2, 2, providers=3)
+    assert [entry["provider"] for entry in payload] == [*model_usage.PROVIDERS, "provider-2"]
+
+
+def test_pipelines_agree(tmp_path):
+    path = str(tmp_path / "cost.json")
+    assert write_payload(path, days=40, models=3, providers=2) > 0
+    results = [run_pipeline(pipeline, path, "claude", days=30) for pipeline in PIPELINES]
+    assert [result["rows"] for result in results] == [30, 30]
+    assert set(results[1]["timings"]) == {"load", "render"}
+    json.dumps(results)
+
+
+def test_legacy_and_indexed_reports_agree():
+    entries = synthetic_daily(50, 4, seed=3)
+    assert legacy_report(entries, 20) == indexed_report(entries, 20)
+
+
+def test_parse_limits():
+    assert parse_limits(["load=1.5", "stream.total=2"]) == {
+        ("buffered", "load"): 1.5,
+        ("stream", "load"): 1.5,
+        ("stream", "total"): 2.0,
+    }
+    for value in ("bogus=1", "stream.load", "other.load=1"):
+        with pytest.raises(SystemExit):
+            parse_limits([value])
@@ -0,0 +1,99 @@
+"""
+Checks for model_usage.py's `--cache`, run with `python -m pytest skills/model-usage/scripts`.
+
+codexbar is replaced by a payload string so the tests can count how often it runs.
+"""
+
+import io
+import json
+import os
+from contextlib import contextmanager
+
+import pytest
+
+import model_usage
+from model_usage import CostCache, load_cached_entries, log_signature
+
+
+def day(date, cost, **extra):
+    return {"date": date, "modelBreakdowns": [{"modelName": "gpt-5", "cost": cost}], **extra}
+
+
+@pytest.fixture
+def logs(tmp_path, monkeypatch):
+    root = tmp_path / "sessions"
+    (root / "2026").mkdir(parents=True)
+    (root / "2026" / "a.jsonl").write_text("{}\n", encoding="utf-8")
+    monkeypatch.setitem(model_usage.CODEXBAR_LOG_ROOTS, "codex", [str(root)])
+    return root
+
+
+@pytest.fixture
+def codexbar(monkeypatch):
+    state = {"daily": [day("2026-01-01", 1.0), day("2026-01-02", 2.0)], "runs": 0}
+
+    @contextmanager
+    def fake_stream(input_path, provider):
+        assert input_path is None
+        state["runs"] += 1
+        yield io.StringIO(json.dumps([{"provider": provider, "daily": state["daily"]}]))
+
+    monkeypatch.setattr(model_usage, "open_payload_stream", fake_stream)
+    return state
+
+
+def test_sync_rewrites_only_changed_rows(tmp_path):
+    rows = [day("2026-01-01", 1.0), day("2026-01-02", 2.0, extra="dropped"), day("2026-01-03", 3.0)]
+    with CostCache(str(tmp_path / "cache.sqlite")) as cache:
+        assert cache.sync("codex", rows, "sig") == 3
+        assert cache.sync("codex", rows, "sig") == 0
+        rows[1] = day("2026-01-02", 2.5)
+        assert cache.sync("codex", rows, "sig") == 1
+        assert cache.sync("codex", rows[:2], "sig") == 0
+        assert list(cache.entries("codex")) == rows[:2]
+        assert list(cache.entries("claude")) == []
+
+
+def test_freshness_follows_log_signature(tmp_path):
+    with CostCache(str(tmp_path / "cache.sqlite")) as cache:
+        assert not cache.is_fresh("codex", "sig")
+        cache.sync("codex", [], "sig")
+        assert cache.is_fresh("codex", "sig")
+        assert not cache.is_fresh("codex", "other")
+        assert not cache.is_fresh("codex", None)
+
+
+def test_log_signature_changes_with_logs(logs):
+    first = log_signature("codex")
+    assert first is not None and first == log_signature("codex")
+    log = logs / "2026" / "a.jsonl"
+    log.write_text("{}\n{}\n", encoding="utf-8")
+    second = log_signature("codex")
+    assert second != first
+    (logs / "2026" / "notes.txt").write_text("ignored", encoding="utf-8")
+    assert log_signature("codex") == second
+    assert log_signature("gemini") is None
+
+
+def test_cached_entries_rerun_codexbar_only_when_logs_change(tmp_path, logs, codexbar):
+    cache_path = str(tmp_path / "cache.sqlite")
+    assert load_cached_entries(cache_path, "codex") == codexbar["daily"]
+    assert load_cached_entries(cache_path, "codex") == codexbar["daily"]
+    assert codexbar["runs"] == 1
+
+    codexbar["daily"].append(day("2026-01-03", 3.0))
+    stat = os.stat(logs / "2026" / "a.jsonl")
+    os.utime(logs / "2026" / "a.jsonl", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert load_cached_entries(cache_path, "codex") == codexbar["daily"]
+    assert codexbar["runs"] == 2
+
+    load_cached_entries(cache_path, "codex", refresh=True)
+    assert codexbar["runs"] == 3
+
+
+def test_missing_log_root_always_refreshes(tmp_path, monkeypatch, codexbar):
+    monkeypatch.setitem(model_usage.CODEXBAR_LOG_ROOTS, "codex", [str(tmp_path / "absent")])
+    cache_path = str(tmp_path / "cache.sqlite")
+    load_cached_entries(cache_path, "codex")
+    load_cached_entries(cache_path, "codex")
+    assert codexbar["runs"] == 2
@@ -0,0 +1,79 @@
+"""
+Checks for model_usage.py's UsageIndex, run with `python -m pytest skills/model-usage/scripts`.
+
+The index answers in one pass what `aggregate_costs`, `pick_current_model` and
+`latest_day_cost` answer by sorting and rescanning; both must agree on messy
+input, including ties on date, missing dates and non-numeric costs.
+"""
+
+import random
+import sys
+from datetime import date
+
+import pytest
+
+from model_usage import UsageIndex, aggregate_costs, latest_day_cost, parse_date, pick_current_model
+
+MODELS = ["gpt-5", "gpt-5-mini", "opus", "sonnet"]
+
+
+def random_entry(rng):
+    entry = {}
+    if rng.random() < 0.9:
+        entry["date"] = rng.choice([f"2026-01-{rng.randrange(1, 10):02d}", "2026-1-3", "not a date", ""])
+    if rng.random() < 0.9:
+        breakdowns = []
+        for _ in range(rng.randrange(0, 4)):
+            item = {"modelName": rng.choice(MODELS), "cost": rng.choice([rng.randrange(0, 5), rng.random(), None, "1"])}
+            breakdowns.append(rng.choice([item, item, item, "junk", {"cost": 1}]))
+        entry["modelBreakdowns"] = breakdowns
+    if rng.random() < 0.3:
+        entry["modelsUsed"] = rng.sample(MODELS, rng.randrange(0, 3))
+    return entry
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_index_matches_sort_and_scan_helpers(seed):
+    rng = random.Random(seed)
+    entries = [random_entry(rng) for _ in range(rng.randrange(0, 40))]
+    index = UsageIndex.build(entries, track_daily=True)
+
+    expected_totals = aggregate_costs(entries)
+    assert list(index.totals.items()) == list(expected_totals.items())
+    assert index.current_model() == pick_current_model(entries)
+    for model in MODELS + ["unknown"]:
+        assert index.latest_day_cost(model) == latest_day_cost(entries, model)
+
+    per_day = {}
+    for day, costs in index.daily_costs.items():
+        for model, cost in costs.items():
+            per_day[model] = per_day.get(model, 0.0) + cost
+    dated = [entry for entry in entries if isinstance(entry.get("date"), str) and entry["date"]]
+    assert per_day == pytest.approx(aggregate_costs(dated))
+
+
+def test_later_row_wins_a_tie_on_date():
+    entries = [
+        {"date": "2026-01-02", "modelBreakdowns": [{"modelName": "opus", "cost": 5}]},
+        {"date": "2026-01-02", "modelBreakdowns": [{"modelName": "sonnet", "cost": 1}]},
+        {"date": "2026-01-01", "modelBreakdowns": [{"modelName": "gpt-5", "cost": 9}]},
+    ]
+    index = UsageIndex.build(entries)
+    assert index.current_model() == ("sonnet", "2026-01-02") == pick_current_model(entries)
+
+
+def test_parse_date_keeps_lenient_forms():
+    assert parse_date("2026-01-05") == date(2026, 1, 5)
+    assert parse_date("2026-1-5") == date(2026, 1, 5)
+    assert parse_date("2026-02-30") is None
+    assert parse_date("yesterday") is None
+    parse_date.cache_clear()
+    parse_date("2026-01-05")
+    parse_date("2026-01-05")
+    assert parse_date.cache_info().hits == 1
+
+
+def test_model_names_are_interned():
+    name = "".join(["gpt-", "5"])
+    index = UsageIndex.build([{"date": "2026-01-01", "modelBreakdowns": [{"modelName": name, "cost": 1}]}])
+    assert index.models[0] is sys.intern("gpt-5")
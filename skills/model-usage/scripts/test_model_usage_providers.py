@@ -0,0 +1,78 @@
+"""
+Checks for model_usage.py's `--provider all`, run with `python -m pytest skills/model-usage/scripts`.
+"""
+
+import json
+import threading
+
+import pytest
+
+import model_usage
+from model_usage import main
+
+
+def day(date, *costs):
+    return {"date": date, "modelBreakdowns": [{"modelName": m, "cost": c} for m, c in costs]}
+
+
+PAYLOAD = [
+    {"provider": "codex", "daily": [day("2026-01-01", ("gpt-5", 1.5)), day("2026-01-02", ("gpt-5-mini", 0.5))]},
+    {"provider": "claude", "daily": [day("2026-01-02", ("opus", 4.0), ("sonnet", 1.0))]},
+]
+
+
+def run_json(capsys, *argv):
+    code = main(["--provider", "all", "--format", "json", *argv])
+    return code, json.loads(capsys.readouterr().out or "null")
+
+
+@pytest.mark.parametrize("stream", [[], ["--stream"]])
+def test_all_providers_from_one_input(tmp_path, capsys, stream):
+    path = tmp_path / "cost.json"
+    path.write_text(json.dumps(PAYLOAD), encoding="utf-8")
+    code, report = run_json(capsys, "--mode", "all", "--input", str(path), *stream)
+    assert code == 0
+    assert report["totalCostUSD"] == pytest.approx(7.0)
+    assert [entry["provider"] for entry in report["providers"]] == list(model_usage.PROVIDERS)
+
+    code, report = run_json(capsys, "--input", str(path), *stream)
+    by_provider = {entry["provider"]: entry for entry in report["providers"]}
+    assert by_provider["codex"]["model"] == "gpt-5-mini"
+    assert by_provider["claude"]["model"] == "opus"
+
+
+def test_providers_are_collected_concurrently(monkeypatch, capsys):
+    # Each fake codexbar run waits for the other; run one after another they would time out.
+    barrier = threading.Barrier(len(model_usage.PROVIDERS), timeout=5)
+
+    def fake_codexbar(provider):
+        barrier.wait()
+        return PAYLOAD
+
+    monkeypatch.setattr(model_usage, "run_codexbar_cost", fake_codexbar)
+    code, report = run_json(capsys, "--mode", "all")
+    assert code == 0
+    assert report["totalCostUSD"] == pytest.approx(7.0)
+
+
+def test_one_failing_provider_is_reported_beside_the_others(monkeypatch, capsys):
+    def fake_codexbar(provider):
+        if provider == "claude":
+            raise RuntimeError("codexbar cost failed (exit 3).")
+        return PAYLOAD
+
+    monkeypatch.setattr(model_usage, "run_codexbar_cost", fake_codexbar)
+    code, report = run_json(capsys, "--mode", "all")
+    assert code == 0
+    by_provider = {entry["provider"]: entry for entry in report["providers"]}
+    assert by_provider["claude"]["error"] == "codexbar cost failed (exit 3)."
+    assert report["totalCostUSD"] == pytest.approx(2.0)
+
+
+def test_every_provider_failing_exits_nonzero(monkeypatch, capsys):
+    def fake_codexbar(provider):
+        raise RuntimeError("codexbar not found on PATH. Install CodexBar CLI first.")
+
+    monkeypatch.setattr(model_usage, "run_codexbar_cost", fake_codexbar)
+    assert main(["--provider", "all"]) == 1
+    assert "codex: codexbar not found" in capsys.readouterr().err
@@ -0,0 +1,77 @@
+"""
+Checks for model_usage.py's range queries, run with `python -m pytest skills/model-usage/scripts`.
+
+CostTimeline must select exactly the rows a linear filter over the raw
+entries would, and `query_costs` must match `--since/--until/--models`.
+"""
+
+import json
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from model_usage import CostTimeline, aggregate_costs, main, parse_date, query_costs, restrict_models
+
+START = date(2026, 1, 1)
+MODELS = ["gpt-5", "gpt-5-mini", "opus"]
+
+
+def random_entries(seed):
+    rng = random.Random(seed)
+    entries = []
+    for _ in range(120):
+        day = START + timedelta(days=rng.randrange(60))
+        text = rng.choice([day.isoformat(), f"{day.year}-{day.month}-{day.day}", "bad"])
+        breakdowns = [{"modelName": rng.choice(MODELS), "cost": rng.randrange(1, 100) / 4} for _ in range(2)]
+        entries.append({"date": text, "modelBreakdowns": breakdowns, "modelsUsed": MODELS[:2]})
+    return entries
+
+
+def linear_select(entries, since, until, models):
+    rows = []
+    for entry in entries:
+        parsed = parse_date(entry["date"])
+        if parsed is None or (since and parsed < since) or (until and parsed > until):
+            continue
+        rows.append(restrict_models(entry, set(models)) if models else entry)
+    return rows
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_query_matches_linear_filter(seed):
+    entries = random_entries(seed)
+    timeline = CostTimeline(entries)
+    rng = random.Random(seed)
+    for _ in range(20):
+        since = rng.choice([None, START + timedelta(days=rng.randrange(-5, 65))])
+        until = rng.choice([None, START + timedelta(days=rng.randrange(-5, 65))])
+        models = rng.choice([None, ["opus"], ["gpt-5", "missing"]])
+        index = timeline.query(since, until, models)
+        expected = linear_select(entries, since, until, models)
+        assert index.entry_count == len(expected)
+        assert index.totals == pytest.approx(aggregate_costs(expected))
+
+
+def test_string_bounds_and_bad_dates():
+    timeline = CostTimeline(random_entries(0))
+    assert timeline.select("2026-01-10", "2026-01-20") == timeline.select(date(2026, 1, 10), date(2026, 1, 20))
+    with pytest.raises(ValueError):
+        timeline.select("10/01/2026")
+
+
+def test_query_costs_matches_command_line(tmp_path, capsys):
+    entries = random_entries(3)
+    path = tmp_path / "cost.json"
+    path.write_text(json.dumps({"provider": "codex", "daily": entries}), encoding="utf-8")
+    report = query_costs("codex", "2026-01-05", "2026-02-10", ["opus", "gpt-5"], input_path=str(path))
+    assert report["mode"] == "range"
+    assert (report["since"], report["until"]) == ("2026-01-05", "2026-02-10")
+    expected = linear_select(entries, date(2026, 1, 5), date(2026, 2, 10), ["opus", "gpt-5"])
+    assert report["dailyRowCount"] == len(expected)
+    assert report["totalCostUSD"] == pytest.approx(sum(aggregate_costs(expected).values()))
+
+    argv = ["--mode", "all", "--format", "json", "--input", str(path)]
+    assert main(argv + ["--since", "2026-01-05", "--until", "2026-02-10", "--models", "opus,gpt-5"]) == 0
+    printed = json.loads(capsys.readouterr().out)
+    assert printed["models"] == report["models"]
@@ -0,0 +1,125 @@
+"""
+Checks for model_usage.py's `--serve` mode, run with `python -m pytest skills/model-usage/scripts`.
+"""
+
+import json
+import os
+import threading
+import urllib.request
+from datetime import date, timedelta
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from model_usage import UsageService, build_parser, make_request_handler
+
+
+def row(day, *costs):
+    return {
+        "date": day,
+        "modelBreakdowns": [{"modelName": model, "cost": cost} for model, cost in costs],
+    }
+
+
+CODEX_ONLY = {
+    "provider": "codex",
+    "daily": [
+        row("2026-01-01", ("gpt-5", 1.25)),
+        row("2026-01-02", ("gpt-5", 2.0), ("gpt-5-mini", 0.5)),
+    ],
+}
+
+
+def make_service(tmp_path, payload, *extra):
+    path = tmp_path / "cost.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    service = UsageService(build_parser().parse_args(["--serve", "--input", str(path), *extra]))
+    service.refresh()
+    return service
+
+
+def query(service, mode, provider, model=None, days=None):
+    status, body = service.query(mode, provider, model, days)
+    return status, json.loads(body)
+
+
+def test_single_provider_payload_is_not_double_counted(tmp_path):
+    service = make_service(tmp_path, CODEX_ONLY)
+    status, report = query(service, "all", "all")
+    assert status == 200
+    assert report["totalCostUSD"] == pytest.approx(3.75)
+    by_provider = {entry["provider"]: entry for entry in report["providers"]}
+    assert by_provider["codex"]["totalCostUSD"] == pytest.approx(3.75)
+    assert "not found" in by_provider["claude"]["error"]
+
+
+def test_single_provider_view_still_reads_unnamed_payload(tmp_path):
+    # Like `--provider claude --input codex.json`, a single-provider view takes the payload as is.
+    service = make_service(tmp_path, CODEX_ONLY)
+    status, report = query(service, "all", "claude")
+    assert status == 200
+    assert sum(item["totalCostUSD"] for item in report["models"]) == pytest.approx(3.75)
+
+
+def test_multi_provider_payload_sums_each_provider(tmp_path):
+    payload = [CODEX_ONLY, {"provider": "claude", "daily": [row("2026-01-02", ("opus", 4.0))]}]
+    service = make_service(tmp_path, payload)
+    status, report = query(service, "all", "all")
+    assert status == 200
+    assert report["totalCostUSD"] == pytest.approx(7.75)
+
+
+def test_http_all_providers(tmp_path):
+    service = make_service(tmp_path, CODEX_ONLY)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_request_handler(service))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/all?provider=all"
+        with urllib.request.urlopen(url) as response:
+            report = json.loads(response.read())
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert report["totalCostUSD"] == pytest.approx(3.75)
+
+
+def test_startup_filters_apply_to_responses(tmp_path):
+    service = make_service(tmp_path, CODEX_ONLY, "--since", "2026-01-02", "--models", "gpt-5")
+    status, report = query(service, "all", "codex")
+    assert status == 200
+    assert report["models"] == [{"model": "gpt-5", "totalCostUSD": 2.0}]
+
+
+def test_days_flag_is_the_default_window(tmp_path):
+    today = date.today()
+    payload = {
+        "provider": "codex",
+        "daily": [row((today - timedelta(days=40)).isoformat(), ("gpt-5", 5.0)), row(today.isoformat(), ("gpt-5", 1.0))],
+    }
+    service = make_service(tmp_path, payload, "--days", "7")
+    assert query(service, "all", "codex")[1]["models"][0]["totalCostUSD"] == pytest.approx(1.0)
+    assert query(service, "all", "codex", days=60)[1]["models"][0]["totalCostUSD"] == pytest.approx(6.0)
+
+
+def test_refresh_reloads_only_when_the_input_changes(tmp_path):
+    service = make_service(tmp_path, CODEX_ONLY)
+    assert query(service, "all", "codex")[1]["models"][0]["totalCostUSD"] == pytest.approx(3.25)
+    assert not service.refresh()
+
+    path = tmp_path / "cost.json"
+    payload = {"provider": "codex", "daily": [row("2026-01-03", ("gpt-5", 10.0))]}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert service.refresh()
+    assert query(service, "all", "codex")[1]["models"] == [{"model": "gpt-5", "totalCostUSD": 10.0}]
+
+
+def test_unreadable_input_is_a_service_error(tmp_path):
+    service = make_service(tmp_path, CODEX_ONLY)
+    (tmp_path / "cost.json").write_text("{not json", encoding="utf-8")
+    assert service.refresh()
+    status, report = query(service, "all", "codex")
+    assert status == 503
+    assert "error" in report
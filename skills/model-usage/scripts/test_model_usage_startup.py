@@ -0,0 +1,56 @@
+"""
+Startup checks for model_usage.py, run with `python -m pytest skills/model-usage/scripts`.
+
+The menu bar runs the reporter constantly, so the import of the everyday path
+is held to bench_model_usage.IMPORT_BUDGET_MS and must not pull in the modules
+listed in FAST_PATH_EXCLUDED. MODEL_USAGE_IMPORT_BUDGET_MS overrides the budget
+on unusually slow machines.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import model_usage
+from bench_model_usage import IMPORT_BUDGET_MS, check_startup, fast_parse_mismatches
+
+BUDGET_MS = float(os.environ.get("MODEL_USAGE_IMPORT_BUDGET_MS", IMPORT_BUDGET_MS))
+SCRIPTS = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_import_within_budget_and_lazy():
+    probes, failures = check_startup(BUDGET_MS, repeat=5)
+    assert probes
+    assert not failures, "\n".join(failures)
+
+
+def test_fast_parser_matches_argparse():
+    assert not fast_parse_mismatches()
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["--help"], ["--prov", "claude"], ["--days", "-3"], ["--since", "2026-01-01"], ["--mode"], ["--format", "xml"]],
+)
+def test_fast_parser_defers_everything_else(argv):
+    assert model_usage.fast_parse_args(argv) is None
+
+
+def test_fast_entry_point_prints_the_same_report(tmp_path):
+    path = tmp_path / "cost.json"
+    daily = [{"date": "2026-01-01", "modelBreakdowns": [{"modelName": "gpt-5", "cost": 1.5}]}]
+    path.write_text(json.dumps({"provider": "codex", "daily": daily}), encoding="utf-8")
+    outputs = [
+        subprocess.run(
+            [sys.executable, os.path.join(SCRIPTS, script), "--input", str(path), "--format", "json"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for script in ("model_usage.py", "model_usage_fast.py")
+    ]
+    assert outputs[0] == outputs[1]
+    assert json.loads(outputs[0])["model"] == "gpt-5"
@@ -0,0 +1,77 @@
+"""
+Checks for model_usage.py's streaming reader, run with `python -m pytest skills/model-usage/scripts`.
+
+`stream_daily_entries` must yield exactly what loading the whole payload with
+`select_provider` + `parse_daily_entries` returns, however the text is chunked.
+"""
+
+import io
+import json
+
+import pytest
+
+from model_usage import parse_daily_entries, select_provider, stream_daily_entries
+
+
+class ChunkedReader(io.StringIO):
+    """Hands out at most `limit` characters per read, to split tokens across chunks."""
+
+    def __init__(self, text, limit):
+        super().__init__(text)
+        self.limit = limit
+
+    def read(self, size=-1):
+        return super().read(self.limit if size < 0 else min(size, self.limit))
+
+
+def day(date, *costs, **extra):
+    return {"date": date, "modelBreakdowns": [{"modelName": m, "cost": c} for m, c in costs], **extra}
+
+
+CODEX = {
+    "provider": "codex",
+    "totals": {"nested": [1, {"deep": [2, 3]}]},
+    "daily": [day("2026-01-01", ("gpt-5", 1234.5678)), "junk", day("2026-01-02", ("gpt-5-mini", 1e-3))],
+}
+CLAUDE = {"provider": "claude", "daily": [day("2026-01-03", ("opus", 7), modelsUsed=["opus"])]}
+DAILY_FIRST = {"daily": [day("2026-01-04", ("sonnet", 2.5))], "provider": "claude"}
+
+PAYLOADS = {
+    "list": [CODEX, CLAUDE],
+    "list-other-first": [{"provider": "gemini", "daily": [day("2026-01-05", ("pro", 9))]}, 42, CLAUDE, CODEX],
+    "object": CODEX,
+    "object-daily-first": DAILY_FIRST,
+    "list-daily-first": [CODEX, DAILY_FIRST],
+    "no-daily": {"provider": "codex"},
+    "empty-daily": [{"provider": "codex", "daily": []}, CODEX],
+}
+
+
+def loaded(payload, provider, require_match):
+    try:
+        return parse_daily_entries(select_provider(payload, provider, require_match))
+    except RuntimeError as exc:
+        return str(exc)
+
+
+def streamed(text, provider, require_match, limit):
+    try:
+        return list(stream_daily_entries(ChunkedReader(text, limit), provider, require_match))
+    except RuntimeError as exc:
+        return str(exc)
+
+
+@pytest.mark.parametrize("name", PAYLOADS)
+@pytest.mark.parametrize("provider", ["codex", "claude"])
+@pytest.mark.parametrize("require_match", [False, True])
+@pytest.mark.parametrize("limit", [1, 7, 1 << 16])
+def test_streamed_rows_match_loaded_rows(name, provider, require_match, limit):
+    payload = PAYLOADS[name]
+    text = json.dumps(payload, indent=1 if limit == 7 else None)
+    assert streamed(text, provider, require_match, limit) == loaded(payload, provider, require_match)
+
+
+@pytest.mark.parametrize("text", ['[{"provider": "codex", "daily": [{"date": "2026-01-01"', "", '"codex"'])
+def test_truncated_or_unsupported_input_raises(text):
+    with pytest.raises(RuntimeError):
+        list(stream_daily_entries(io.StringIO(text), "codex"))
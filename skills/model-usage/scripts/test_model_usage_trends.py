@@ -0,0 +1,85 @@
+"""
+Checks for model_usage.py's `--mode trends`, run with `python -m pytest skills/model-usage/scripts`.
+
+Every figure is compared with a direct per-day sum over the raw entries.
+"""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from model_usage import CostColumns, UsageIndex, build_json_trends
+
+AS_OF = date(2026, 3, 20)
+
+
+def random_entries(seed, days=90):
+    rng = random.Random(seed)
+    entries = []
+    for _ in range(200):
+        day = AS_OF - timedelta(days=rng.randrange(-5, days))
+        breakdowns = [{"modelName": rng.choice("abcd"), "cost": round(rng.random() * 5, 2)} for _ in range(rng.randrange(1, 3))]
+        entries.append({"date": day.isoformat(), "modelBreakdowns": breakdowns})
+    rng.shuffle(entries)
+    return entries
+
+
+def naive_total(entries, first, last, model=None):
+    return sum(
+        item["cost"]
+        for entry in entries
+        if first.isoformat() <= entry["date"] <= last.isoformat()
+        for item in entry["modelBreakdowns"]
+        if model is None or item["modelName"] == model
+    )
+
+
+def trends(entries, length):
+    columns = CostColumns.from_index(UsageIndex.build(entries, track_daily=True))
+    return build_json_trends("codex", columns, AS_OF, length)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_rolling_sums_match_direct_sums(seed):
+    entries = random_entries(seed)
+    report = trends(entries, 30)
+    for window in (7, 30):
+        series = report["rolling"][str(window)]
+        assert [point["date"] for point in series] == [(AS_OF - timedelta(days=29 - i)).isoformat() for i in range(30)]
+        for point in series:
+            last = date.fromisoformat(point["date"])
+            expected = naive_total(entries, last - timedelta(days=window - 1), last)
+            assert point["costUSD"] == pytest.approx(expected, abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_burn_rates_and_month_to_date_match_direct_sums(seed):
+    entries = random_entries(seed)
+    report = trends(entries, 7)
+    for window in (7, 30):
+        rates = report["burnRatePerDayUSD"][str(window)]
+        assert [item["costUSD"] for item in rates] == sorted((item["costUSD"] for item in rates), reverse=True)
+        for item in rates:
+            expected = naive_total(entries, AS_OF - timedelta(days=window - 1), AS_OF, item["model"]) / window
+            assert item["costUSD"] == pytest.approx(expected, abs=1e-9)
+    forecast = report["forecast"]
+    assert forecast["monthToDateUSD"] == pytest.approx(naive_total(entries, AS_OF.replace(day=1), AS_OF), abs=1e-9)
+
+
+def test_flat_spend_forecasts_the_same_daily_cost():
+    entries = [
+        {"date": (AS_OF - timedelta(days=i)).isoformat(), "modelBreakdowns": [{"modelName": "a", "cost": 2.0}]}
+        for i in range(60)
+    ]
+    forecast = trends(entries, 30)["forecast"]
+    assert forecast["dailyTrendUSD"] == pytest.approx(0.0, abs=1e-9)
+    assert forecast["monthToDateUSD"] == pytest.approx(40.0)
+    assert forecast["projectedRemainderUSD"] == pytest.approx(2.0 * 11)
+
+
+def test_empty_index_has_no_spend():
+    report = trends([], 7)
+    assert all(point["costUSD"] == 0 for point in report["rolling"]["7"])
+    assert report["burnRatePerDayUSD"] == {"7": [], "30": []}
+    assert report["forecast"]["projectedMonthEndUSD"] == 0
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # requires-python = ">=3.11,<3.14"
-# dependencies = ["podcastfy", "playwright", "audioop-lts", "replicate", "pydub", "httpx"]
+# dependencies = ["podcastfy==0.4.3", "playwright", "audioop-lts", "replicate", "pydub", "httpx"]
 # ///
 """Generate a podcast-style audio conversation from text, files, or URLs using Podcastfy.
 
@@ -10,14 +10,145 @@ Default: Gemini Flash for script generation + Edge TTS for voices (zero extra co
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from pathlib import Path
 
+# Replicate allows 6 prediction creates per minute with a burst of 1 on
+# low-credit accounts; raise with --minimax-rate/--minimax-burst on larger quotas
+MINIMAX_RATE_PER_MIN = 6
+MINIMAX_BURST = 1
+MINIMAX_WORKERS = 4
+
+# Same directory as minimax-voice/scripts/generate_speech.py, so one size cap covers both.
+# TTSCache is a copy of the class there and must stay identical to it
+# (test_generate_podcast.py compares the two).
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "openclaw" / "tts"
+DEFAULT_CACHE_MAX_MB = 512
+
+# Match <Person1>...</Person1> and <Person2>...</Person2> tags
+TURN_PATTERN = re.compile(r'<(Person[12])>\s*(.*?)\s*</\1>', re.DOTALL)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilling `rate` tokens per second up to `capacity`."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class TTSCache:
+    """Content-addressed audio cache in the directory podcast-gen and minimax-voice share.
+
+    Entries are named by the SHA-256 of the Replicate model and prediction input,
+    so repeated requests from one script hit the same file. The two scripts send
+    different models and inputs, so they never hit each other's entries, but they
+    do evict them: both carry a copy of this class, and the copies must keep the
+    same on-disk layout (<key>.<ext> files, dot-prefixed temporaries).
+
+    Reads refresh an entry's mtime. The directory is scanned on the first write
+    and its size is then tracked as entries are written; it is only scanned
+    again, evicting least recently used entries, once it grows past max_bytes.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.size = None  # bytes on disk as of the last scan, plus writes since
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(model_id, input_params):
+        blob = json.dumps({"model": model_id, "input": input_params}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def path(self, key, ext):
+        return self.directory / f"{key}.{ext}"
+
+    def get(self, key, ext):
+        """Return the cached file's path (marking it recently used), or None."""
+        path = self.path(key, ext)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key, ext, data):
+        """Store data atomically, evicting old entries if the directory outgrows max_bytes."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=self.directory)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        path = self.path(key, ext)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        os.replace(tmp_path, path)
+        with self.lock:
+            if self.size is None:
+                self.size = self._scan()[1]
+            else:
+                self.size += len(data) - replaced
+            if self.size > self.max_bytes:
+                self.evict()
+        return path
+
+    def _scan(self):
+        """List (mtime_ns, size, path) for every entry, with their total size."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(".") or not entry.is_file():
+                continue
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue  # evicted by a concurrent writer
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+            total += st.st_size
+        return entries, total
+
+    def evict(self):
+        """Delete least recently used entries until the directory fits in max_bytes."""
+        entries, total = self._scan()
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # evicted by a concurrent writer
+            total -= size
+        self.size = total
+
 
 def build_conversation_config(args):
     """Build a conversation_config dict from CLI arguments."""
@@ -106,9 +237,7 @@ def resolve_inputs(args):
 def parse_transcript_segments(transcript_text):
     """Parse <Person1> and <Person2> segments from Podcastfy transcript."""
     segments = []
-    # Match <Person1>...</Person1> and <Person2>...</Person2> tags
-    pattern = re.compile(r'<(Person[12])>\s*(.*?)\s*</\1>', re.DOTALL)
-    for match in pattern.finditer(transcript_text):
+    for match in TURN_PATTERN.finditer(transcript_text):
         speaker = match.group(1)
         text = match.group(2).strip()
         if text:
@@ -116,20 +245,26 @@ def parse_transcript_segments(transcript_text):
     return segments
 
 
-def minimax_tts_segment(text, voice, api_token, model="speech-02-hd", timeout=120, max_retries=5):
-    """Generate audio for a single text segment using MiniMax via Replicate."""
+def minimax_request(text, voice, model):
+    """Return the Replicate model ID and prediction input for one MiniMax segment."""
+    model_id = "minimax/speech-02-hd" if model == "speech-02-hd" else "minimax/speech-02-turbo"
+    return model_id, {"text": text, "voice_id": voice}
+
+
+def minimax_tts_segment(text, voice, api_token, model="speech-02-hd", timeout=120, max_retries=5, limiter=None):
+    """Generate audio for a single text segment using MiniMax via Replicate.
+
+    If a limiter (TokenBucket) is given, every prediction create waits for a token.
+    """
     import replicate
     import httpx
 
+    model_id, input_params = minimax_request(text, voice, model)
     for attempt in range(max_retries):
+        if limiter is not None:
+            limiter.acquire()
         try:
-            prediction = replicate.predictions.create(
-                model="minimax/speech-02-hd" if model == "speech-02-hd" else "minimax/speech-02-turbo",
-                input={
-                    "text": text,
-                    "voice_id": voice,
-                },
-            )
+            prediction = replicate.predictions.create(model=model_id, input=input_params)
             break
         except Exception as e:
             if "429" in str(e) or "throttled" in str(e).lower():
@@ -162,46 +297,395 @@ def minimax_tts_segment(text, voice, api_token, model="speech-02-hd", timeout=12
     return resp.content
 
 
-def generate_with_minimax(transcript_text, output_path, voice1, voice2, api_token, model="speech-02-hd"):
-    """Voice a Podcastfy transcript using MiniMax TTS and concatenate segments."""
-    from pydub import AudioSegment
+def synthesize_segments(jobs, voice1, voice2, api_token, model="speech-02-hd",
+                        rate_per_min=MINIMAX_RATE_PER_MIN, burst=MINIMAX_BURST, workers=MINIMAX_WORKERS,
+                        cache=None, on_done=None, limiter=None):
+    """Voice (index, speaker, text) jobs concurrently, returning the indices that succeeded.
+
+    Up to `workers` predictions are in flight at once; prediction creates share a
+    token bucket so the request rate stays within the Replicate quota. Pass
+    `limiter` to share a bucket with earlier requests; otherwise one is built
+    from rate_per_min and burst. Segments
+    found in the cache (a TTSCache) are not requested at all. on_done(index,
+    mp3 bytes) is called from this thread as each segment finishes, in
+    completion order; failed segments are reported and left out.
+    """
+    if limiter is None:
+        limiter = TokenBucket(rate_per_min / 60.0, burst)
+    total = len(jobs)
+    succeeded = set()
+    cached = set()
+
+    def voice_segment(i, speaker, text):
+        voice = voice1 if speaker == "Person1" else voice2
+        if cache is None:
+            return minimax_tts_segment(text, voice, api_token, model=model, limiter=limiter)
+        key = TTSCache.key(*minimax_request(text, voice, model))
+        hit = cache.get(key, "mp3")
+        if hit is not None:
+            cached.add(i)
+            return hit.read_bytes()
+        audio_data = minimax_tts_segment(text, voice, api_token, model=model, limiter=limiter)
+        try:
+            cache.put(key, "mp3", audio_data)
+        except OSError as e:
+            print(f"  WARNING: Could not cache segment {i+1}: {e}", file=sys.stderr)
+        return audio_data
 
-    segments = parse_transcript_segments(transcript_text)
-    if not segments:
-        raise ValueError("No <Person1>/<Person2> segments found in transcript")
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = {
+            pool.submit(voice_segment, i, speaker, text): (i, speaker, text)
+            for i, speaker, text in jobs
+        }
+        for future in as_completed(futures):
+            i, speaker, text = futures[future]
+            try:
+                audio_data = future.result()
+                if on_done is not None:
+                    on_done(i, audio_data)
+            except Exception as e:
+                print(f"  WARNING: Segment {i+1} failed: {e}", file=sys.stderr)
+                continue
+            succeeded.add(i)
+            source = "cached" if i in cached else "done"
+            print(f"  [{len(succeeded)}/{total}] segment {i+1} {speaker} ({len(text)} chars) {source}")
+    finally:
+        # On Ctrl-C, drop queued segments instead of voicing the rest of the episode
+        pool.shutdown(cancel_futures=True)
+    if cache is not None:
+        print(f"  {len(cached)}/{total} segments served from cache")
+    return succeeded
+
+
+class TurnStream:
+    """Pull complete <Person1>/<Person2> turns out of text that arrives in pieces."""
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, chunk):
+        """Add streamed text and return the markup of every turn it completed."""
+        self.buffer += chunk
+        turns = []
+        end = 0
+        for match in TURN_PATTERN.finditer(self.buffer):
+            turns.append(match.group(0))
+            end = match.end()
+        self.buffer = self.buffer[end:]
+        return turns
+
+
+class StreamingChain:
+    """Wraps a LangChain chain so invoke() streams, reporting each turn as it completes.
+
+    The text returned is the same as chain.invoke() would return.
+    """
+
+    def __init__(self, chain, on_turn):
+        self.chain = chain
+        self.on_turn = on_turn
+
+    def invoke(self, inputs, config=None, **kwargs):
+        turns = TurnStream()
+        parts = []
+        for chunk in self.chain.stream(inputs, config, **kwargs):
+            parts.append(chunk)
+            for turn in turns.feed(chunk):
+                self.on_turn(turn)
+        return "".join(parts)
+
+    def __getattr__(self, name):
+        return getattr(self.chain, name)
+
+
+def missing_pipeline_hooks():
+    """Name the podcastfy internals --pipeline patches that the installed version lacks."""
+    try:
+        from podcastfy import content_generator
+    except ImportError:
+        return ["podcastfy.content_generator"]
+    hooks = (
+        ("StandardContentStrategy", "generate"),
+        ("LongFormContentStrategy", "generate"),
+        ("ContentCleanerMixin", "_clean_tss_markup"),
+    )
+    return [
+        f"{cls_name}.{attr}" for cls_name, attr in hooks
+        if not hasattr(getattr(content_generator, cls_name, None), attr)
+    ]
 
-    print(f"  Voicing {len(segments)} dialogue segments with MiniMax...")
-    tmp_dir = Path(tempfile.mkdtemp(prefix="podcast-minimax-"))
-    audio_parts = []
 
-    for i, (speaker, text) in enumerate(segments):
-        voice = voice1 if speaker == "Person1" else voice2
-        print(f"  [{i+1}/{len(segments)}] {speaker} ({len(text)} chars)")
-        # Pace requests to stay within Replicate rate limits (6 req/min)
-        if i > 0:
-            time.sleep(11)
+@contextmanager
+def stream_podcastfy_turns(on_turn):
+    """While active, pass every turn podcastfy's LLM writes to on_turn as soon as it is complete.
+
+    Podcastfy only returns the finished transcript, so both of its content
+    strategies are temporarily handed a StreamingChain instead of their chain.
+    Check missing_pipeline_hooks() first; these are podcastfy 0.4.3 internals.
+    """
+    from podcastfy.content_generator import LongFormContentStrategy, StandardContentStrategy
+
+    originals = {}
+    for strategy_cls in (StandardContentStrategy, LongFormContentStrategy):
+        original = strategy_cls.generate
+        originals[strategy_cls] = original
+
+        def generate(self, chain, *args, _original=original, **kwargs):
+            return _original(self, StreamingChain(chain, on_turn), *args, **kwargs)
+
+        strategy_cls.generate = generate
+    try:
+        yield
+    finally:
+        for strategy_cls, original in originals.items():
+            strategy_cls.generate = original
+
+
+def clean_turn(turn_markup):
+    """Apply podcastfy's transcript markup cleaning to a single turn."""
+    from podcastfy.content_generator import ContentCleanerMixin
+
+    return ContentCleanerMixin._clean_tss_markup(turn_markup)
+
+
+class TurnPrefetcher:
+    """Voice turns into the TTS cache while the LLM is still writing the script.
+
+    Turns are only cached: the finished transcript still decides what the
+    episode contains, and generate_with_minimax picks prefetched turns up as
+    cache hits. Turns that fail here are logged and retried by that final pass,
+    which must be given the same limiter so both stay within one quota.
+    """
+
+    def __init__(self, voice1, voice2, api_token, model, cache, limiter, workers=MINIMAX_WORKERS):
+        self.voice1 = voice1
+        self.voice2 = voice2
+        self.api_token = api_token
+        self.model = model
+        self.cache = cache
+        self.limiter = limiter
+        self.pool = ThreadPoolExecutor(max_workers=max(1, workers))
+        self.seen = set()
+        self.futures = []
+
+    def add_turn(self, turn_markup):
+        """Queue a completed turn for synthesis unless the same request is already queued."""
+        for speaker, text in parse_transcript_segments(clean_turn(turn_markup)):
+            voice = self.voice1 if speaker == "Person1" else self.voice2
+            key = TTSCache.key(*minimax_request(text, voice, self.model))
+            if key in self.seen:
+                continue
+            self.seen.add(key)
+            n = len(self.futures) + 1
+            self.futures.append(self.pool.submit(self._voice, n, key, text, voice))
+            print(f"  [pipeline] queued turn {n} {speaker} ({len(text)} chars)")
+
+    def _voice(self, n, key, text, voice):
         try:
-            audio_data = minimax_tts_segment(text, voice, api_token, model=model)
-            seg_path = tmp_dir / f"seg_{i:04d}.mp3"
-            seg_path.write_bytes(audio_data)
-            audio_seg = AudioSegment.from_file(str(seg_path))
-            # Add a small pause between speakers
-            audio_parts.append(audio_seg)
-            audio_parts.append(AudioSegment.silent(duration=400))  # 400ms pause
+            if self.cache.get(key, "mp3") is None:
+                audio_data = minimax_tts_segment(text, voice, self.api_token, model=self.model, limiter=self.limiter)
+                self.cache.put(key, "mp3", audio_data)
         except Exception as e:
-            print(f"  WARNING: Segment {i+1} failed: {e}", file=sys.stderr)
-            continue
+            print(f"  [pipeline] WARNING: turn {n} failed, leaving it to the final pass: {e}", file=sys.stderr)
+            raise
+
+    def finish(self, cancel=False):
+        """Wait for queued turns (or drop them if cancel) and report how many were voiced."""
+        self.pool.shutdown(wait=True, cancel_futures=cancel)
+        voiced = sum(1 for future in self.futures if not future.cancelled() and future.exception() is None)
+        print(f"  [pipeline] voiced {voiced}/{len(self.futures)} turns while the script was written")
+
+
+class RenderCheckpoint:
+    """Voiced segments of one MiniMax render, kept in a work directory for --resume.
 
-    if not audio_parts:
-        raise RuntimeError("No audio segments were generated")
+    manifest.json maps each finished segment's index to its request key
+    (TTSCache.key), so a resumed render only reuses a segment whose text,
+    voice and model are unchanged. The transcript is saved alongside so a
+    resumed run does not ask the LLM for a new one.
+    """
 
-    # Concatenate all segments
-    combined = audio_parts[0]
-    for part in audio_parts[1:]:
-        combined += part
+    VERSION = 1
 
-    # Export
-    combined.export(str(output_path), format="mp3", bitrate="128k")
+    def __init__(self, work_dir):
+        self.work_dir = Path(work_dir)
+        self.manifest_path = self.work_dir / "manifest.json"
+        self.transcript_path = self.work_dir / "transcript.txt"
+        self.segments = {}
+
+    def load(self):
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(manifest, dict) and manifest.get("version") == self.VERSION:
+            self.segments = manifest.get("segments", {})
+
+    def save(self):
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"version": self.VERSION, "segments": self.segments}), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def segment_path(self, i):
+        return self.work_dir / f"seg_{i:04d}.mp3"
+
+    def is_done(self, i, key):
+        return self.segments.get(str(i)) == key and self.segment_path(i).exists()
+
+    def record(self, i, key, audio_data):
+        """Write a finished segment and add it to the manifest."""
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_path(i).write_bytes(audio_data)
+        self.segments[str(i)] = key
+        self.save()
+
+    def save_transcript(self, transcript_text):
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.transcript_path.write_text(transcript_text, encoding="utf-8")
+
+    def saved_progress(self):
+        """Describe what an earlier render left in the work directory, or None if nothing."""
+        parts = []
+        if self.work_dir.is_dir():
+            segments = sum(1 for _ in self.work_dir.glob("seg_*.mp3"))
+            if segments:
+                parts.append(f"{segments} voiced segment(s)")
+        if self.transcript_path.exists():
+            parts.append("a saved transcript")
+        return ", ".join(parts) or None
+
+    def clear(self):
+        """Remove everything this render wrote, leaving unrelated files alone."""
+        self.segments = {}
+        if not self.work_dir.is_dir():
+            return
+        for path in self.work_dir.glob("seg_*.mp3"):
+            path.unlink()
+        for path in (self.manifest_path, self.transcript_path):
+            path.unlink(missing_ok=True)
+        try:
+            self.work_dir.rmdir()
+        except OSError:
+            pass
+
+
+class Mp3StreamWriter:
+    """Encode segments to MP3 incrementally by piping raw PCM into ffmpeg.
+
+    The stream format comes from the first segment and later ones are converted
+    to match. Only the segment being written is held in memory, and pauses are
+    written as zero samples instead of being built as AudioSegments. Output goes
+    to a .part file that replaces output_path once encoding succeeds.
+    """
+
+    def __init__(self, output_path, bitrate="128k", pause_ms=400):
+        self.output_path = Path(output_path)
+        self.tmp_path = self.output_path.with_name(f".{self.output_path.name}.part")
+        self.bitrate = bitrate
+        self.pause_ms = pause_ms
+        self.encoder = None
+        self.segments = 0
+
+    def _start(self, frame_rate, channels):
+        from pydub.utils import get_encoder_name
+
+        self.frame_rate = frame_rate
+        self.channels = channels
+        self.pause = bytes(frame_rate * self.pause_ms // 1000 * channels * 2)
+        self.encoder = subprocess.Popen(
+            [get_encoder_name(), "-y", "-loglevel", "error",
+             "-f", "s16le", "-ar", str(frame_rate), "-ac", str(channels), "-i", "pipe:0",
+             "-b:a", self.bitrate, "-f", "mp3", str(self.tmp_path)],
+            stdin=subprocess.PIPE,
+        )
+
+    def add(self, audio_seg):
+        """Append one decoded segment followed by a pause."""
+        if self.encoder is None:
+            self._start(audio_seg.frame_rate, audio_seg.channels)
+        audio_seg = audio_seg.set_frame_rate(self.frame_rate).set_channels(self.channels).set_sample_width(2)
+        self.encoder.stdin.write(audio_seg.raw_data)
+        self.encoder.stdin.write(self.pause)
+        self.segments += 1
+
+    def close(self):
+        """Finish encoding and move the file into place."""
+        if self.encoder is None:
+            raise RuntimeError("No audio segments were generated")
+        self.encoder.stdin.close()
+        if self.encoder.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {self.encoder.returncode} encoding {self.output_path}")
+        os.replace(self.tmp_path, self.output_path)
+
+    def abort(self):
+        if self.encoder is not None:
+            self.encoder.kill()
+            self.encoder.wait()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+def generate_with_minimax(transcript_text, output_path, voice1, voice2, api_token, model="speech-02-hd",
+                          rate_per_min=MINIMAX_RATE_PER_MIN, burst=MINIMAX_BURST, workers=MINIMAX_WORKERS,
+                          cache=None, checkpoint=None, limiter=None):
+    """Voice a Podcastfy transcript using MiniMax TTS and concatenate segments.
+
+    Finished segments are recorded in the checkpoint (a RenderCheckpoint) as they
+    arrive; segments it already holds are not voiced again. The checkpoint is
+    cleared once every segment made it into the output.
+    """
+    from pydub import AudioSegment
+
+    segments = parse_transcript_segments(transcript_text)
+    if not segments:
+        raise ValueError("No <Person1>/<Person2> segments found in transcript")
+
+    if checkpoint is None:
+        checkpoint = RenderCheckpoint(tempfile.mkdtemp(prefix="podcast-minimax-"))
+    keys = [
+        TTSCache.key(*minimax_request(text, voice1 if speaker == "Person1" else voice2, model))
+        for speaker, text in segments
+    ]
+    jobs = [(i, speaker, text) for i, (speaker, text) in enumerate(segments) if not checkpoint.is_done(i, keys[i])]
+    if len(jobs) < len(segments):
+        print(f"  Resuming: {len(segments) - len(jobs)}/{len(segments)} segments already voiced "
+              f"in {checkpoint.work_dir}")
+
+    print(f"  Voicing {len(jobs)} dialogue segments with MiniMax "
+          f"({workers} in flight, {rate_per_min:g} req/min)...")
+    synthesize_segments(
+        jobs, voice1, voice2, api_token, model=model,
+        rate_per_min=rate_per_min, burst=burst, workers=workers, cache=cache, limiter=limiter,
+        on_done=lambda i, audio_data: checkpoint.record(i, keys[i], audio_data),
+    )
+
+    # Stream segments to the encoder in transcript order, one decoded at a time,
+    # with a small pause after each speaker
+    writer = Mp3StreamWriter(output_path, bitrate="128k", pause_ms=400)
+    missing = 0
+    try:
+        for i in range(len(segments)):
+            if not checkpoint.is_done(i, keys[i]):
+                missing += 1
+                continue
+            try:
+                audio_seg = AudioSegment.from_file(str(checkpoint.segment_path(i)))
+            except Exception as e:
+                print(f"  WARNING: Segment {i+1} failed: {e}", file=sys.stderr)
+                missing += 1
+                continue
+            writer.add(audio_seg)
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+
+    if missing:
+        print(f"  WARNING: {missing} segment(s) missing from {output_path}; "
+              f"re-run with --resume to retry them", file=sys.stderr)
+    else:
+        checkpoint.clear()
     return output_path
 
 
@@ -264,6 +748,46 @@ def main():
         choices=["speech-02-hd", "speech-02-turbo"],
         help="MiniMax model variant (default: speech-02-turbo for fast; speech-02-hd for studio)"
     )
+    parser.add_argument(
+        "--minimax-rate", type=float, default=MINIMAX_RATE_PER_MIN,
+        help=f"MiniMax prediction requests per minute (default: {MINIMAX_RATE_PER_MIN}, Replicate's low-credit quota)"
+    )
+    parser.add_argument(
+        "--minimax-burst", type=int, default=MINIMAX_BURST,
+        help=f"Requests allowed back-to-back before --minimax-rate applies (default: {MINIMAX_BURST})"
+    )
+    parser.add_argument(
+        "--minimax-workers", type=int, default=MINIMAX_WORKERS,
+        help=f"MiniMax segments synthesized concurrently (default: {MINIMAX_WORKERS})"
+    )
+    parser.add_argument(
+        "--cache-dir", type=str, default=str(DEFAULT_CACHE_DIR),
+        help=f"MiniMax segment cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--cache-max-mb", type=int, default=DEFAULT_CACHE_MAX_MB,
+        help=f"Evict least recently used cache entries beyond this size (default: {DEFAULT_CACHE_MAX_MB})"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Synthesize every MiniMax segment, bypassing the cache"
+    )
+    parser.add_argument(
+        "--work-dir", type=str,
+        help="Where MiniMax segments are kept until the episode is done (default: .<filename>.segments next to the output)"
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Continue an interrupted MiniMax render, reusing its transcript and voiced segments"
+    )
+    parser.add_argument(
+        "--discard-progress", action="store_true",
+        help="Delete an interrupted MiniMax render's saved progress and start over"
+    )
+    parser.add_argument(
+        "--pipeline", action="store_true",
+        help="Start voicing MiniMax turns while the LLM is still writing the script"
+    )
 
     # LLM
     parser.add_argument(
@@ -303,6 +827,20 @@ def main():
 
     args = parser.parse_args()
 
+    if args.minimax_rate <= 0 or args.minimax_burst < 1 or args.minimax_workers < 1:
+        parser.error("--minimax-rate must be > 0, --minimax-burst and --minimax-workers >= 1")
+
+    if args.resume and args.tts != "minimax":
+        parser.error("--resume only applies to --tts minimax")
+    if args.discard_progress and args.tts != "minimax":
+        parser.error("--discard-progress only applies to --tts minimax")
+    if args.resume and args.discard_progress:
+        parser.error("--resume and --discard-progress are mutually exclusive")
+    if args.pipeline and args.tts != "minimax":
+        parser.error("--pipeline only applies to --tts minimax")
+    if args.pipeline and args.no_cache:
+        parser.error("--pipeline hands turns to the final render through the cache; drop --no-cache")
+
     # Validate at least one input
     if not args.text and not args.file and not args.url:
         parser.error("At least one input source is required (--text, --file, or --url)")
@@ -344,6 +882,23 @@ def main():
     output_path.parent.mkdir(parents=True, exist_ok=True)
     full_path = output_path.resolve()
 
+    # Never drop an interrupted MiniMax render without being told to
+    checkpoint = None
+    if args.tts == "minimax":
+        work_dir = Path(args.work_dir) if args.work_dir else full_path.with_name(f".{full_path.name}.segments")
+        checkpoint = RenderCheckpoint(work_dir)
+        if args.resume:
+            checkpoint.load()
+        else:
+            progress = checkpoint.saved_progress()
+            if progress and not args.discard_progress:
+                print(f"ERROR: {work_dir} holds an unfinished render ({progress}).", file=sys.stderr)
+                print("TIP: Re-run with --resume to continue it, or --discard-progress to start over.", file=sys.stderr)
+                sys.exit(1)
+            if progress:
+                print(f"Discarding unfinished render in {work_dir}: {progress}")
+            checkpoint.clear()
+
     print(f"Generating podcast...")
     print(f"  LLM: {args.llm_model}")
     print(f"  TTS: {args.tts}")
@@ -379,7 +934,43 @@ def main():
         if args.transcript_only or use_minimax:
             kwargs["transcript_only"] = True
 
-        audio_file = generate_podcast(**kwargs)
+        if use_minimax:
+            voice1 = args.voice1 or "English_ManWithDeepVoice"
+            voice2 = args.voice2 or "Wise_Woman"
+            api_token = os.environ.get("REPLICATE_API_TOKEN", "")
+            mm_model = args.minimax_model
+            cache = None
+            if not args.no_cache:
+                cache = TTSCache(Path(args.cache_dir).expanduser(), args.cache_max_mb * 1024 * 1024)
+            # One bucket for the pipeline and the final render, so together they stay within the quota
+            limiter = TokenBucket(args.minimax_rate / 60.0, args.minimax_burst)
+
+        resuming = checkpoint is not None and args.resume and checkpoint.transcript_path.exists()
+        pipeline = use_minimax and args.pipeline and not resuming
+        if pipeline:
+            missing = missing_pipeline_hooks()
+            if missing:
+                print(f"  WARNING: installed podcastfy lacks {', '.join(missing)}; "
+                      f"generating the script before voicing it", file=sys.stderr)
+                pipeline = False
+
+        if resuming:
+            print(f"  Resuming from saved transcript: {checkpoint.transcript_path}")
+            audio_file = str(checkpoint.transcript_path)
+        elif pipeline:
+            print("  Pipeline: voicing turns as the script is written")
+            prefetcher = TurnPrefetcher(
+                voice1, voice2, api_token, mm_model, cache, limiter, workers=args.minimax_workers,
+            )
+            try:
+                with stream_podcastfy_turns(prefetcher.add_turn):
+                    audio_file = generate_podcast(**kwargs)
+            except BaseException:
+                prefetcher.finish(cancel=True)
+                raise
+            prefetcher.finish()
+        else:
+            audio_file = generate_podcast(**kwargs)
 
         if args.transcript_only and not use_minimax:
             print(f"\nTranscript generated.")
@@ -406,6 +997,8 @@ def main():
                 sys.exit(1)
 
             transcript_text = Path(transcript_path).read_text(encoding="utf-8")
+            if checkpoint is not None and Path(transcript_path) != checkpoint.transcript_path:
+                checkpoint.save_transcript(transcript_text)
 
             # Save transcript if requested
             if args.save_transcript:
@@ -414,16 +1007,14 @@ def main():
                 print(f"Transcript saved: {args.save_transcript}")
 
             # Voice with MiniMax
-            voice1 = args.voice1 or "English_ManWithDeepVoice"
-            voice2 = args.voice2 or "Wise_Woman"
-            api_token = os.environ.get("REPLICATE_API_TOKEN", "")
-            mm_model = args.minimax_model
             print(f"  Voice 1 (host): {voice1}")
             print(f"  Voice 2 (co-host): {voice2}")
             print(f"  Model: {mm_model}")
 
             generate_with_minimax(
-                transcript_text, full_path, voice1, voice2, api_token, model=mm_model
+                transcript_text, full_path, voice1, voice2, api_token, model=mm_model,
+                rate_per_min=args.minimax_rate, burst=args.minimax_burst, workers=args.minimax_workers,
+                cache=cache, checkpoint=checkpoint, limiter=limiter,
             )
         else:
             if not audio_file or not Path(audio_file).exists():
@@ -452,9 +1043,13 @@ def main():
 
     except KeyboardInterrupt:
         print("\nCancelled.", file=sys.stderr)
+        if checkpoint is not None and checkpoint.manifest_path.exists():
+            print(f"Progress saved in {checkpoint.work_dir}; re-run with --resume to continue.", file=sys.stderr)
         sys.exit(130)
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
+        if checkpoint is not None and checkpoint.manifest_path.exists():
+            print(f"Progress saved in {checkpoint.work_dir}; re-run with --resume to continue.", file=sys.stderr)
         sys.exit(1)
 
 
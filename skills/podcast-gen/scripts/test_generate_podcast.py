@@ -0,0 +1,342 @@
+"""
+Checks for generate_podcast.py, run with `python -m pytest skills/podcast-gen/scripts`.
+
+Only the parts that need no network are covered: podcastfy, Replicate and
+pydub are imported lazily by the script and are not needed here.
+"""
+
+import ast
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import generate_podcast
+from generate_podcast import RenderCheckpoint, TokenBucket, TTSCache, TurnStream
+
+SPEECH_SCRIPT = Path(__file__).resolve().parents[2] / "minimax-voice" / "scripts" / "generate_speech.py"
+
+
+def class_source(path, name):
+    source = path.read_text(encoding="utf-8")
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef) and node.name == name:
+            return ast.get_source_segment(source, node)
+    raise AssertionError(f"{name} not found in {path}")
+
+
+def test_tts_cache_matches_minimax_voice_copy():
+    # Both skills evict each other's files, so the copies must not drift.
+    assert class_source(Path(generate_podcast.__file__), "TTSCache") == class_source(SPEECH_SCRIPT, "TTSCache")
+
+
+def test_tts_cache_round_trip(tmp_path):
+    cache = TTSCache(tmp_path, 1 << 20)
+    key = TTSCache.key("minimax/speech-02-hd", {"text": "hi", "voice_id": "Wise_Woman"})
+    assert key == TTSCache.key("minimax/speech-02-hd", {"voice_id": "Wise_Woman", "text": "hi"})
+    assert cache.get(key, "mp3") is None
+    cache.put(key, "mp3", b"audio")
+    assert cache.get(key, "mp3").read_bytes() == b"audio"
+    assert [name for name in os.listdir(tmp_path) if name.startswith(".")] == []
+
+
+def test_tts_cache_evicts_least_recently_used(tmp_path):
+    cache = TTSCache(tmp_path, 35)
+    for i, name in enumerate(("a", "b", "c")):
+        cache.put(name, "mp3", b"x" * 10)
+        os.utime(cache.path(name, "mp3"), ns=(i * 10**9, i * 10**9))
+    cache.get("a", "mp3")  # now the most recently used
+    cache.put("d", "mp3", b"x" * 10)
+    assert sorted(os.listdir(tmp_path)) == ["a.mp3", "c.mp3", "d.mp3"]
+    assert cache.size == 30
+
+
+def test_tts_cache_scans_only_when_over_budget(tmp_path, monkeypatch):
+    cache = TTSCache(tmp_path, 1000)
+    scans = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(generate_podcast.os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+    for i in range(20):
+        cache.put(f"k{i}", "mp3", b"x" * 10)
+    assert len(scans) == 1  # the first write learns the directory size
+    cache.put("k0", "mp3", b"x" * 20)  # replacing an entry only adds the difference
+    assert cache.size == 210
+    cache.put("big", "mp3", b"x" * 900)
+    assert len(scans) == 2
+    assert cache.size <= 1000
+
+
+class FakeClock:
+    """Stands in for the `time` module so rate limits can be checked without waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def monotonic(self):
+        with self.lock:
+            return self.now
+
+    time = monotonic
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+def test_token_bucket_spaces_requests_after_the_burst(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(generate_podcast, "time", clock)
+    bucket = TokenBucket(rate=0.5, capacity=2)
+    stamps = []
+    for _ in range(5):
+        bucket.acquire()
+        stamps.append(clock.now)
+    assert stamps == pytest.approx([0, 0, 2, 4, 6])
+
+
+def test_synthesize_segments_limits_workers_and_skips_cached(tmp_path, monkeypatch):
+    cache = TTSCache(tmp_path, 1 << 20)
+    cache.put(TTSCache.key(*generate_podcast.minimax_request("cached", "v1", "speech-02-hd")), "mp3", b"hit")
+    active, peak, requested = [0], [0], []
+    lock = threading.Lock()
+
+    def fake_segment(text, voice, api_token, model="speech-02-hd", limiter=None):
+        limiter.acquire()
+        with lock:
+            requested.append(text)
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        threading.Event().wait(0.02)
+        with lock:
+            active[0] -= 1
+        if text == "boom":
+            raise RuntimeError("prediction failed")
+        return f"{voice}:{text}".encode()
+
+    monkeypatch.setattr(generate_podcast, "minimax_tts_segment", fake_segment)
+    jobs = [(0, "Person1", "cached")]
+    jobs += [(i, f"Person{i % 2 + 1}", f"turn {i}") for i in range(1, 8)]
+    jobs += [(8, "Person1", "boom")]
+    done = {}
+    succeeded = generate_podcast.synthesize_segments(
+        jobs, "v1", "v2", "token", rate_per_min=60_000, burst=10, workers=3, cache=cache, on_done=done.__setitem__
+    )
+    assert succeeded == set(range(8))
+    assert done[0] == b"hit" and done[1] == b"v2:turn 1" and done[2] == b"v1:turn 2"
+    assert "cached" not in requested
+    assert 1 < peak[0] <= 3
+    assert cache.get(TTSCache.key(*generate_podcast.minimax_request("turn 3", "v2", "speech-02-hd")), "mp3") is not None
+
+
+def test_checkpoint_round_trip_and_key_check(tmp_path):
+    work = tmp_path / "render"
+    checkpoint = RenderCheckpoint(work)
+    assert checkpoint.saved_progress() is None
+    checkpoint.record(0, "key-0", b"zero")
+    checkpoint.record(2, "key-2", b"two")
+    checkpoint.save_transcript("<Person1>Hi</Person1>")
+
+    resumed = RenderCheckpoint(work)
+    resumed.load()
+    assert resumed.is_done(0, "key-0") and resumed.is_done(2, "key-2")
+    assert not resumed.is_done(0, "other-key")  # text, voice or model changed
+    assert not resumed.is_done(1, "key-1")
+    resumed.segment_path(2).unlink()
+    assert not resumed.is_done(2, "key-2")
+    assert resumed.saved_progress() == "1 voiced segment(s), a saved transcript"
+
+
+def test_checkpoint_ignores_other_manifest_versions(tmp_path):
+    checkpoint = RenderCheckpoint(tmp_path)
+    checkpoint.record(0, "key-0", b"zero")
+    checkpoint.manifest_path.write_text('{"version": 99, "segments": {"0": "key-0"}}', encoding="utf-8")
+    resumed = RenderCheckpoint(tmp_path)
+    resumed.load()
+    assert not resumed.is_done(0, "key-0")
+
+
+def test_checkpoint_clear_leaves_unrelated_files(tmp_path):
+    work = tmp_path / "render"
+    checkpoint = RenderCheckpoint(work)
+    checkpoint.record(0, "key-0", b"zero")
+    checkpoint.save_transcript("text")
+    (work / "notes.txt").write_text("keep me", encoding="utf-8")
+    checkpoint.clear()
+    assert sorted(os.listdir(work)) == ["notes.txt"]
+    (work / "notes.txt").unlink()
+    checkpoint.record(0, "key-0", b"zero")
+    checkpoint.clear()
+    assert not work.exists()
+
+
+class FakeSegment:
+    """Decoded audio as Mp3StreamWriter sees it: 16-bit PCM plus its format."""
+
+    def __init__(self, raw_data, frame_rate=8000, channels=1):
+        self.raw_data = raw_data
+        self.frame_rate = frame_rate
+        self.channels = channels
+
+    def set_frame_rate(self, frame_rate):
+        assert frame_rate == self.frame_rate
+        return self
+
+    def set_channels(self, channels):
+        assert channels == self.channels
+        return self
+
+    def set_sample_width(self, width):
+        return self
+
+
+@pytest.fixture
+def stub_ffmpeg(tmp_path, monkeypatch):
+    """An "ffmpeg" that copies its PCM input to the output path; STUB_FFMPEG_EXIT makes it fail."""
+    pydub_utils = pytest.importorskip("pydub.utils")
+    script = tmp_path / "bin" / "ffmpeg"
+    script.parent.mkdir()
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import os, shutil, sys\n"
+        "with open(sys.argv[-1], 'wb') as out:\n"
+        "    shutil.copyfileobj(sys.stdin.buffer, out)\n"
+        "with open(sys.argv[-1] + '.args', 'w') as out:\n"
+        "    out.write(' '.join(sys.argv[1:]))\n"
+        "sys.exit(int(os.environ.get('STUB_FFMPEG_EXIT', '0')))\n",
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    monkeypatch.setattr(pydub_utils, "get_encoder_name", lambda: str(script))
+    return script
+
+
+def test_resumed_render_only_voices_missing_segments(tmp_path, monkeypatch, stub_ffmpeg):
+    import pydub
+
+    decode = classmethod(lambda cls, path: FakeSegment(Path(path).read_bytes()))
+    monkeypatch.setattr(pydub.AudioSegment, "from_file", decode)
+    requested = []
+    fail = {"Second"}
+
+    def fake_segment(text, voice, api_token, model="speech-02-hd", limiter=None):
+        requested.append(text)
+        if text in fail:
+            raise RuntimeError("prediction failed")
+        return text.encode()
+
+    monkeypatch.setattr(generate_podcast, "minimax_tts_segment", fake_segment)
+    transcript = "<Person1>First</Person1><Person2>Second</Person2><Person1>Third</Person1>"
+    work = tmp_path / "render"
+    output = tmp_path / "episode.mp3"
+
+    def render():
+        checkpoint = RenderCheckpoint(work)
+        checkpoint.load()
+        generate_podcast.generate_with_minimax(
+            transcript, output, "v1", "v2", "token", rate_per_min=60_000, burst=10, checkpoint=checkpoint
+        )
+
+    render()
+    assert sorted(requested) == ["First", "Second", "Third"]
+    assert output.read_bytes().startswith(b"First") and b"Second" not in output.read_bytes()
+    assert work.is_dir()  # kept for --resume
+
+    requested.clear()
+    fail.clear()
+    render()
+    assert requested == ["Second"]
+    pause = bytes(8000 * 400 // 1000 * 2)
+    assert output.read_bytes() == pause.join([b"First", b"Second", b"Third"]) + pause
+    assert not work.exists()  # cleared once every segment made it in
+
+
+def test_mp3_writer_streams_pcm_with_pauses(tmp_path, stub_ffmpeg):
+    output = tmp_path / "out.mp3"
+    writer = generate_podcast.Mp3StreamWriter(output, bitrate="96k", pause_ms=250)
+    writer.add(FakeSegment(b"\x01\x00" * 10, frame_rate=16000, channels=2))
+    writer.add(FakeSegment(b"\x02\x00" * 5, frame_rate=16000, channels=2))
+    assert not output.exists()
+    writer.close()
+    pause = bytes(16000 * 250 // 1000 * 2 * 2)
+    assert output.read_bytes() == b"\x01\x00" * 10 + pause + b"\x02\x00" * 5 + pause
+    assert not writer.tmp_path.exists()
+    args = Path(str(writer.tmp_path) + ".args").read_text(encoding="utf-8").split()
+    assert args[args.index("-ar") + 1] == "16000" and args[args.index("-ac") + 1] == "2"
+    assert args[args.index("-b:a") + 1] == "96k"
+
+
+def test_mp3_writer_failure_keeps_previous_output(tmp_path, stub_ffmpeg, monkeypatch):
+    output = tmp_path / "out.mp3"
+    output.write_bytes(b"previous episode")
+    monkeypatch.setenv("STUB_FFMPEG_EXIT", "1")
+    writer = generate_podcast.Mp3StreamWriter(output)
+    writer.add(FakeSegment(b"\x00\x00"))
+    with pytest.raises(RuntimeError, match="ffmpeg exited with status 1"):
+        writer.close()
+    assert output.read_bytes() == b"previous episode"
+
+    writer = generate_podcast.Mp3StreamWriter(output)
+    writer.add(FakeSegment(b"\x00\x00"))
+    writer.abort()
+    assert not writer.tmp_path.exists()
+    assert output.read_bytes() == b"previous episode"
+
+
+def test_mp3_writer_needs_a_segment(tmp_path):
+    with pytest.raises(RuntimeError, match="No audio segments"):
+        generate_podcast.Mp3StreamWriter(tmp_path / "out.mp3").close()
+
+
+TRANSCRIPT = "<Person1>Welcome to the show.</Person1>\n<Person2>Glad to be\nhere.</Person2><Person1>Let's begin.</Person1>"
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, len(TRANSCRIPT)])
+def test_turn_stream_yields_each_turn_once_complete(size):
+    stream = TurnStream()
+    turns = []
+    for start in range(0, len(TRANSCRIPT), size):
+        turns += stream.feed(TRANSCRIPT[start : start + size])
+    assert turns == [match.group(0) for match in generate_podcast.TURN_PATTERN.finditer(TRANSCRIPT)]
+    assert len(turns) == 3
+
+
+def test_streaming_chain_returns_what_invoke_would():
+    class FakeChain:
+        temperature = 0.7
+
+        def stream(self, inputs, config=None, **kwargs):
+            assert inputs == {"topic": "x"}
+            for start in range(0, len(TRANSCRIPT), 5):
+                yield TRANSCRIPT[start : start + 5]
+
+    seen = []
+    chain = generate_podcast.StreamingChain(FakeChain(), seen.append)
+    assert chain.invoke({"topic": "x"}) == TRANSCRIPT
+    assert len(seen) == 3
+    assert chain.temperature == 0.7
+
+
+def test_prefetcher_caches_each_distinct_turn_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(generate_podcast, "clean_turn", lambda markup: markup)
+    requested = []
+
+    def fake_segment(text, voice, api_token, model="speech-02-hd", limiter=None):
+        requested.append((text, voice))
+        if text == "Boom.":
+            raise RuntimeError("prediction failed")
+        return text.encode()
+
+    monkeypatch.setattr(generate_podcast, "minimax_tts_segment", fake_segment)
+    cache = TTSCache(tmp_path, 1 << 20)
+    prefetcher = generate_podcast.TurnPrefetcher("v1", "v2", "token", "speech-02-hd", cache, TokenBucket(1000, 10))
+    for turn in ["<Person1>Hello.</Person1>", "<Person2>Hello.</Person2>", "<Person1>Hello.</Person1>",
+                 "<Person2>Boom.</Person2>"]:
+        prefetcher.add_turn(turn)
+    prefetcher.finish()
+    assert sorted(requested) == [("Boom.", "v2"), ("Hello.", "v1"), ("Hello.", "v2")]
+    key = TTSCache.key(*generate_podcast.minimax_request("Hello.", "v2", "speech-02-hd"))
+    assert cache.get(key, "mp3").read_bytes() == b"Hello."
+    assert len(prefetcher.futures) == 3
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Skill Catalog Builder - Writes one compact JSON index of every skill under a root
+
+Usage:
+    python build_catalog.py <skills-root> [...] [--output PATH] [--force]
+
+Example:
+    python build_catalog.py skills
+    python build_catalog.py skills --output dist/skill-catalog.json
+
+Skills are keyed by folder name. Each entry records its path relative to the
+catalog file, its name, description and allowed-tools from the SKILL.md
+frontmatter, its packaged files (honoring .skillignore) with sizes and SHA-256
+hashes, and a content hash over all of them. Re-running updates
+the catalog in place: files whose size and mtime are unchanged are not read
+again, and skills with no changed files keep their previous entry.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from package_skill import file_digest, load_ignore_rules, walk_skill_files
+from quick_validate import find_skill_dirs, parse_frontmatter, read_frontmatter
+
+CATALOG_VERSION = 1
+DEFAULT_CATALOG_NAME = "skill-catalog.json"
+CATALOG_FIELDS = ("name", "description", "allowed-tools")
+
+
+def load_catalog(catalog_path):
+    """Load an existing catalog, or None if it is missing, unreadable or outdated."""
+    try:
+        with open(catalog_path, "r", encoding="utf-8") as handle:
+            catalog = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(catalog, dict) or catalog.get("version") != CATALOG_VERSION:
+        return None
+    return catalog
+
+
+def write_catalog(catalog_path, catalog):
+    catalog_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = catalog_path.with_name(catalog_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(catalog, handle, ensure_ascii=False, separators=(",", ":"), default=str)
+    os.replace(tmp_path, catalog_path)
+
+
+def scan_files(skill_path, previous_files):
+    """
+    List a skill's packaged files with their sizes and hashes.
+
+    Returns:
+        (files, changed) where files is a list of dicts sorted by path and
+        changed is False if every file matched the previous entry by size and mtime
+    """
+    previous = {entry["path"]: entry for entry in previous_files}
+    found, _ = walk_skill_files(skill_path, load_ignore_rules(skill_path))
+    files = []
+    changed = len(found) != len(previous)
+    for file_path, relative_path in sorted(found, key=lambda item: item[1]):
+        file_stat = file_path.stat()
+        entry = {"path": relative_path, "size": file_stat.st_size, "mtime_ns": file_stat.st_mtime_ns}
+        old = previous.get(relative_path)
+        if old and old["size"] == entry["size"] and old["mtime_ns"] == entry["mtime_ns"]:
+            entry["sha256"] = old["sha256"]
+        else:
+            entry["sha256"] = file_digest(file_path)
+            changed = True
+        files.append(entry)
+    return files, changed
+
+
+def content_hash(files):
+    """Hash of every file path and content hash, identifying one version of a skill."""
+    digest = hashlib.sha256()
+    for entry in files:
+        digest.update(f"{entry['path']}\0{entry['sha256']}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def describe_skill(skill_path, relative_path, files):
+    """Build the catalog entry for a skill from its frontmatter and file list."""
+    entry = {"path": relative_path, **dict.fromkeys(CATALOG_FIELDS)}
+    frontmatter_text, error = read_frontmatter(skill_path / "SKILL.md")
+    if not error:
+        try:
+            frontmatter = parse_frontmatter(frontmatter_text)
+        except Exception as e:  # yaml.YAMLError, or ImportError without PyYAML
+            error = f"Unreadable frontmatter: {e}"
+        else:
+            if isinstance(frontmatter, dict):
+                for field in CATALOG_FIELDS:
+                    entry[field] = frontmatter.get(field)
+            else:
+                error = "Frontmatter must be a YAML dictionary"
+    if error:
+        entry["error"] = error
+    entry["size"] = sum(file_entry["size"] for file_entry in files)
+    entry["sha256"] = content_hash(files)
+    entry["files"] = files
+    return entry
+
+
+def build_catalog(roots, catalog_path, force=False):
+    """
+    Build or incrementally update the catalog for every skill under roots.
+
+    Args:
+        roots: Skill folders, or roots containing skill folders
+        catalog_path: Where to write the JSON catalog
+        force: Rescan every skill, ignoring the existing catalog
+
+    Returns:
+        (catalog, stats) where stats counts added, updated, unchanged and removed
+        skills, and stats["written"] says whether the catalog file was rewritten
+    """
+    catalog_path = Path(catalog_path).resolve()
+    previous = {} if force else (load_catalog(catalog_path) or {}).get("skills", {})
+    base = catalog_path.parent
+    skills = {}
+    stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+
+    for skill_path in find_skill_dirs(roots):
+        key = skill_path.name
+        if key in skills:
+            print(f"[WARN] Skipping {skill_path}: another skill folder is already named '{key}'")
+            continue
+        relative_path = Path(os.path.relpath(skill_path, base)).as_posix()
+        old = previous.get(key)
+        if old and old.get("path") != relative_path:
+            old = None
+        files, changed = scan_files(skill_path, old["files"] if old else [])
+        if old and not changed:
+            skills[key] = old
+            stats["unchanged"] += 1
+            continue
+        skills[key] = describe_skill(skill_path, relative_path, files)
+        stats["updated" if old else "added"] += 1
+
+    stats["removed"] = len(set(previous) - set(skills))
+    catalog = {"version": CATALOG_VERSION, "skills": dict(sorted(skills.items()))}
+    stats["written"] = bool(stats["added"] or stats["updated"] or stats["removed"] or not catalog_path.exists())
+    if stats["written"]:
+        write_catalog(catalog_path, catalog)
+    return catalog, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write a compact JSON index of skill metadata, files and hashes.",
+    )
+    parser.add_argument("roots", nargs="+", help="Skill folders, or roots containing skill folders")
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_CATALOG_NAME,
+        help=f"Catalog file to write (default: ./{DEFAULT_CATALOG_NAME})",
+    )
+    parser.add_argument("--force", action="store_true", help="Rescan every skill from scratch")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        catalog, stats = build_catalog(args.roots, args.output, args.force)
+    except Exception as e:
+        print(f"[ERROR] Error building catalog: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    unreadable = [key for key, entry in catalog["skills"].items() if "error" in entry]
+    for key in unreadable:
+        print(f"[WARN] {key}: {catalog['skills'][key]['error']}")
+    outcome = "written to" if stats["written"] else "unchanged at"
+    print(
+        f"[OK] Catalog of {len(catalog['skills'])} skills {outcome} {args.output} "
+        f"({stats['added']} added, {stats['updated']} updated, {stats['unchanged']} unchanged, "
+        f"{stats['removed']} removed) in {elapsed:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
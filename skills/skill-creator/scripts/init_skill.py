@@ -4,21 +4,56 @@ Skill Initializer - Creates a new skill from template
 
 Usage:
     init_skill.py <skill-name> --path <path> [--resources scripts,references,assets] [--examples]
+    init_skill.py <skill-name> --path <path> --template <template-dir>
+    init_skill.py --batch <spec.json> [--jobs N]
 
 Examples:
     init_skill.py my-new-skill --path skills/public
     init_skill.py my-new-skill --path skills/public --resources scripts,references
     init_skill.py my-api-helper --path skills/private --resources scripts --examples
     init_skill.py custom-skill --path /custom/location
+    init_skill.py acme-search --path skills/public --template templates/provider
+    init_skill.py --batch providers.json
+
+Template directories are copied into the new skill. Files ending in .tmpl are
+rendered with string.Template (${skill_name}, ${skill_title} and any spec
+vars; write $$ for a literal $) and lose the suffix; path names are rendered
+too and all other files are copied verbatim.
+
+A batch spec is a JSON object. Top-level "path", "template", "resources",
+"examples" and "vars" are defaults that each entry of "skills" (a name, or an
+object with "name" and any of those keys) can override:
+
+    {
+      "path": "skills/public",
+      "template": "templates/provider",
+      "vars": {"vendor": "Acme"},
+      "skills": ["acme-search", {"name": "acme-mail", "vars": {"api": "mail"}}]
+    }
+
+Every template is loaded once, and all files of all skills are written from
+one process with a thread pool.
 """
 
 import argparse
+import json
+import os
 import re
 import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
 
 MAX_SKILL_NAME_LENGTH = 64
 ALLOWED_RESOURCES = {"scripts", "references", "assets"}
+TEMPLATE_SUFFIX = ".tmpl"
+SPEC_DEFAULTS = {"path": None, "template": None, "resources": "", "examples": False, "vars": {}}
+
+# path is a string.Template; render(variables) returns the file bytes, or
+# None for an empty directory; mode is the permission bits to set, if any
+TemplateFile = namedtuple("TemplateFile", ["path", "render", "mode"])
 
 SKILL_TEMPLATE = """---
 name: {skill_name}
@@ -252,7 +287,121 @@ def create_resource_dirs(skill_dir, skill_name, skill_title, resources, include_
                 print("[OK] Created assets/")
 
 
-def init_skill(skill_name, path, resources, include_examples):
+def check_skill_name(raw_skill_name):
+    """
+    Normalize a requested skill name and check its length.
+
+    Returns:
+        (skill_name, None) or (None, error_message)
+    """
+    skill_name = normalize_skill_name(raw_skill_name)
+    if not skill_name:
+        return None, "Skill name must include at least one letter or digit."
+    if len(skill_name) > MAX_SKILL_NAME_LENGTH:
+        return None, (
+            f"Skill name '{skill_name}' is too long ({len(skill_name)} characters). "
+            f"Maximum is {MAX_SKILL_NAME_LENGTH} characters."
+        )
+    return skill_name, None
+
+
+def _render_text(template):
+    return lambda variables: template.safe_substitute(variables).encode("utf-8")
+
+
+def _render_format(text):
+    return lambda variables: text.format(**variables).encode("utf-8")
+
+
+def _render_bytes(data):
+    return lambda variables: data
+
+
+def load_template_dir(template_dir):
+    """
+    Read a template directory once into a list of TemplateFile.
+
+    Raises:
+        ValueError: If the directory is missing or has no SKILL.md(.tmpl)
+    """
+    root = Path(template_dir).resolve()
+    if not root.is_dir():
+        raise ValueError(f"Template directory not found: {root}")
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        relative_dir = Path(dirpath).relative_to(root)
+        if not dirnames and not filenames and relative_dir != Path("."):
+            files.append(TemplateFile(Template(relative_dir.as_posix()), lambda variables: None, None))
+        for name in sorted(filenames):
+            source = Path(dirpath) / name
+            relative = (relative_dir / name).as_posix()
+            data = source.read_bytes()
+            if relative.endswith(TEMPLATE_SUFFIX):
+                relative = relative[: -len(TEMPLATE_SUFFIX)]
+                render = _render_text(Template(data.decode("utf-8")))
+            else:
+                render = _render_bytes(data)
+            files.append(TemplateFile(Template(relative), render, source.stat().st_mode & 0o777))
+    if not any(template_file.path.template == "SKILL.md" for template_file in files):
+        raise ValueError(f"Template directory has no SKILL.md or SKILL.md{TEMPLATE_SUFFIX}: {root}")
+    return files
+
+
+def builtin_template(resources, include_examples):
+    """The built-in SKILL.md and example resources as a list of TemplateFile."""
+    files = [TemplateFile(Template("SKILL.md"), _render_format(SKILL_TEMPLATE), None)]
+    examples = {
+        "scripts": ("scripts/example.py", _render_format(EXAMPLE_SCRIPT), 0o755),
+        "references": ("references/api_reference.md", _render_format(EXAMPLE_REFERENCE), None),
+        "assets": ("assets/example_asset.txt", _render_bytes(EXAMPLE_ASSET.encode("utf-8")), None),
+    }
+    for resource in resources:
+        if include_examples:
+            path, render, mode = examples[resource]
+            files.append(TemplateFile(Template(path), render, mode))
+        else:
+            files.append(TemplateFile(Template(resource), lambda variables: None, None))
+    return files
+
+
+def render_skill(template_files, variables):
+    """
+    Render a template for one skill.
+
+    Returns:
+        List of (relative_path, data, mode); data is None for an empty directory
+    """
+    rendered = []
+    for template_file in template_files:
+        relative = template_file.path.safe_substitute(variables)
+        path = Path(relative)
+        if path.is_absolute() or ".." in path.parts:
+            raise ValueError(f"Template path renders outside the skill: {relative}")
+        rendered.append((relative, template_file.render(variables), template_file.mode))
+    return rendered
+
+
+def write_rendered_file(target, data, mode):
+    target.write_bytes(data)
+    if mode is not None:
+        target.chmod(mode)
+
+
+def init_skill_from_template(skill_dir, template_files, variables):
+    """Write a rendered template into a freshly created skill directory."""
+    for relative, data, mode in render_skill(template_files, variables):
+        target = skill_dir / relative
+        if data is None:
+            target.mkdir(parents=True, exist_ok=True)
+            print(f"[OK] Created {relative}/")
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write_rendered_file(target, data, mode)
+        print(f"[OK] Created {relative}")
+
+
+def init_skill(skill_name, path, resources, include_examples, template_dir=None):
     """
     Initialize a new skill directory with template SKILL.md.
 
@@ -261,10 +410,19 @@ def init_skill(skill_name, path, resources, include_examples):
         path: Path where the skill directory should be created
         resources: Resource directories to create
         include_examples: Whether to create example files in resource directories
+        template_dir: Optional template directory to render instead of the built-in template
 
     Returns:
         Path to created skill directory, or None if error
     """
+    template_files = None
+    if template_dir:
+        try:
+            template_files = load_template_dir(template_dir)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] {e}")
+            return None
+
     # Determine skill directory path
     skill_dir = Path(path).resolve() / skill_name
 
@@ -281,8 +439,23 @@ def init_skill(skill_name, path, resources, include_examples):
         print(f"[ERROR] Error creating directory: {e}")
         return None
 
-    # Create SKILL.md from template
     skill_title = title_case_skill_name(skill_name)
+
+    if template_files is not None:
+        try:
+            init_skill_from_template(
+                skill_dir, template_files, {"skill_name": skill_name, "skill_title": skill_title}
+            )
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            print(f"[ERROR] Error rendering template: {e}")
+            return None
+        print(f"\n[OK] Skill '{skill_name}' initialized successfully at {skill_dir}")
+        print("\nNext steps:")
+        print("1. Edit SKILL.md and the generated files to fill in anything the template left open")
+        print("2. Run the validator when ready to check the skill structure")
+        return skill_dir
+
+    # Create SKILL.md from template
     skill_content = SKILL_TEMPLATE.format(skill_name=skill_name, skill_title=skill_title)
 
     skill_md_path = skill_dir / "SKILL.md"
@@ -317,7 +490,144 @@ def init_skill(skill_name, path, resources, include_examples):
     return skill_dir
 
 
+def _spec_resources(value):
+    """Like parse_resources, for spec values (string or list); raises instead of exiting."""
+    if isinstance(value, str):
+        value = value.split(",")
+    resources = [str(item).strip() for item in value if str(item).strip()]
+    invalid = sorted(set(resources) - ALLOWED_RESOURCES)
+    if invalid:
+        raise ValueError(
+            f"Unknown resource type(s): {', '.join(invalid)} (allowed: {', '.join(sorted(ALLOWED_RESOURCES))})"
+        )
+    return list(dict.fromkeys(resources))
+
+
+def plan_batch(spec, spec_dir):
+    """
+    Resolve a batch spec into rendered skill trees without touching the output paths.
+
+    Relative paths in the spec are resolved against the spec file's directory.
+
+    Returns:
+        (plans, errors) where plans is a list of (skill_name, skill_dir, files)
+        and errors lists (skill, message) for entries that were skipped
+    """
+    defaults = {**SPEC_DEFAULTS, **{key: spec[key] for key in SPEC_DEFAULTS if key in spec}}
+    templates = {}
+    plans = []
+    errors = []
+    planned_dirs = set()
+    for entry in spec.get("skills", []):
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        raw_name = entry.get("name", "")
+        options = {**defaults, **{key: entry[key] for key in SPEC_DEFAULTS if key in entry}}
+        skill_name, error = check_skill_name(str(raw_name))
+        if error:
+            errors.append((raw_name, error))
+            continue
+        if not options["path"]:
+            errors.append((skill_name, "No output path (set \"path\" in the spec)"))
+            continue
+        skill_dir = (spec_dir / options["path"]).resolve() / skill_name
+        if skill_dir in planned_dirs:
+            errors.append((skill_name, "Listed more than once"))
+            continue
+        if skill_dir.exists():
+            errors.append((skill_name, f"Skill directory already exists: {skill_dir}"))
+            continue
+
+        try:
+            if options["template"]:
+                key = (spec_dir / options["template"]).resolve()
+                if key not in templates:
+                    templates[key] = load_template_dir(key)
+            else:
+                resources = _spec_resources(options["resources"])
+                if options["examples"] and not resources:
+                    raise ValueError("\"examples\" requires \"resources\" to be set")
+                key = ("builtin", tuple(resources), bool(options["examples"]))
+                if key not in templates:
+                    templates[key] = builtin_template(resources, bool(options["examples"]))
+            variables = {
+                **defaults["vars"],
+                **options["vars"],
+                "skill_name": skill_name,
+                "skill_title": title_case_skill_name(skill_name),
+            }
+            files = render_skill(templates[key], variables)
+        except (OSError, ValueError, KeyError, UnicodeDecodeError) as e:
+            errors.append((skill_name, str(e)))
+            continue
+        planned_dirs.add(skill_dir)
+        plans.append((skill_name, skill_dir, files))
+    return plans, errors
+
+
+def write_batch(plans, jobs=None):
+    """
+    Create every planned skill tree: directories first, then all files in parallel.
+
+    Returns:
+        Number of files written
+    """
+    writes = []
+    for _, skill_dir, files in plans:
+        skill_dir.mkdir(parents=True)
+        for relative, data, mode in files:
+            target = skill_dir / relative
+            if data is None:
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            writes.append((target, data, mode))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        # list() re-raises the first write error, if any
+        list(pool.map(lambda write: write_rendered_file(*write), writes))
+    return len(writes)
+
+
+def main_batch(argv):
+    parser = argparse.ArgumentParser(
+        prog="init_skill.py --batch",
+        description="Create many skills from a JSON spec file.",
+    )
+    parser.add_argument("spec", help="JSON spec listing the skills to create")
+    parser.add_argument("--jobs", type=int, help="Writer threads (default: Python's ThreadPoolExecutor default)")
+    args = parser.parse_args(argv)
+
+    spec_path = Path(args.spec).resolve()
+    try:
+        spec = json.loads(spec_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Could not read spec {spec_path}: {e}")
+        sys.exit(1)
+    if not isinstance(spec, dict) or not isinstance(spec.get("skills"), list):
+        print('[ERROR] Spec must be a JSON object with a "skills" list')
+        sys.exit(1)
+
+    start = time.perf_counter()
+    plans, errors = plan_batch(spec, spec_path.parent)
+    try:
+        written = write_batch(plans, args.jobs)
+    except OSError as e:
+        print(f"[ERROR] Error writing skills: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    for skill_name, skill_dir, _ in plans:
+        print(f"[OK] Created {skill_name} at {skill_dir}")
+    for skill_name, message in errors:
+        print(f"[ERROR] {skill_name}: {message}")
+    print(f"\nCreated {len(plans)}/{len(plans) + len(errors)} skills ({written} files) in {elapsed:.2f}s")
+    sys.exit(1 if errors else 0)
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        main_batch(sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         description="Create a new skill directory with a SKILL.md template.",
     )
@@ -333,18 +643,16 @@ def main():
         action="store_true",
         help="Create example files inside the selected resource directories",
     )
+    parser.add_argument(
+        "--template",
+        help="Template directory to render instead of the built-in SKILL.md and examples",
+    )
     args = parser.parse_args()
 
     raw_skill_name = args.skill_name
-    skill_name = normalize_skill_name(raw_skill_name)
-    if not skill_name:
-        print("[ERROR] Skill name must include at least one letter or digit.")
-        sys.exit(1)
-    if len(skill_name) > MAX_SKILL_NAME_LENGTH:
-        print(
-            f"[ERROR] Skill name '{skill_name}' is too long ({len(skill_name)} characters). "
-            f"Maximum is {MAX_SKILL_NAME_LENGTH} characters."
-        )
+    skill_name, error = check_skill_name(raw_skill_name)
+    if error:
+        print(f"[ERROR] {error}")
         sys.exit(1)
     if skill_name != raw_skill_name:
         print(f"Note: Normalized skill name from '{raw_skill_name}' to '{skill_name}'.")
@@ -353,12 +661,17 @@ def main():
     if args.examples and not resources:
         print("[ERROR] --examples requires --resources to be set.")
         sys.exit(1)
+    if args.template and resources:
+        print("[ERROR] --template cannot be combined with --resources; the template defines the tree.")
+        sys.exit(1)
 
     path = args.path
 
     print(f"Initializing skill: {skill_name}")
     print(f"   Location: {path}")
-    if resources:
+    if args.template:
+        print(f"   Template: {args.template}")
+    elif resources:
         print(f"   Resources: {', '.join(resources)}")
         if args.examples:
             print("   Examples: enabled")
@@ -366,7 +679,7 @@ def main():
         print("   Resources: none (create as needed)")
     print()
 
-    result = init_skill(skill_name, path, resources, args.examples)
+    result = init_skill(skill_name, path, resources, args.examples, args.template)
 
     if result:
         sys.exit(0)
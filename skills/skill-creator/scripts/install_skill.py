@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Skill Installer - Unpacks .skill files into a skills directory
+
+Usage:
+    python install_skill.py <path/to/skill.skill> [...] --dest <skills-dir> [--manifest PATH] [--allow-unverified]
+
+Example:
+    python install_skill.py dist/my-skill.skill --dest ~/.openclaw/skills
+    python install_skill.py dist/*.skill --dest /srv/openclaw/skills
+
+Every entry is streamed from the archive straight to disk and checked against
+the SHA-256 recorded in the packaging manifest (<name>.skill.manifest.json next
+to the archive). Files already installed with a matching hash and permissions
+are hard-linked into the new tree instead of being extracted again. The new tree is built in a
+staging directory beside the destination and swapped in with two renames, so
+a failed or interrupted install leaves the previous version in place.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import zipfile
+from pathlib import Path, PurePosixPath
+
+from package_skill import HASH_CHUNK_SIZE, MANIFEST_VERSION, file_digest, manifest_path_for
+
+
+def load_install_manifest(manifest_path):
+    """
+    Load the per-file hashes from a packaging manifest.
+
+    Returns:
+        (files, None) mapping arcname -> record, or (None, error_message)
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except OSError:
+        return None, f"Manifest not found: {manifest_path}"
+    except ValueError as e:
+        return None, f"Invalid manifest {manifest_path}: {e}"
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None, f"Unsupported manifest version in {manifest_path}"
+    return manifest.get("files", {}), None
+
+
+def archive_members(zipf):
+    """
+    Check archive entry names and return the skill name and file entries.
+
+    Rejects absolute paths, parent references, symlinks and entries outside a
+    single top-level skill folder, so nothing can be written outside the destination.
+
+    Returns:
+        (skill_name, entries, None) or (None, None, error_message)
+    """
+    skill_name = None
+    entries = []
+    for info in zipf.infolist():
+        if info.is_dir():
+            continue
+        path = PurePosixPath(info.filename)
+        if path.is_absolute() or ".." in path.parts or "\\" in info.filename or len(path.parts) < 2:
+            return None, None, f"Unsafe entry path: {info.filename}"
+        if stat.S_ISLNK(info.external_attr >> 16):
+            return None, None, f"Symlink entries are not supported: {info.filename}"
+        if skill_name is None:
+            skill_name = path.parts[0]
+        elif path.parts[0] != skill_name:
+            return None, None, f"Archive contains more than one top-level folder: {skill_name}, {path.parts[0]}"
+        entries.append(info)
+    if skill_name is None:
+        return None, None, "Archive is empty"
+    return skill_name, entries, None
+
+
+def stream_entry(zipf, info, target):
+    """Decompress one entry to target chunk by chunk, returning its SHA-256."""
+    digest = hashlib.sha256()
+    with zipf.open(info) as src, open(target, "wb") as dest:
+        for chunk in iter(lambda: src.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            dest.write(chunk)
+    return digest.hexdigest()
+
+
+def entry_mode(info, record):
+    """Permission bits for an entry: its zip attributes, else the manifest's executable flag."""
+    mode = (info.external_attr >> 16) & 0o777
+    if not mode and record and "executable" in record:
+        mode = 0o755 if record["executable"] else 0o644
+    return mode
+
+
+def existing_matches(existing, expected, mode=0):
+    """
+    True if an installed file already has the expected content and mode.
+
+    Size and permission bits are checked before hashing. A file whose mode
+    differs is not a match, so it is extracted again and chmodded rather than
+    hard-linked with the old mode.
+    """
+    try:
+        existing_stat = existing.stat()
+    except OSError:
+        return False
+    if existing_stat.st_size != expected["size"]:
+        return False
+    if mode and stat.S_IMODE(existing_stat.st_mode) != mode:
+        return False
+    return file_digest(existing) == expected["sha256"]
+
+
+def reuse_file(existing, target):
+    """Hard-link an unchanged installed file into the staging tree, copying if linking fails."""
+    try:
+        os.link(existing, target)
+    except OSError:
+        shutil.copy2(existing, target)
+
+
+def list_installed_files(skill_dir):
+    if not skill_dir.is_dir():
+        return set()
+    return {
+        (Path(dirpath) / name).relative_to(skill_dir).as_posix()
+        for dirpath, _, filenames in os.walk(skill_dir)
+        for name in filenames
+    }
+
+
+def default_dir_mode():
+    """Mode a plain mkdir would give a new directory under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o777 & ~umask
+
+
+def apply_dir_modes(staging_dir, skill_dir):
+    """
+    Give every staged directory the mode of its installed counterpart.
+
+    mkdtemp creates the staging directory 0700, and it becomes the skill
+    directory once swapped in. Directories with no installed counterpart
+    (everything on a first install) get the umask default instead.
+    """
+    default = default_dir_mode()
+    for dirpath, _, _ in os.walk(staging_dir):
+        installed = skill_dir / Path(dirpath).relative_to(staging_dir)
+        try:
+            installed_stat = installed.lstat()
+        except OSError:
+            installed_stat = None
+        if installed_stat is not None and stat.S_ISDIR(installed_stat.st_mode):
+            os.chmod(dirpath, stat.S_IMODE(installed_stat.st_mode))
+        else:
+            os.chmod(dirpath, default)
+
+
+def swap_in(staging_dir, skill_dir):
+    """Replace skill_dir with staging_dir, keeping the old tree until the new one is in place."""
+    if not skill_dir.exists():
+        os.rename(staging_dir, skill_dir)
+        return
+    retired = Path(tempfile.mkdtemp(prefix=f".{skill_dir.name}.old-", dir=skill_dir.parent))
+    os.rename(skill_dir, retired / skill_dir.name)
+    try:
+        os.rename(staging_dir, skill_dir)
+    except OSError:
+        os.rename(retired / skill_dir.name, skill_dir)
+        raise
+    finally:
+        shutil.rmtree(retired, ignore_errors=True)
+
+
+def install_skill(archive_path, dest_dir, manifest_path=None, allow_unverified=False):
+    """
+    Install a .skill archive into dest_dir, verifying it against its manifest.
+
+    Args:
+        archive_path: Path to the .skill file
+        dest_dir: Directory that holds installed skills
+        manifest_path: Packaging manifest (defaults to <archive>.manifest.json)
+        allow_unverified: Install without a manifest, relying on zip CRCs only
+
+    Returns:
+        Path to the installed skill directory, or None if error
+    """
+    archive_path = Path(archive_path).resolve()
+    dest_dir = Path(dest_dir).resolve()
+
+    if not archive_path.is_file():
+        print(f"[ERROR] Archive not found: {archive_path}")
+        return None
+
+    manifest_path = Path(manifest_path) if manifest_path else manifest_path_for(archive_path)
+    expected, error = load_install_manifest(manifest_path)
+    if error:
+        if not allow_unverified:
+            print(f"[ERROR] {error}")
+            print("   Pass --allow-unverified to install without hash verification.")
+            return None
+        print(f"[WARN] {error}; installing without hash verification")
+        expected = None
+
+    staging_dir = None
+    try:
+        with zipfile.ZipFile(archive_path) as zipf:
+            skill_name, entries, error = archive_members(zipf)
+            if error:
+                print(f"[ERROR] {error}")
+                return None
+
+            if expected is not None:
+                names = {info.filename for info in entries}
+                missing = sorted(set(expected) - names)
+                unexpected = sorted(names - set(expected))
+                if missing or unexpected:
+                    print(f"[ERROR] Archive does not match manifest {manifest_path}")
+                    for name in missing:
+                        print(f"   Missing from archive: {name}")
+                    for name in unexpected:
+                        print(f"   Not in manifest: {name}")
+                    return None
+
+            skill_dir = dest_dir / skill_name
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            installed = list_installed_files(skill_dir)
+            staging_dir = Path(tempfile.mkdtemp(prefix=f".{skill_name}.install-", dir=dest_dir))
+
+            written = 0
+            unchanged = 0
+            for info in entries:
+                relative = info.filename.split("/", 1)[1]
+                target = staging_dir / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                record = expected.get(info.filename) if expected is not None else None
+                existing = skill_dir / relative
+                mode = entry_mode(info, record)
+                if record and relative in installed and existing_matches(existing, record, mode):
+                    reuse_file(existing, target)
+                    unchanged += 1
+                    continue
+                digest = stream_entry(zipf, info, target)
+                if record and digest != record["sha256"]:
+                    print(f"[ERROR] Hash mismatch for {info.filename}; archive is corrupt or was modified")
+                    return None
+                if mode:
+                    os.chmod(target, mode)
+                written += 1
+
+        relatives = {info.filename.split("/", 1)[1] for info in entries}
+        if written == 0 and installed == relatives:
+            print(f"[OK] {skill_name} is up to date: {skill_dir}")
+            return skill_dir
+
+        apply_dir_modes(staging_dir, skill_dir)
+        swap_in(staging_dir, skill_dir)
+        staging_dir = None
+        removed = len(installed - relatives)
+        print(
+            f"[OK] Installed {skill_name} to {skill_dir} "
+            f"({written} written, {unchanged} unchanged, {removed} removed)"
+        )
+        return skill_dir
+
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"[ERROR] Error installing {archive_path.name}: {e}")
+        return None
+    finally:
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Install .skill archives, verifying each file against the packaging manifest.",
+    )
+    parser.add_argument("archives", nargs="+", help=".skill files to install")
+    parser.add_argument("--dest", required=True, help="Directory that holds installed skills")
+    parser.add_argument("--manifest", help="Packaging manifest (only with a single archive)")
+    parser.add_argument(
+        "--allow-unverified",
+        action="store_true",
+        help="Install archives that have no manifest, relying on zip CRCs only",
+    )
+    args = parser.parse_args()
+
+    if args.manifest and len(args.archives) > 1:
+        parser.error("--manifest can only be used with a single archive")
+
+    failed = 0
+    for archive in args.archives:
+        if not install_skill(archive, args.dest, args.manifest, args.allow_unverified):
+            failed += 1
+
+    if len(args.archives) > 1:
+        print(f"\nInstalled {len(args.archives) - failed}/{len(args.archives)} skills")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,33 +3,595 @@
 Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [options]
+    python utils/package_skill.py --batch <skill-or-root> [...] [--output DIR] [--jobs N] [options]
+
+Options:
+    --force              Rebuild even if nothing changed
+    --compression NAME   deflate (default), bzip2, lzma, or zstd where zipfile supports it
+    --level N            Compression level for deflate (0-9), bzip2 (1-9) or zstd
+
+A manifest of per-file content hashes is written next to each .skill file
+(<name>.skill.manifest.json). Re-packaging an unchanged skill is skipped, and
+unchanged files are copied into the new archive without being recompressed.
+Pass --force to rebuild from scratch.
+
+Archives are reproducible: entries are sorted by path and carry fixed
+timestamps (SOURCE_DATE_EPOCH if set, else 1980-01-01), normalized permissions
+(0644, or 0755 for executables) and a fixed compression level, so identical
+skill trees always produce byte-identical .skill files.
+
+Files that are already compressed (images, audio, video, fonts, archives) are
+stored as-is; everything else uses the selected compression method.
+
+Files matching .skillignore (gitignore-style patterns in the skill root) or the
+built-in defaults (__pycache__, .DS_Store, .git, node_modules, virtualenvs,
+editor and tool caches) are left out. Ignored directories are never walked.
 
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+    python utils/package_skill.py skills/public/my-skill ./dist --compression lzma
+    python utils/package_skill.py --batch skills/public --output ./dist
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import stat
+import struct
 import sys
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from quick_validate import validate_skill
+from quick_validate import find_skill_dirs, validate_skill
+
+MANIFEST_VERSION = 2
+HASH_CHUNK_SIZE = 1024 * 1024
+COMPRESSION_METHODS = {
+    "deflate": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+if hasattr(zipfile, "ZIP_ZSTANDARD"):  # Python 3.14+
+    COMPRESSION_METHODS["zstd"] = zipfile.ZIP_ZSTANDARD
+DEFAULT_COMPRESSION = "deflate"
+# Pinned so archives stay byte-identical; lzma ignores the level in zipfile.
+# These are the codecs' own defaults, which zipfile applies when no level is set.
+DEFAULT_LEVELS = {"deflate": 6, "bzip2": 9, "zstd": 3}
+LEVEL_RANGES = {"deflate": (0, 9), "bzip2": (1, 9), "zstd": (-7, 22)}
+STORE = "store"
+# Formats that are already compressed; deflating them only burns CPU
+STORED_SUFFIXES = frozenset(
+    {
+        ".7z", ".aac", ".avif", ".br", ".bz2", ".docx", ".epub", ".flac", ".gif", ".gz",
+        ".heic", ".jar", ".jpeg", ".jpg", ".m4a", ".m4v", ".mkv", ".mov", ".mp3", ".mp4",
+        ".ogg", ".opus", ".png", ".pptx", ".skill", ".tgz", ".webm", ".webp", ".whl",
+        ".woff", ".woff2", ".xlsx", ".xz", ".zip", ".zst",
+    }
+)
+# Earliest timestamp a zip entry can hold
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+ZIP_SYSTEM_UNIX = 3
+FILE_MODE = stat.S_IFREG | 0o644
+EXECUTABLE_MODE = stat.S_IFREG | 0o755
+IGNORE_FILE = ".skillignore"
+# Applied before .skillignore, so a "!pattern" there can re-include any of these
+DEFAULT_IGNORE_PATTERNS = (
+    "__pycache__/",
+    "*.py[cod]",
+    ".DS_Store",
+    "Thumbs.db",
+    ".git/",
+    ".hg/",
+    ".svn/",
+    "node_modules/",
+    ".venv/",
+    "venv/",
+    ".mypy_cache/",
+    ".pytest_cache/",
+    ".ruff_cache/",
+    ".tox/",
+    "*.egg-info/",
+    ".idea/",
+    ".vscode/",
+    "*.swp",
+    "*~",
+)
+# A directory holding this file is a virtualenv, whatever it is called
+VENV_MARKER = "pyvenv.cfg"
+# Local file header: signature, versions, flags, method, time, date, crc,
+# sizes, then the name and extra field lengths (see zipfile.structFileHeader)
+LOCAL_HEADER = struct.Struct(zipfile.structFileHeader)
+ZIP64_LIMIT = 0xFFFFFFFF
+DATA_DESCRIPTOR_FLAG = 0x08
+
+
+def archive_date_time():
+    """Timestamp stamped on every entry: SOURCE_DATE_EPOCH if set, else the zip epoch."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        try:
+            return max(ZIP_EPOCH, time.gmtime(int(epoch))[:6])
+        except (ValueError, OverflowError):
+            print(f"[WARN] Ignoring invalid SOURCE_DATE_EPOCH: {epoch}")
+    return ZIP_EPOCH
+
+
+def check_compression(compression, level):
+    """Return an error message if the compression method or level is unusable, else None."""
+    if compression not in COMPRESSION_METHODS:
+        return f"Unsupported compression '{compression}' (choose from: {', '.join(COMPRESSION_METHODS)})"
+    if level is None:
+        return None
+    if compression not in LEVEL_RANGES:
+        return f"--level is not supported for {compression}"
+    low, high = LEVEL_RANGES[compression]
+    if not low <= level <= high:
+        return f"--level for {compression} must be between {low} and {high}"
+    return None
+
+
+def archive_options(compression=DEFAULT_COMPRESSION, level=None):
+    """Settings that affect archive bytes; a manifest built with others is not reused."""
+    if level is None:
+        level = DEFAULT_LEVELS.get(compression)
+    return {"date_time": list(archive_date_time()), "compression": compression, "level": level}
+
+
+def compression_for(arcname, compression):
+    """Pick the strategy for one file: store already-compressed formats, compress the rest."""
+    if Path(arcname).suffix.lower() in STORED_SUFFIXES:
+        return STORE
+    return compression
+
+
+def normalized_info(arcname, record, date_time, strategy):
+    """Build a ZipInfo whose metadata depends only on the path, content and strategy."""
+    zinfo = zipfile.ZipInfo(arcname, date_time=date_time)
+    zinfo.create_system = ZIP_SYSTEM_UNIX
+    mode = EXECUTABLE_MODE if record["executable"] else FILE_MODE
+    zinfo.external_attr = mode << 16
+    zinfo.compress_type = zipfile.ZIP_STORED if strategy == STORE else COMPRESSION_METHODS[strategy]
+    return zinfo
+
+
+def manifest_path_for(skill_filename):
+    """Return the manifest path stored alongside a .skill file."""
+    skill_filename = Path(skill_filename)
+    return skill_filename.with_name(skill_filename.name + ".manifest.json")
+
+
+def file_digest(file_path):
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path, options):
+    """Load a packaging manifest, or None if it is missing, unreadable or built differently."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    if manifest.get("options") != options:
+        return None
+    return manifest
+
+
+def content_key(record):
+    """The parts of a file record that end up in the archive."""
+    return (record.get("sha256"), record.get("executable"))
+
+
+def write_manifest(manifest_path, manifest):
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    os.replace(tmp_path, manifest_path)
+
+
+def translate_ignore_pattern(pattern):
+    """
+    Translate one gitignore-style pattern into a regex for paths relative to the skill root.
+
+    Supports *, ?, [...] and ** wildcards. A pattern containing a slash is
+    anchored to the skill root; otherwise it matches at any depth.
+    """
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+    parts = []
+    i = 0
+    length = len(pattern)
+    while i < length:
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape("["))
+                i += 1
+                continue
+            body = pattern[i + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body}]")
+            i = end + 1
+        elif pattern[i] == "\\" and i + 1 < length:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(prefix + "".join(parts))
+
+
+def parse_ignore_patterns(lines):
+    """
+    Parse gitignore-style lines into rules.
+
+    Returns:
+        List of (regex, negate, directory_only) tuples; the last matching rule wins
+    """
+    rules = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\#") or line.startswith("\\!"):
+            line = line[1:]
+        directory_only = line.endswith("/")
+        line = line.rstrip("/")
+        if line:
+            rules.append((translate_ignore_pattern(line), negate, directory_only))
+    return rules
+
+
+def load_ignore_rules(skill_path):
+    """Built-in defaults followed by the skill's .skillignore, if present."""
+    lines = list(DEFAULT_IGNORE_PATTERNS)
+    ignore_file = skill_path / IGNORE_FILE
+    if ignore_file.is_file():
+        lines.extend(ignore_file.read_text(encoding="utf-8").splitlines())
+    return parse_ignore_patterns(lines)
+
+
+def is_ignored(rules, relative_path, is_dir):
+    ignored = False
+    for regex, negate, directory_only in rules:
+        if directory_only and not is_dir:
+            continue
+        if regex.fullmatch(relative_path):
+            ignored = not negate
+    return ignored
+
+
+def walk_skill_files(skill_path, rules):
+    """
+    List the files of a skill that are not ignored.
+
+    Ignored directories are pruned from os.walk, so their contents are never listed.
+
+    Returns:
+        (files, ignored) where files is a list of (file_path, relative_path)
+        and ignored counts the skipped files and directories
+    """
+    files = []
+    ignored = 0
+    for dirpath, dirnames, filenames in os.walk(skill_path):
+        directory = Path(dirpath)
+        relative_dir = directory.relative_to(skill_path).as_posix()
+        prefix = "" if relative_dir == "." else relative_dir + "/"
+        if prefix and VENV_MARKER in filenames:
+            dirnames[:] = []
+            ignored += 1
+            continue
+        kept = []
+        for name in dirnames:
+            if is_ignored(rules, prefix + name, True):
+                ignored += 1
+            else:
+                kept.append(name)
+        dirnames[:] = kept
+        for name in filenames:
+            if is_ignored(rules, prefix + name, False):
+                ignored += 1
+                continue
+            file_path = directory / name
+            if file_path.is_file():
+                files.append((file_path, prefix + name))
+    return files, ignored
+
+
+def scan_skill_files(skill_path, previous_files=None):
+    """
+    Collect the files to package together with their content hashes.
+
+    A file whose size and mtime match the previous manifest keeps its recorded
+    hash instead of being read again.
+
+    Returns:
+        (entries, ignored) where entries is a list of (file_path, arcname,
+        record) tuples sorted by arcname and ignored counts skipped paths
+    """
+    previous_files = previous_files or {}
+    entries = []
+    files, ignored = walk_skill_files(skill_path, load_ignore_rules(skill_path))
+    for file_path, relative_path in files:
+        arcname = f"{skill_path.name}/{relative_path}"
+        file_stat = file_path.stat()
+        record = {
+            "size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+            "executable": bool(file_stat.st_mode & stat.S_IXUSR),
+        }
+        previous = previous_files.get(arcname)
+        if previous and previous.get("size") == record["size"] and previous.get("mtime_ns") == record["mtime_ns"]:
+            record["sha256"] = previous["sha256"]
+        else:
+            record["sha256"] = file_digest(file_path)
+        entries.append((file_path, arcname, record))
+    entries.sort(key=lambda entry: entry[1])
+    return entries, ignored
+
+
+def archive_record(skill_filename):
+    archive_stat = skill_filename.stat()
+    return {"size": archive_stat.st_size, "mtime_ns": archive_stat.st_mtime_ns}
+
+
+def _read_local_header(archive, info):
+    """
+    Check an entry's local header and leave the file positioned at its data.
+
+    Returns:
+        (compress_type, CRC, compress_size, file_size) as the header records them
+    """
+    archive.seek(info.header_offset)
+    header = archive.read(LOCAL_HEADER.size)
+    if len(header) != LOCAL_HEADER.size or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+    fields = LOCAL_HEADER.unpack(header)
+    compress_type, crc, compress_size, file_size = fields[4], fields[7], fields[8], fields[9]
+    name_length, extra_length = fields[10], fields[11]
+    archive.seek(name_length + extra_length, os.SEEK_CUR)
+    return compress_type, crc, compress_size, file_size
+
+
+def _read_raw_entry(archive, info):
+    """Read the still-compressed bytes of an entry from an open archive file."""
+    _read_local_header(archive, info)
+    raw = archive.read(info.compress_size)
+    if len(raw) != info.compress_size:
+        raise zipfile.BadZipFile(f"Truncated entry {info.filename}")
+    return raw
 
 
-def package_skill(skill_path, output_dir=None):
+def _write_file_entry(zipf, zinfo, file_path, size, level):
+    """
+    Compress a file into the archive at a fixed level.
+
+    A level of None (stored entries and the DEFAULT_LEVELS) is the codec's
+    default, so the file is streamed through ZipFile.open. ZipFile.open takes
+    no level, so other levels stream only where ZipInfo has the public
+    compress_level attribute (Python 3.13+); older versions pass them to
+    writestr, which needs the whole file in memory.
+    """
+    zinfo.file_size = size
+    if level is not None:
+        if not hasattr(zipfile.ZipInfo, "compress_level"):
+            zipf.writestr(zinfo, file_path.read_bytes(), compresslevel=level)
+            return
+        zinfo.compress_level = level
+    with open(file_path, "rb") as src, zipf.open(zinfo, "w") as dest:
+        shutil.copyfileobj(src, dest, HASH_CHUNK_SIZE)
+
+
+def _supports_raw_copy(zipf):
+    """Whether this zipfile exposes the internals _write_raw_entry relies on."""
+    return all(
+        hasattr(zipf, name) for name in ("fp", "start_dir", "_didModify", "filelist", "NameToInfo")
+    ) and hasattr(zipfile.ZipInfo, "FileHeader")
+
+
+def _write_raw_entry(zipf, zinfo, info, raw):
+    """
+    Append an already-compressed entry to a zip opened for writing.
+
+    zinfo supplies the metadata of the new entry, info the compression details
+    of the copied one. zipfile has no public API for this; mirror what
+    ZipFile.mkdir does for entries without a data stream. Callers check
+    _supports_raw_copy first and recompress when it returns False.
+    """
+    zinfo.compress_type = info.compress_type
+    zinfo.flag_bits = info.flag_bits & ~DATA_DESCRIPTOR_FLAG
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zipf.fp.seek(zipf.start_dir)
+    zinfo.header_offset = zipf.fp.tell()
+    zipf._didModify = True
+    zipf.fp.write(zinfo.FileHeader())
+    zipf.fp.write(raw)
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.start_dir = zipf.fp.tell()
+
+
+def _reusable_entries(skill_filename, manifest):
+    """Map arcname -> ZipInfo for entries of the previous archive that the manifest vouches for."""
+    if not manifest or not skill_filename.is_file():
+        return {}
+    if manifest.get("archive") != archive_record(skill_filename):
+        return {}
+    try:
+        with zipfile.ZipFile(skill_filename) as previous:
+            return {info.filename: info for info in previous.infolist()}
+    except (OSError, zipfile.BadZipFile):
+        return {}
+
+
+def _check_raw_copies(filename, copied):
+    """
+    Re-read the headers of raw-copied entries and compare them with their source.
+
+    copied maps arcname -> ZipInfo of the entry in the previous archive. Each
+    copy must carry the source's method, CRC and sizes in the central directory
+    and in its local header. Nothing is decompressed, so the check costs a few
+    reads per copied entry however large the archive is.
+
+    Returns:
+        A description of the first mismatch, or None
+    """
+    try:
+        with zipfile.ZipFile(filename) as archive, open(filename, "rb") as handle:
+            for arcname, source in copied.items():
+                expected = (source.compress_type, source.CRC, source.compress_size, source.file_size)
+                info = archive.getinfo(arcname)
+                if (info.compress_type, info.CRC, info.compress_size, info.file_size) != expected:
+                    return f"{arcname}: central directory does not match the copied entry"
+                local = _read_local_header(handle, info)
+                if ZIP64_LIMIT in local[2:]:
+                    # Sizes live in the zip64 extra field; the central directory check covered them
+                    local, expected = local[:2], expected[:2]
+                if local != expected:
+                    return f"{arcname}: local header does not match the copied entry"
+    except (OSError, KeyError, zipfile.BadZipFile) as exc:
+        return str(exc)
+    return None
+
+
+def write_archive(skill_filename, entries, reusable, previous_files, options):
+    """
+    Write the archive to a temporary file and move it into place.
+
+    Entries whose hash matches the previous manifest are copied from the
+    previous archive as raw compressed bytes; everything else is stored or
+    compressed according to compression_for. The headers of copied entries
+    are checked against their source (_check_raw_copies) before the archive
+    replaces the old one; if that fails, it is rebuilt from the files alone.
+
+    Returns:
+        (number of entries reused, per-strategy stats) where stats maps a
+        strategy name to files, bytes_in, bytes_out and seconds
+    """
+    tmp_filename = skill_filename.with_name(skill_filename.name + ".tmp")
+    date_time = archive_date_time()
+    copied = {}
+    stats = {}
+    previous_archive = open(skill_filename, "rb") if reusable else None
+    try:
+        with zipfile.ZipFile(tmp_filename, "w") as zipf:
+            raw_copy = bool(reusable) and _supports_raw_copy(zipf)
+            for file_path, arcname, record in entries:
+                strategy = compression_for(arcname, options["compression"])
+                zinfo = normalized_info(arcname, record, date_time, strategy)
+                previous = previous_files.get(arcname)
+                info = reusable.get(arcname)
+                start = time.perf_counter()
+                if (
+                    raw_copy
+                    and info is not None
+                    and info.compress_type == zinfo.compress_type
+                    and previous
+                    and previous.get("sha256") == record["sha256"]
+                ):
+                    _write_raw_entry(zipf, zinfo, info, _read_raw_entry(previous_archive, info))
+                    copied[arcname] = info
+                    print(f"  Reused: {arcname}")
+                else:
+                    level = options["level"]
+                    if strategy == STORE or level == DEFAULT_LEVELS.get(strategy):
+                        level = None
+                    _write_file_entry(zipf, zinfo, file_path, record["size"], level)
+                    print(f"  Added: {arcname} ({strategy})")
+                totals = stats.setdefault(strategy, {"files": 0, "bytes_in": 0, "bytes_out": 0, "seconds": 0.0})
+                totals["files"] += 1
+                totals["bytes_in"] += zinfo.file_size
+                totals["bytes_out"] += zinfo.compress_size
+                totals["seconds"] += time.perf_counter() - start
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_filename.unlink()
+        raise
+    finally:
+        if previous_archive is not None:
+            previous_archive.close()
+    if copied:
+        bad = _check_raw_copies(tmp_filename, copied)
+        if bad is not None:
+            tmp_filename.unlink()
+            print(f"  [WARN] Reused entries failed verification ({bad}); recompressing every file")
+            return write_archive(skill_filename, entries, {}, previous_files, options)
+    os.replace(tmp_filename, skill_filename)
+    return len(copied), stats
+
+
+def print_compression_stats(stats):
+    print("\n  Compression:")
+    for strategy, totals in sorted(stats.items()):
+        saved = totals["bytes_in"] - totals["bytes_out"]
+        print(
+            f"    {strategy:<8} {totals['files']:>5} files  "
+            f"{format_size(totals['bytes_in']):>9} -> {format_size(totals['bytes_out']):>9}  "
+            f"saved {format_size(saved):>9}  {totals['seconds']:.2f}s"
+        )
+
+
+def package_skill(
+    skill_path, output_dir=None, force=False, compression=DEFAULT_COMPRESSION, level=None, stats=None
+):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        force: Rebuild from scratch, ignoring the manifest of the previous build
+        compression: Method for compressible files (see COMPRESSION_METHODS)
+        level: Compression level (defaults to DEFAULT_LEVELS for the method)
+        stats: Optional dict that receives the per-strategy compression stats
 
     Returns:
         Path to the created .skill file, or None if error
     """
     skill_path = Path(skill_path).resolve()
 
+    error = check_compression(compression, level)
+    if error:
+        print(f"[ERROR] {error}")
+        return None
+
     # Validate skill folder exists
     if not skill_path.exists():
         print(f"[ERROR] Skill folder not found: {skill_path}")
@@ -63,17 +625,43 @@ def package_skill(skill_path, output_dir=None):
         output_path = Path.cwd()
 
     skill_filename = output_path / f"{skill_name}.skill"
+    manifest_path = manifest_path_for(skill_filename)
 
     # Create the .skill file (zip format)
     try:
-        with zipfile.ZipFile(skill_filename, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob("*"):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+        options = archive_options(compression, level)
+        manifest = None if force else load_manifest(manifest_path, options)
+        previous_files = manifest.get("files", {}) if manifest else {}
+        entries, ignored = scan_skill_files(skill_path, previous_files)
+        if ignored:
+            print(f"  Ignored {ignored} path(s) matching {IGNORE_FILE} or the built-in defaults\n")
+        files = {arcname: record for _, arcname, record in entries}
+        reusable = _reusable_entries(skill_filename, manifest)
+
+        contents = {arcname: content_key(record) for arcname, record in files.items()}
+        previous_contents = {arcname: content_key(record) for arcname, record in previous_files.items()}
+        if reusable and contents == previous_contents:
+            if files != previous_files:
+                # Only mtimes moved (e.g. a fresh checkout); remember them for next time
+                write_manifest(manifest_path, dict(manifest, files=files))
+            print(f"[OK] Up to date, skipped packaging: {skill_filename}")
+            return skill_filename
+
+        reused, strategy_stats = write_archive(skill_filename, entries, reusable, previous_files, options)
+        if stats is not None:
+            stats.update(strategy_stats)
+        write_manifest(
+            manifest_path,
+            {
+                "version": MANIFEST_VERSION,
+                "options": options,
+                "archive": archive_record(skill_filename),
+                "files": files,
+            },
+        )
+        print_compression_stats(strategy_stats)
+        if reused:
+            print(f"\n  Reused {reused} of {len(entries)} entries from the previous archive")
 
         print(f"\n[OK] Successfully packaged skill to: {skill_filename}")
         return skill_filename
@@ -83,23 +671,175 @@ def package_skill(skill_path, output_dir=None):
         return None
 
 
+def _package_quietly(skill_path, output_dir, options):
+    """Batch worker: package one skill, capturing its log instead of printing it."""
+    log = io.StringIO()
+    stats = {}
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        result = package_skill(skill_path, output_dir, stats=stats, **options)
+    elapsed = time.perf_counter() - start
+    entries = 0
+    size = 0
+    if result:
+        size = os.path.getsize(result)
+        with zipfile.ZipFile(result) as zipf:
+            entries = len(zipf.infolist())
+    return {
+        "skill": Path(skill_path).name,
+        "path": str(result) if result else None,
+        "files": entries,
+        "size": size,
+        "seconds": elapsed,
+        "stats": stats,
+        "log": log.getvalue(),
+    }
+
+
+def package_skills(skill_paths, output_dir=None, jobs=None, **options):
+    """
+    Validate and package many skills concurrently across a process pool.
+
+    Args:
+        skill_paths: Skill folders to package
+        output_dir: Optional output directory for the .skill files (defaults to current directory)
+        jobs: Worker processes (defaults to the CPU count)
+        **options: Passed to package_skill (force, compression, level)
+
+    Returns:
+        One result dict per skill, in input order
+    """
+    if not skill_paths:
+        return []
+    if output_dir:
+        # Create once up front rather than racing in every worker
+        Path(output_dir).resolve().mkdir(parents=True, exist_ok=True)
+    workers = min(jobs or os.cpu_count() or 1, len(skill_paths))
+    if workers == 1:
+        return [_package_quietly(path, output_dir, options) for path in skill_paths]
+    count = len(skill_paths)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_package_quietly, skill_paths, [output_dir] * count, [options] * count))
+
+
+def format_size(size):
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def print_summary(results, wall_seconds):
+    name_width = max([len("Skill")] + [len(result["skill"]) for result in results])
+    print(f"{'Skill':<{name_width}}  {'Status':<6}  {'Files':>5}  {'Size':>9}  {'Time':>7}")
+    print("-" * (name_width + 40))
+    for result in results:
+        status = "OK" if result["path"] else "FAILED"
+        size = format_size(result["size"]) if result["path"] else "-"
+        print(
+            f"{result['skill']:<{name_width}}  {status:<6}  {result['files']:>5}  {size:>9}  {result['seconds']:>6.2f}s"
+        )
+    stats = {}
+    for result in results:
+        for strategy, totals in result["stats"].items():
+            combined = stats.setdefault(strategy, dict.fromkeys(totals, 0))
+            for key, value in totals.items():
+                combined[key] += value
+    if stats:
+        print_compression_stats(stats)
+
+    packaged = [result for result in results if result["path"]]
+    total = sum(result["size"] for result in packaged)
+    print(f"\nPackaged {len(packaged)}/{len(results)} skills ({format_size(total)}) in {wall_seconds:.2f}s")
+
+
+def add_packaging_arguments(parser):
+    parser.add_argument("--force", action="store_true", help="Rebuild archives even if nothing changed")
+    parser.add_argument(
+        "--compression",
+        choices=sorted(COMPRESSION_METHODS),
+        default=DEFAULT_COMPRESSION,
+        help=f"Method for compressible files (default: {DEFAULT_COMPRESSION})",
+    )
+    parser.add_argument("--level", type=int, help="Compression level (default depends on the method)")
+
+
+def packaging_options(parser, args):
+    error = check_compression(args.compression, args.level)
+    if error:
+        parser.error(error)
+    return {"force": args.force, "compression": args.compression, "level": args.level}
+
+
+def main_batch(argv):
+    parser = argparse.ArgumentParser(
+        prog="package_skill.py --batch",
+        description="Validate and package many skills in parallel.",
+    )
+    parser.add_argument("paths", nargs="+", help="Skill folders, or roots containing skill folders")
+    parser.add_argument("--output", help="Output directory for the .skill files (default: current directory)")
+    parser.add_argument("--jobs", type=int, help="Worker processes (default: CPU count)")
+    add_packaging_arguments(parser)
+    args = parser.parse_args(argv)
+    options = packaging_options(parser, args)
+
+    skill_paths = find_skill_dirs(args.paths)
+    if not skill_paths:
+        print("[ERROR] No skill folders found.")
+        sys.exit(1)
+
+    print(f"Packaging {len(skill_paths)} skill(s)")
+    if args.output:
+        print(f"   Output directory: {args.output}")
+    print()
+
+    start = time.perf_counter()
+    results = package_skills(skill_paths, args.output, args.jobs, **options)
+    wall_seconds = time.perf_counter() - start
+
+    for result in results:
+        if not result["path"]:
+            print(f"--- {result['skill']} ---")
+            print(result["log"].rstrip())
+            print()
+    print_summary(results, wall_seconds)
+
+    sys.exit(0 if all(result["path"] for result in results) else 1)
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        main_batch(sys.argv[2:])
+
     if len(sys.argv) < 2:
-        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory]")
+        print("Usage: python utils/package_skill.py <path/to/skill-folder> [output-directory] [options]")
         print("\nExample:")
         print("  python utils/package_skill.py skills/public/my-skill")
         print("  python utils/package_skill.py skills/public/my-skill ./dist")
+        print("  python utils/package_skill.py skills/public/my-skill ./dist --compression lzma")
+        print("  python utils/package_skill.py --batch skills/public --output ./dist")
         sys.exit(1)
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    parser = argparse.ArgumentParser(
+        prog="package_skill.py",
+        description="Validate and package a skill folder into a .skill file.",
+    )
+    parser.add_argument("skill_path", help="Path to the skill folder")
+    parser.add_argument("output_dir", nargs="?", help="Output directory (default: current directory)")
+    add_packaging_arguments(parser)
+    args = parser.parse_args()
+    options = packaging_options(parser, args)
+
+    skill_path = args.skill_path
+    output_dir = args.output_dir
 
     print(f"Packaging skill: {skill_path}")
     if output_dir:
         print(f"   Output directory: {output_dir}")
     print()
 
-    result = package_skill(skill_path, output_dir)
+    result = package_skill(skill_path, output_dir, **options)
 
     if result:
         sys.exit(0)
@@ -1,15 +1,202 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Usage:
+    python quick_validate.py <skill_directory>
+    python quick_validate.py --batch <skill-or-root> [...] [--jobs N] [--cache PATH | --no-cache]
+
+Batch mode validates every skill under the given roots in parallel and caches
+results keyed by each SKILL.md's mtime, size and frontmatter hash, so unchanged
+skills cost a single stat call.
+
+Frontmatter made of flat keys with plain or quoted scalars and JSON-style flow
+collections is parsed without PyYAML; anything else falls back to
+yaml.safe_load, imported on first use.
 """
 
+import hashlib
+import json
+import os
 import re
 import sys
+import time
 from pathlib import Path
 
-import yaml
-
 MAX_SKILL_NAME_LENGTH = 64
+DEFAULT_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "openclaw",
+    "skill-validate.json",
+)
+# Below this many uncached skills a process pool costs more than it saves
+MIN_PARALLEL_SKILLS = 16
+
+# Returned by parse_simple_frontmatter when the text needs a real YAML parser
+COMPLEX_FRONTMATTER = object()
+SIMPLE_KEY = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?")
+# YAML 1.1 plain scalars that resolve to something other than a string
+YAML_CONSTANTS = {
+    **dict.fromkeys(("yes", "Yes", "YES", "true", "True", "TRUE", "on", "On", "ON"), True),
+    **dict.fromkeys(("no", "No", "NO", "false", "False", "FALSE", "off", "Off", "OFF"), False),
+    **dict.fromkeys(("~", "null", "Null", "NULL"), None),
+}
+DECIMAL_INT = re.compile(r"-?(?:0|[1-9][0-9]*)")
+# Plain scalars starting with these may be numbers, dates or indicators
+PLAIN_SCALAR_FIRST_CHARS = frozenset("-+.0123456789?:,[]{}#&*!|>'\"%@`<=")
+# Trailing commas are valid in YAML flow collections but not in JSON;
+# strings are matched first so commas inside them are kept, and only a comma
+# that follows a value is dropped
+FLOW_TRAILING_COMMA = re.compile(r'("[^"]*")|(?<=[\w"}\]])(\s*),(\s*[}\]])')
+
+
+def _plain_scalar(value):
+    """Resolve a plain scalar the way yaml.safe_load would, or return COMPLEX_FRONTMATTER."""
+    if value in YAML_CONSTANTS:
+        return YAML_CONSTANTS[value]
+    if DECIMAL_INT.fullmatch(value):
+        return int(value)
+    if value[0] in PLAIN_SCALAR_FIRST_CHARS or value.lower() in YAML_CONSTANTS:
+        return COMPLEX_FRONTMATTER
+    if ": " in value or " #" in value or value.endswith(":") or not value.isprintable():
+        return COMPLEX_FRONTMATTER
+    return value
+
+
+def _quoted_scalar(value):
+    quote = value[0]
+    inner = value[1:-1]
+    if len(value) < 2 or value[-1] != quote or not inner.isprintable():
+        return COMPLEX_FRONTMATTER
+    if quote == "'":
+        if "'" in inner.replace("''", ""):
+            return COMPLEX_FRONTMATTER
+        return inner.replace("''", "'")
+    if "\\" in inner or '"' in inner:
+        return COMPLEX_FRONTMATTER
+    return inner
+
+
+def _contains_float(value):
+    if isinstance(value, float):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_float(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_contains_float(item) for item in value)
+    return False
+
+
+def _flow_collection(text):
+    """
+    Parse a JSON-style flow mapping or sequence.
+
+    Escapes, tabs and floats are left to PyYAML because YAML 1.1 reads some of
+    them differently from JSON.
+    """
+    if "\\" in text or "\t" in text:
+        return COMPLEX_FRONTMATTER
+    text = FLOW_TRAILING_COMMA.sub(lambda match: match.group(1) or match.group(2) + match.group(3), text)
+    try:
+        value = json.loads(text)
+    except ValueError:
+        return COMPLEX_FRONTMATTER
+    if _contains_float(value):
+        return COMPLEX_FRONTMATTER
+    return value
+
+
+def _scalar_or_flow(value):
+    value = value.rstrip()
+    if not value:
+        return None
+    if value[0] in "{[":
+        return _flow_collection(value)
+    if value[0] in "'\"":
+        return _quoted_scalar(value)
+    return _plain_scalar(value)
+
+
+def parse_simple_frontmatter(frontmatter_text):
+    """
+    Parse the common flat subset of SKILL.md frontmatter without PyYAML.
+
+    Handles top-level "key: value" lines whose values are plain or quoted
+    single-line strings, or JSON-style flow collections (possibly continued on
+    indented lines), plus blank and comment lines.
+
+    Returns:
+        The parsed mapping (None for empty frontmatter), or COMPLEX_FRONTMATTER
+        if the text uses anything else
+    """
+    result = {}
+    lines = frontmatter_text.split("\n")
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        index += 1
+        if not line.strip() or line.startswith("#"):
+            continue
+        match = SIMPLE_KEY.fullmatch(line)
+        if not match or match.group(1).lower() in YAML_CONSTANTS:
+            return COMPLEX_FRONTMATTER
+        value = match.group(2) or ""
+        # Indented continuation lines belong to this value
+        block = []
+        while index < len(lines) and (lines[index][:1] in (" ", "\t") or not lines[index].strip()):
+            block.append(lines[index])
+            index += 1
+        if any(part.strip() for part in block):
+            if value.strip():
+                return COMPLEX_FRONTMATTER
+            value = "\n".join(block).strip()
+            if value[0] not in "{[":
+                return COMPLEX_FRONTMATTER
+        parsed = _scalar_or_flow(value)
+        if parsed is COMPLEX_FRONTMATTER:
+            return COMPLEX_FRONTMATTER
+        result[match.group(1)] = parsed
+    return result or None
+
+
+def parse_frontmatter(frontmatter_text):
+    """
+    Parse frontmatter, importing PyYAML only when the fast parser cannot.
+
+    Raises:
+        yaml.YAMLError: If the text is invalid YAML
+        ImportError: If PyYAML is needed but not installed
+    """
+    frontmatter = parse_simple_frontmatter(frontmatter_text)
+    if frontmatter is COMPLEX_FRONTMATTER:
+        import yaml
+
+        frontmatter = yaml.safe_load(frontmatter_text)
+    return frontmatter
+
+
+def read_frontmatter(skill_md):
+    """
+    Read only the frontmatter block at the top of a SKILL.md.
+
+    Stops at the closing delimiter, so the body of the file is never read.
+
+    Returns:
+        (frontmatter_text, None) on success, or (None, error_message)
+    """
+    with open(skill_md) as handle:
+        first = handle.readline()
+        if not first.startswith("---"):
+            return None, "No YAML frontmatter found"
+        if first != "---\n":
+            return None, "Invalid frontmatter format"
+        lines = []
+        for line in handle:
+            # The closing delimiter needs at least one line between it and the opening one
+            if lines and line.startswith("---"):
+                return "".join(lines)[:-1], None
+            lines.append(line)
+    return None, "Invalid frontmatter format"
 
 
 def validate_skill(skill_path):
@@ -20,22 +207,27 @@ def validate_skill(skill_path):
     if not skill_md.exists():
         return False, "SKILL.md not found"
 
-    content = skill_md.read_text()
-    if not content.startswith("---"):
-        return False, "No YAML frontmatter found"
+    frontmatter_text, error = read_frontmatter(skill_md)
+    if error:
+        return False, error
 
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
+    return validate_frontmatter(frontmatter_text)
 
-    frontmatter_text = match.group(1)
 
-    try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
-    except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+def validate_frontmatter(frontmatter_text):
+    """Validate the text between the frontmatter delimiters of a SKILL.md."""
+    frontmatter = parse_simple_frontmatter(frontmatter_text)
+    if frontmatter is COMPLEX_FRONTMATTER:
+        try:
+            import yaml
+        except ImportError:
+            return False, "Frontmatter uses YAML features that need PyYAML (pip install pyyaml)"
+        try:
+            frontmatter = yaml.safe_load(frontmatter_text)
+        except yaml.YAMLError as e:
+            return False, f"Invalid YAML in frontmatter: {e}"
+    if not isinstance(frontmatter, dict):
+        return False, "Frontmatter must be a YAML dictionary"
 
     allowed_properties = {"name", "description", "license", "allowed-tools", "metadata"}
 
@@ -91,9 +283,171 @@ def validate_skill(skill_path):
     return True, "Skill is valid!"
 
 
+def find_skill_dirs(paths):
+    """
+    Expand batch arguments into skill folders.
+
+    A path containing SKILL.md is a skill; any other directory is treated as a
+    root and contributes its immediate subdirectories that contain SKILL.md.
+    """
+    skills = []
+    seen = set()
+    for raw in paths:
+        path = Path(raw).resolve()
+        if (path / "SKILL.md").is_file():
+            candidates = [path]
+        elif path.is_dir():
+            candidates = sorted(child for child in path.iterdir() if (child / "SKILL.md").is_file())
+        else:
+            candidates = [path]  # reported as missing by validate_skill
+        for candidate in candidates:
+            if candidate not in seen:
+                seen.add(candidate)
+                skills.append(candidate)
+    return skills
+
+
+def validator_fingerprint():
+    """Hash of this script, so cached results are dropped whenever the rules change."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def load_validation_cache(cache_path, fingerprint):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as handle:
+            cache = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("validator") != fingerprint:
+        return {}
+    return cache.get("skills", {})
+
+
+def save_validation_cache(cache_path, fingerprint, entries):
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump({"validator": fingerprint, "skills": entries}, handle, separators=(",", ":"))
+    os.replace(tmp_path, cache_path)
+
+
+def validate_skills(skill_paths, jobs=None, cache_path=DEFAULT_CACHE_PATH):
+    """
+    Validate many skills, reusing cached results for unchanged SKILL.md files.
+
+    A skill whose SKILL.md has the cached mtime and size is answered from the
+    cache without being opened. Otherwise only its frontmatter is read; if the
+    frontmatter hash is cached the result is reused, and the rest are parsed
+    across a process pool.
+
+    Args:
+        skill_paths: Skill folders to validate
+        jobs: Worker processes (defaults to the CPU count)
+        cache_path: JSON cache file, or None to disable caching
+
+    Returns:
+        (results, cached) where results is a list of (skill_path, valid,
+        message) in input order and cached counts cache hits
+    """
+    fingerprint = validator_fingerprint() if cache_path else None
+    cache = load_validation_cache(cache_path, fingerprint) if cache_path else {}
+    by_hash = {entry["sha256"]: entry for entry in cache.values() if entry.get("sha256")}
+    entries = {}
+    results = [None] * len(skill_paths)
+    pending = []
+    cached = 0
+
+    for index, skill_path in enumerate(skill_paths):
+        skill_md = Path(skill_path) / "SKILL.md"
+        key = str(skill_md)
+        try:
+            file_stat = skill_md.stat()
+        except OSError:
+            results[index] = (skill_path, False, "SKILL.md not found")
+            continue
+        entry = cache.get(key)
+        if entry and entry["mtime_ns"] == file_stat.st_mtime_ns and entry["size"] == file_stat.st_size:
+            entries[key] = entry
+            results[index] = (skill_path, entry["valid"], entry["message"])
+            cached += 1
+            continue
+        entry = {"mtime_ns": file_stat.st_mtime_ns, "size": file_stat.st_size, "sha256": None}
+        entries[key] = entry
+        frontmatter_text, error = read_frontmatter(skill_md)
+        if error:
+            entry.update(valid=False, message=error)
+            results[index] = (skill_path, False, error)
+            continue
+        entry["sha256"] = hashlib.sha256(frontmatter_text.encode("utf-8")).hexdigest()
+        previous = by_hash.get(entry["sha256"])
+        if previous:
+            entry.update(valid=previous["valid"], message=previous["message"])
+            results[index] = (skill_path, previous["valid"], previous["message"])
+            cached += 1
+            continue
+        pending.append((index, key, frontmatter_text))
+
+    texts = [text for _, _, text in pending]
+    workers = min(jobs or os.cpu_count() or 1, len(pending))
+    if workers > 1 and len(pending) >= MIN_PARALLEL_SKILLS:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(validate_frontmatter, texts, chunksize=max(1, len(texts) // (workers * 4))))
+    else:
+        outcomes = [validate_frontmatter(text) for text in texts]
+    for (index, key, _), (valid, message) in zip(pending, outcomes):
+        entries[key].update(valid=valid, message=message)
+        results[index] = (skill_paths[index], valid, message)
+
+    if cache_path and (pending or cached != len(skill_paths) or len(entries) != len(cache)):
+        # Keep entries for skills outside this run so separate trees can share one cache
+        save_validation_cache(cache_path, fingerprint, {**cache, **entries})
+    return results, cached
+
+
+def main_batch(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="quick_validate.py --batch",
+        description="Validate many skills in parallel, caching results for unchanged skills.",
+    )
+    parser.add_argument("paths", nargs="+", help="Skill folders, or roots containing skill folders")
+    parser.add_argument("--jobs", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help=f"Result cache file (default: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--no-cache", action="store_true", help="Validate every skill from scratch")
+    args = parser.parse_args(argv)
+
+    skill_paths = find_skill_dirs(args.paths)
+    if not skill_paths:
+        print("[ERROR] No skill folders found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results, cached = validate_skills(skill_paths, args.jobs, None if args.no_cache else args.cache)
+    elapsed = time.perf_counter() - start
+
+    invalid = 0
+    for skill_path, valid, message in results:
+        if not valid:
+            invalid += 1
+            print(f"[ERROR] {Path(skill_path).name}: {message}")
+    print(
+        f"\nValidated {len(results)} skills: {len(results) - invalid} valid, {invalid} invalid "
+        f"({cached} cached) in {elapsed:.3f}s"
+    )
+    sys.exit(1 if invalid else 0)
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        main_batch(sys.argv[2:])
+
     if len(sys.argv) != 2:
         print("Usage: python quick_validate.py <skill_directory>")
+        print("       python quick_validate.py --batch <skill-or-root> [...] [--jobs N] [--no-cache]")
         sys.exit(1)
 
     valid, message = validate_skill(sys.argv[1])
@@ -0,0 +1,67 @@
+"""
+Checks for build_catalog.py, run with `python -m pytest skills/skill-creator/scripts`.
+"""
+
+import json
+import sys
+
+import pytest
+
+import build_catalog
+from build_catalog import build_catalog as build
+
+
+@pytest.fixture
+def root(tmp_path):
+    for name in ("alpha", "beta"):
+        skill_dir = tmp_path / "skills" / name
+        (skill_dir / "scripts").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: The {name} skill.\n---\n\n# {name}\n", encoding="utf-8"
+        )
+        (skill_dir / "scripts" / "run.py").write_text("print('hi')\n", encoding="utf-8")
+    return tmp_path / "skills"
+
+
+def run_main(monkeypatch, capsys, *argv):
+    monkeypatch.setattr(sys, "argv", ["build_catalog.py", *map(str, argv)])
+    build_catalog.main()
+    return capsys.readouterr().out
+
+
+def test_catalog_records_frontmatter_and_files(root, tmp_path):
+    catalog, stats = build([root], tmp_path / "catalog.json")
+    assert stats == {"added": 2, "updated": 0, "unchanged": 0, "removed": 0, "written": True}
+    alpha = catalog["skills"]["alpha"]
+    assert alpha["path"] == "skills/alpha"
+    assert alpha["description"] == "The alpha skill."
+    assert [entry["path"] for entry in alpha["files"]] == ["SKILL.md", "scripts/run.py"]
+    assert json.loads((tmp_path / "catalog.json").read_text(encoding="utf-8")) == catalog
+
+
+def test_rerun_only_rescans_changed_skills(root, tmp_path):
+    output = tmp_path / "catalog.json"
+    build([root], output)
+    (root / "beta" / "scripts" / "run.py").write_text("print('changed')\n", encoding="utf-8")
+    catalog, stats = build([root], output)
+    assert (stats["updated"], stats["unchanged"], stats["written"]) == (1, 1, True)
+    assert catalog["skills"]["beta"]["files"][1]["size"] == len("print('changed')\n")
+
+
+def test_unchanged_catalog_is_not_rewritten(root, tmp_path, monkeypatch, capsys):
+    output = tmp_path / "catalog.json"
+    assert "written to" in run_main(monkeypatch, capsys, root, "--output", output)
+    before = output.stat().st_mtime_ns
+    log = run_main(monkeypatch, capsys, root, "--output", output)
+    assert f"unchanged at {output}" in log
+    assert "written" not in log
+    assert output.stat().st_mtime_ns == before
+
+
+def test_removed_skill_is_dropped(root, tmp_path):
+    output = tmp_path / "catalog.json"
+    build([root], output)
+    (root / "beta" / "SKILL.md").unlink()
+    catalog, stats = build([root], output)
+    assert stats["removed"] == 1
+    assert list(catalog["skills"]) == ["alpha"]
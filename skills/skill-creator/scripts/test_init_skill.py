@@ -0,0 +1,108 @@
+"""
+Checks for init_skill.py, run with `python -m pytest skills/skill-creator/scripts`.
+"""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from init_skill import init_skill, plan_batch, write_batch
+from quick_validate import validate_skill
+
+
+def tree(root):
+    """Every file and directory under root with its bytes (None for directories) and mode."""
+    found = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            relative = os.path.relpath(path, root)
+            data = None if os.path.isdir(path) else Path(path).read_bytes()
+            found[relative] = (data, stat.S_IMODE(os.stat(path).st_mode))
+    return found
+
+
+@pytest.fixture
+def template(tmp_path):
+    root = tmp_path / "template"
+    (root / "scripts").mkdir(parents=True)
+    (root / "references").mkdir()
+    (root / "SKILL.md.tmpl").write_text(
+        "---\nname: ${skill_name}\ndescription: ${vendor} helper costing $$5.\n---\n\n# ${skill_title}\n${unknown}\n",
+        encoding="utf-8",
+    )
+    (root / "scripts" / "${skill_name}_cli.py.tmpl").write_text("print('${api}')\n", encoding="utf-8")
+    (root / "scripts" / "run.sh").write_text("echo ${not_rendered}\n", encoding="utf-8")
+    os.chmod(root / "scripts" / "run.sh", 0o755)
+    return root
+
+
+def test_template_is_rendered(tmp_path, template):
+    spec = {
+        "path": "out",
+        "template": str(template),
+        "vars": {"vendor": "Acme", "api": "search"},
+        "skills": ["acme-search"],
+    }
+    plans, errors = plan_batch(spec, tmp_path)
+    assert errors == []
+    assert write_batch(plans) == 3
+    skill = tmp_path / "out" / "acme-search"
+    assert (skill / "SKILL.md").read_text(encoding="utf-8") == (
+        "---\nname: acme-search\ndescription: Acme helper costing $5.\n---\n\n# Acme Search\n${unknown}\n"
+    )
+    assert (skill / "scripts" / "acme-search_cli.py").read_text(encoding="utf-8") == "print('search')\n"
+    assert (skill / "scripts" / "run.sh").read_text(encoding="utf-8") == "echo ${not_rendered}\n"
+    assert stat.S_IMODE((skill / "scripts" / "run.sh").stat().st_mode) == 0o755
+    assert (skill / "references").is_dir()
+    assert validate_skill(skill) == (True, "Skill is valid!")
+
+
+def test_batch_matches_single_init(tmp_path):
+    spec = {
+        "path": "batch",
+        "resources": "scripts,references,assets",
+        "skills": ["plain-one", {"name": "with-examples", "examples": True}, {"name": "bare", "resources": []}],
+    }
+    plans, errors = plan_batch(spec, tmp_path)
+    assert errors == []
+    write_batch(plans, jobs=4)
+    init_skill("plain-one", tmp_path / "single", ["scripts", "references", "assets"], False)
+    init_skill("with-examples", tmp_path / "single", ["scripts", "references", "assets"], True)
+    init_skill("bare", tmp_path / "single", [], False)
+    for name in ("plain-one", "with-examples", "bare"):
+        assert tree(tmp_path / "batch" / name) == tree(tmp_path / "single" / name), name
+
+
+def test_bad_entries_are_skipped_with_reasons(tmp_path):
+    (tmp_path / "out" / "taken").mkdir(parents=True)
+    (tmp_path / "escape").mkdir()
+    (tmp_path / "escape" / "SKILL.md").write_text("---\nname: x\n---\n", encoding="utf-8")
+    (tmp_path / "escape" / "${parent}").mkdir()
+    (tmp_path / "escape" / "${parent}" / "evil.txt").write_text("x", encoding="utf-8")
+    spec = {
+        "path": "out",
+        "skills": [
+            "fine",
+            "fine",
+            "taken",
+            "x" * 65,
+            {"name": "no-path", "path": ""},
+            {"name": "bad-resource", "resources": "scripts,bin"},
+            {"name": "examples-only", "examples": True},
+            {"name": "escapes", "template": "escape", "vars": {"parent": ".."}},
+        ],
+    }
+    plans, errors = plan_batch(spec, tmp_path)
+    assert [name for name, _, _ in plans] == ["fine"]
+    reasons = dict(errors)
+    assert reasons["fine"] == "Listed more than once"
+    assert reasons["taken"].startswith("Skill directory already exists")
+    assert "is too long" in reasons["x" * 65]
+    assert reasons["no-path"].startswith("No output path")
+    assert reasons["bad-resource"].startswith("Unknown resource type(s): bin")
+    assert reasons["examples-only"] == '"examples" requires "resources" to be set'
+    assert reasons["escapes"].startswith("Template path renders outside the skill")
+    assert not (tmp_path / "out" / "fine").exists()  # planning writes nothing
@@ -0,0 +1,117 @@
+"""
+Checks for install_skill.py, run with `python -m pytest skills/skill-creator/scripts`.
+
+Archives are built with package_skill.py from a throwaway skill, so the
+installer is exercised against the manifests it will see in practice.
+"""
+
+import json
+import os
+import stat
+import zipfile
+
+import pytest
+
+from install_skill import install_skill
+from package_skill import manifest_path_for, package_skill
+
+
+@pytest.fixture(autouse=True)
+def default_umask():
+    previous = os.umask(0o022)
+    yield
+    os.umask(previous)
+
+
+@pytest.fixture
+def skill(tmp_path):
+    skill_dir = tmp_path / "src" / "demo"
+    (skill_dir / "scripts").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: demo\ndescription: Throwaway skill for installer tests.\n---\n\n# Demo\n",
+        encoding="utf-8",
+    )
+    (skill_dir / "scripts" / "run.py").write_text("print('hi')\n", encoding="utf-8")
+    return skill_dir
+
+
+def build(skill_dir, tmp_path):
+    archive = package_skill(skill_dir, tmp_path / "dist")
+    assert archive is not None
+    return archive
+
+
+def mode_of(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_fresh_install_is_world_readable(skill, tmp_path):
+    installed = install_skill(build(skill, tmp_path), tmp_path / "skills")
+    assert installed == tmp_path / "skills" / "demo"
+    assert mode_of(installed) == 0o755
+    assert mode_of(installed / "scripts") == 0o755
+    assert (installed / "scripts" / "run.py").read_text(encoding="utf-8") == "print('hi')\n"
+
+
+def test_reinstall_keeps_directory_modes(skill, tmp_path):
+    dest = tmp_path / "skills"
+    installed = install_skill(build(skill, tmp_path), dest)
+    os.chmod(installed, 0o750)
+    os.chmod(installed / "scripts", 0o710)
+    (skill / "SKILL.md").write_text(
+        "---\nname: demo\ndescription: Changed description.\n---\n", encoding="utf-8"
+    )
+    assert install_skill(build(skill, tmp_path), dest) == installed
+    assert mode_of(installed) == 0o750
+    assert mode_of(installed / "scripts") == 0o710
+    assert "Changed description" in (installed / "SKILL.md").read_text(encoding="utf-8")
+
+
+def test_mode_change_is_reinstalled(skill, tmp_path, capsys):
+    dest = tmp_path / "skills"
+    install_skill(build(skill, tmp_path), dest)
+    os.chmod(skill / "scripts" / "run.py", 0o755)
+    capsys.readouterr()
+    install_skill(build(skill, tmp_path), dest)
+    assert "1 written" in capsys.readouterr().out
+    assert mode_of(dest / "demo" / "scripts" / "run.py") == 0o755
+
+
+def test_unchanged_install_is_up_to_date(skill, tmp_path, capsys):
+    archive = build(skill, tmp_path)
+    install_skill(archive, tmp_path / "skills")
+    capsys.readouterr()
+    install_skill(archive, tmp_path / "skills")
+    assert "is up to date" in capsys.readouterr().out
+
+
+def test_hash_mismatch_leaves_previous_install(skill, tmp_path):
+    dest = tmp_path / "skills"
+    archive = build(skill, tmp_path)
+    install_skill(archive, dest)
+    manifest_path = manifest_path_for(archive)
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["files"]["demo/scripts/run.py"]["sha256"] = "0" * 64
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    (dest / "demo" / "scripts" / "run.py").write_text("local edit\n", encoding="utf-8")
+
+    assert install_skill(archive, dest) is None
+    assert (dest / "demo" / "scripts" / "run.py").read_text(encoding="utf-8") == "local edit\n"
+    assert [path.name for path in dest.iterdir()] == ["demo"]
+
+
+@pytest.mark.parametrize("name", ["../evil.txt", "/abs/evil.txt", "demo/../../evil.txt", "evil.txt"])
+def test_unsafe_paths_are_rejected(tmp_path, name):
+    archive = tmp_path / "bad.skill"
+    with zipfile.ZipFile(archive, "w") as zipf:
+        zipf.writestr("demo/SKILL.md", "---\nname: demo\n---\n")
+        zipf.writestr(name, "x")
+    assert install_skill(archive, tmp_path / "skills", allow_unverified=True) is None
+    assert not (tmp_path / "evil.txt").exists()
+
+
+def test_missing_manifest_requires_opt_in(skill, tmp_path):
+    archive = build(skill, tmp_path)
+    manifest_path_for(archive).unlink()
+    assert install_skill(archive, tmp_path / "skills") is None
+    assert install_skill(archive, tmp_path / "skills", allow_unverified=True) is not None
@@ -0,0 +1,219 @@
+"""
+Checks for package_skill.py, run with `python -m pytest skills/skill-creator/scripts`.
+"""
+
+import os
+import shutil
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import package_skill
+from package_skill import manifest_path_for
+
+
+@pytest.fixture(autouse=True)
+def fixed_epoch(monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+
+@pytest.fixture
+def skill(tmp_path):
+    skill_dir = tmp_path / "src" / "demo"
+    (skill_dir / "scripts").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: demo\ndescription: Throwaway skill for packaging tests.\n---\n\n# Demo\n",
+        encoding="utf-8",
+    )
+    (skill_dir / "scripts" / "run.py").write_text("print('hi')\n" * 200, encoding="utf-8")
+    (skill_dir / "assets").mkdir()
+    (skill_dir / "assets" / "logo.png").write_bytes(os.urandom(4096))
+    return skill_dir
+
+
+def build(skill_dir, out_dir, **options):
+    archive = package_skill.package_skill(skill_dir, out_dir, **options)
+    assert archive is not None
+    return archive
+
+
+def test_incremental_build_reuses_unchanged_entries(skill, tmp_path, capsys):
+    out = tmp_path / "dist"
+    archive = build(skill, out)
+    (skill / "SKILL.md").write_text(
+        "---\nname: demo\ndescription: Changed.\n---\n", encoding="utf-8"
+    )
+    capsys.readouterr()
+    build(skill, out)
+    log = capsys.readouterr().out
+    assert "Reused 2 of 3 entries" in log
+    assert "Added: demo/SKILL.md" in log
+    incremental = archive.read_bytes()
+
+    build(skill, tmp_path / "full", force=True)
+    assert (tmp_path / "full" / "demo.skill").read_bytes() == incremental
+    with zipfile.ZipFile(archive) as zipf:
+        assert zipf.testzip() is None
+
+
+def test_unchanged_skill_is_skipped(skill, tmp_path, capsys):
+    out = tmp_path / "dist"
+    archive = build(skill, out)
+    before = archive.stat().st_mtime_ns
+    capsys.readouterr()
+    build(skill, out)
+    assert "Up to date" in capsys.readouterr().out
+    assert archive.stat().st_mtime_ns == before
+
+
+def test_bad_raw_copy_falls_back_to_recompressing(skill, tmp_path, monkeypatch, capsys):
+    out = tmp_path / "dist"
+    build(skill, out)
+    original = package_skill._write_raw_entry
+
+    def corrupt_copy(zipf, zinfo, info, raw):
+        original(zipf, zinfo, info, raw)
+        zinfo.CRC ^= 1  # lands in the central directory, not the local header
+
+    monkeypatch.setattr(package_skill, "_write_raw_entry", corrupt_copy)
+    (skill / "SKILL.md").write_text("---\nname: demo\ndescription: Changed.\n---\n", encoding="utf-8")
+    capsys.readouterr()
+    archive = build(skill, out)
+    log = capsys.readouterr().out
+    assert "failed verification" in log
+    assert "Reused" not in log.split("failed verification")[1]
+    with zipfile.ZipFile(archive) as zipf:
+        assert zipf.testzip() is None
+
+
+def test_manifest_from_other_options_is_not_reused(skill, tmp_path, capsys):
+    out = tmp_path / "dist"
+    build(skill, out)
+    capsys.readouterr()
+    build(skill, out, compression="bzip2")
+    log = capsys.readouterr().out
+    assert "Reused" not in log
+    assert manifest_path_for(out / "demo.skill").is_file()
+    with zipfile.ZipFile(out / "demo.skill") as zipf:
+        assert zipf.getinfo("demo/scripts/run.py").compress_type == zipfile.ZIP_BZIP2
+
+
+def make_skill(root, name, description="Batch packaging test skill."):
+    skill_dir = root / name
+    (skill_dir / "scripts").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n", encoding="utf-8")
+    (skill_dir / "scripts" / "run.py").write_text(f"print({name!r})\n", encoding="utf-8")
+    return skill_dir
+
+
+def test_batch_matches_one_by_one_and_reports_failures(tmp_path):
+    skills = [make_skill(tmp_path / "src", name) for name in ("one", "two", "three")]
+    broken = make_skill(tmp_path / "src", "broken", description="<angle brackets are rejected>")
+    paths = [skills[0], broken, *skills[1:]]
+
+    results = package_skill.package_skills(paths, tmp_path / "parallel", jobs=3)
+    assert [result["skill"] for result in results] == ["one", "broken", "two", "three"]
+    assert [bool(result["path"]) for result in results] == [True, False, True, True]
+    assert "[ERROR]" in results[1]["log"]
+    assert results[0]["files"] == 2
+
+    serial = package_skill.package_skills(paths, tmp_path / "serial", jobs=1)
+    for parallel_result, serial_result in zip(results, serial):
+        if parallel_result["path"]:
+            assert Path(parallel_result["path"]).read_bytes() == Path(serial_result["path"]).read_bytes()
+
+
+def test_archive_bytes_depend_only_on_content(skill, tmp_path):
+    copy = tmp_path / "copy" / "demo"
+    copy.mkdir(parents=True)
+    for relative in reversed(["SKILL.md", "assets/logo.png", "scripts/run.py"]):  # different creation order
+        (copy / relative).parent.mkdir(exist_ok=True)
+        shutil.copyfile(skill / relative, copy / relative)
+        os.chmod(copy / relative, 0o600)
+        os.utime(copy / relative, (1_000_000_000, 1_000_000_000))
+    first = build(skill, tmp_path / "a").read_bytes()
+    assert build(copy, tmp_path / "b").read_bytes() == first
+
+    with zipfile.ZipFile(tmp_path / "a" / "demo.skill") as zipf:
+        infos = zipf.infolist()
+    assert [info.filename for info in infos] == sorted(info.filename for info in infos)
+    assert {info.date_time for info in infos} == {(2023, 11, 14, 22, 13, 20)}
+    assert {info.external_attr >> 16 for info in infos} == {package_skill.FILE_MODE}
+
+
+def test_executable_bit_and_default_timestamp(skill, tmp_path, monkeypatch):
+    monkeypatch.delenv("SOURCE_DATE_EPOCH")
+    os.chmod(skill / "scripts" / "run.py", 0o755)
+    with zipfile.ZipFile(build(skill, tmp_path / "dist")) as zipf:
+        info = zipf.getinfo("demo/scripts/run.py")
+        assert info.external_attr >> 16 == package_skill.EXECUTABLE_MODE
+        assert info.date_time == package_skill.ZIP_EPOCH
+
+
+@pytest.mark.parametrize("compression", ["deflate", "bzip2", "lzma"])
+def test_compressed_formats_are_stored(skill, tmp_path, compression):
+    (skill / "assets" / "photo.JPG").write_bytes(os.urandom(2048))
+    archive = build(skill, tmp_path / "dist", compression=compression)
+    with zipfile.ZipFile(archive) as zipf:
+        types = {info.filename: info.compress_type for info in zipf.infolist()}
+        assert zipf.testzip() is None
+    assert types["demo/assets/logo.png"] == types["demo/assets/photo.JPG"] == zipfile.ZIP_STORED
+    assert types["demo/scripts/run.py"] == package_skill.COMPRESSION_METHODS[compression]
+
+
+def test_level_changes_output_and_is_validated(skill, tmp_path):
+    fast = build(skill, tmp_path / "fast", level=1).read_bytes()
+    default = build(skill, tmp_path / "default").read_bytes()
+    assert build(skill, tmp_path / "six", level=6).read_bytes() == default
+    assert fast != default
+    assert package_skill.check_compression("deflate", 10) == "--level for deflate must be between 0 and 9"
+    assert package_skill.check_compression("lzma", 1) == "--level is not supported for lzma"
+    assert package_skill.check_compression("brotli", None).startswith("Unsupported compression 'brotli'")
+    assert package_skill.check_compression("bzip2", None) is None
+
+
+@pytest.mark.parametrize(
+    "lines, path, is_dir, expected",
+    [
+        (["*.log"], "debug.log", False, True),
+        (["*.log"], "deep/nested/debug.log", False, True),
+        (["/build"], "build", True, True),
+        (["/build"], "src/build", True, False),
+        (["docs/*.md"], "docs/a.md", False, True),
+        (["docs/*.md"], "docs/sub/a.md", False, False),
+        (["docs/**/*.md"], "docs/sub/a.md", False, True),
+        (["**/fixtures"], "a/b/fixtures", True, True),
+        (["cache/"], "cache", False, False),
+        (["cache/"], "cache", True, True),
+        (["file?.txt"], "file1.txt", False, True),
+        (["file?.txt"], "file10.txt", False, False),
+        (["data[0-9].csv"], "data7.csv", False, True),
+        (["data[!0-9].csv"], "data7.csv", False, False),
+        (["*.txt", "!keep.txt"], "keep.txt", False, False),
+        (["!keep.txt", "*.txt"], "keep.txt", False, True),
+        (["\\#notes"], "#notes", False, True),
+        (["# comment", ""], "# comment", False, False),
+        (["trailing   "], "trailing", False, True),
+    ],
+)
+def test_ignore_pattern_matching(lines, path, is_dir, expected):
+    rules = package_skill.parse_ignore_patterns(lines)
+    assert package_skill.is_ignored(rules, path, is_dir) is expected
+
+
+def test_skillignore_prunes_the_walk(skill):
+    (skill / ".skillignore").write_text("assets/\n*.tmp\n!scripts/__pycache__/\n", encoding="utf-8")
+    (skill / "draft.tmp").write_text("x", encoding="utf-8")
+    (skill / "scripts" / "__pycache__").mkdir()
+    (skill / "scripts" / "__pycache__" / "run.cpython-311.pyc").write_bytes(b"\0")
+    (skill / "env" / "lib").mkdir(parents=True)
+    (skill / "env" / "pyvenv.cfg").write_text("home = /usr\n", encoding="utf-8")
+    (skill / "env" / "lib" / "site.py").write_text("", encoding="utf-8")
+    (skill / "node_modules" / "pkg").mkdir(parents=True)
+    (skill / "node_modules" / "pkg" / "index.js").write_text("", encoding="utf-8")
+
+    files, ignored = package_skill.walk_skill_files(skill, package_skill.load_ignore_rules(skill))
+    # The re-included cache directory is walked, but *.pyc still applies to its files.
+    assert sorted(relative for _, relative in files) == [".skillignore", "SKILL.md", "scripts/run.py"]
+    assert ignored == 5  # assets/, draft.tmp, env/, node_modules/, the .pyc
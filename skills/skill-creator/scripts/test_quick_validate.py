@@ -0,0 +1,155 @@
+"""
+Checks for quick_validate.py, run with `python -m pytest skills/skill-creator/scripts`.
+"""
+
+import json
+import os
+
+import pytest
+
+import quick_validate
+from quick_validate import find_skill_dirs, validate_skills
+
+
+def write_skill(root, name, description="A skill used by the validator tests."):
+    skill_dir = root / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n", encoding="utf-8")
+    return skill_dir
+
+
+@pytest.fixture
+def skills(tmp_path):
+    root = tmp_path / "skills"
+    write_skill(root, "good-one")
+    write_skill(root, "good-two")
+    write_skill(root, "Bad_Name")
+    return find_skill_dirs([root])
+
+
+def run(skill_paths, cache_path, **kwargs):
+    results, cached = validate_skills(skill_paths, cache_path=str(cache_path), **kwargs)
+    return {os.path.basename(path): (valid, message) for path, valid, message in results}, cached
+
+
+def test_unchanged_skills_are_answered_from_the_cache(skills, tmp_path, monkeypatch):
+    cache_path = tmp_path / "cache.json"
+    first, cached = run(skills, cache_path)
+    assert cached == 0
+    assert first["good-one"] == (True, "Skill is valid!")
+    assert "hyphen-case" in first["Bad_Name"][1]
+
+    def unexpected_read(skill_md):
+        raise AssertionError(f"{skill_md} was opened")
+
+    monkeypatch.setattr(quick_validate, "read_frontmatter", unexpected_read)
+    assert run(skills, cache_path) == (first, 3)
+
+
+def test_touched_file_reuses_result_by_frontmatter_hash(skills, tmp_path, monkeypatch):
+    cache_path = tmp_path / "cache.json"
+    run(skills, cache_path)
+    skill_md = skills[0] / "SKILL.md"
+    skill_md.write_text(skill_md.read_text(encoding="utf-8") + "\nMore body text.\n", encoding="utf-8")
+    monkeypatch.setattr(quick_validate, "validate_frontmatter", lambda text: pytest.fail("revalidated"))
+    _, cached = run(skills, cache_path)
+    assert cached == 3
+
+
+def test_changed_frontmatter_is_revalidated(skills, tmp_path):
+    cache_path = tmp_path / "cache.json"
+    run(skills, cache_path)
+    write_skill(skills[0].parent, "good-one", description="Now has <angle> brackets.")
+    results, cached = run(skills, cache_path)
+    assert cached == 2
+    assert results["good-one"] == (False, "Description cannot contain angle brackets (< or >)")
+
+
+def test_cache_from_another_validator_is_ignored(skills, tmp_path):
+    cache_path = tmp_path / "cache.json"
+    run(skills, cache_path)
+    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    cache["validator"] = "0" * 64
+    cache_path.write_text(json.dumps(cache), encoding="utf-8")
+    assert run(skills, cache_path)[1] == 0
+
+
+def test_parallel_results_match_serial(tmp_path):
+    root = tmp_path / "many"
+    for i in range(quick_validate.MIN_PARALLEL_SKILLS + 4):
+        write_skill(root, f"skill-{i}" if i % 3 else f"Skill{i}")
+    skill_paths = find_skill_dirs([root])
+    parallel, _ = run(skill_paths, tmp_path / "a.json", jobs=4)
+    serial, _ = run(skill_paths, tmp_path / "b.json", jobs=1)
+    assert parallel == serial
+    assert sum(valid for valid, _ in parallel.values()) == 13
+
+
+def test_missing_skill_md_is_reported(tmp_path):
+    results, _ = validate_skills([tmp_path / "absent"], cache_path=None)
+    assert results == [(tmp_path / "absent", False, "SKILL.md not found")]
+
+
+FRONTMATTER_CASES = [
+    "name: demo\ndescription: Plain text, with commas and (parens).",
+    "name: demo\ndescription: 'It''s quoted'\nlicense: \"MIT\"",
+    "name: demo\n\n# a comment\ndescription: x",
+    'allowed-tools: ["Read", "Write",]',
+    'metadata: {"version": 2, "tags": ["a", "b"]}',
+    'metadata:\n  {"version": 2,\n   "owner": "team"}',
+    "allowed-tools: [Read, Write]",
+    "name: yes",
+    "name: 0123",
+    "name: 12",
+    "name: -12",
+    "name: 1.5",
+    "name: 2026-01-01",
+    "name: ~",
+    "name:",
+    "name: a: b",
+    "name: a #comment",
+    "name: value:",
+    "description: >\n  folded text",
+    "description: |\n  literal",
+    "metadata:\n  version: 2",
+    "- not a mapping",
+    "on: true",
+    "name: \"tab\\tescape\"",
+    "name: 'unterminated",
+    "name: *alias",
+    "name: !tag value",
+    "metadata: {\"ratio\": 0.5}",
+    "metadata: {unquoted: key}",
+    "name: Ünïcode text",
+    "",
+]
+
+
+@pytest.mark.parametrize("text", FRONTMATTER_CASES)
+def test_fast_parser_agrees_with_yaml(text):
+    yaml = pytest.importorskip("yaml")
+    fast = quick_validate.parse_simple_frontmatter(text)
+    if fast is quick_validate.COMPLEX_FRONTMATTER:
+        return
+    assert fast == yaml.safe_load(text)
+    assert type(fast) is type(yaml.safe_load(text))
+
+
+def test_repository_skills_take_the_fast_path():
+    yaml = pytest.importorskip("yaml")
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+    checked = 0
+    for skill_dir in find_skill_dirs([root]):
+        text, error = quick_validate.read_frontmatter(skill_dir / "SKILL.md")
+        if error:
+            continue
+        fast = quick_validate.parse_simple_frontmatter(text)
+        if fast is not quick_validate.COMPLEX_FRONTMATTER:
+            assert fast == yaml.safe_load(text), skill_dir.name
+            checked += 1
+    assert checked
+
+
+def test_common_frontmatter_does_not_need_yaml():
+    for text in FRONTMATTER_CASES[:6]:
+        assert quick_validate.parse_simple_frontmatter(text) is not quick_validate.COMPLEX_FRONTMATTER, text